@@ -0,0 +1,232 @@
+"""
+벤치마크 실행 - 파싱, 인덱스 생성, 매칭, 내보내기 시간을 단계별로 측정
+
+사용 예:
+    python -m benchmarks.run                               # 기본 규모, 결과 출력
+    python -m benchmarks.run --output result.json          # 결과 JSON 저장
+    python -m benchmarks.run --compare                     # 저장된 기준값과 비교 (회귀 시 종료 코드 1)
+    python -m benchmarks.run --save-baseline               # 기준값 갱신
+    python -m benchmarks.run --sizes 1000000 --workloads all_24
+"""
+from typing import Dict, List, Optional
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from benchmarks.workloads import WORKLOADS, DEFAULT_REFERENCE_COUNT, generate
+from core.exporter import export_excel, export_delimited
+from core.matcher import Matcher
+from core.parser import IPParser
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# 기본 Source 개수 (--full이면 100만 개 추가)
+DEFAULT_SIZES = [1000, 10000, 100000]
+FULL_SIZES = DEFAULT_SIZES + [1000000]
+
+# 회귀 판정: 기준 대비 THRESHOLD 이상 느려지고, 차이가 MIN_DELTA_SECONDS 이상일 때 (짧은 단계의 측정 잡음 무시)
+THRESHOLD = 0.25
+MIN_DELTA_SECONDS = 0.05
+
+# 내보내기는 느려서 이 개수까지만 측정
+EXPORT_MAX_ROWS = 100000
+
+
+def _timed(func, repeat: int):
+    """func를 repeat번 실행하여 (최소 시간, 마지막 결과) 반환"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _has_openpyxl() -> bool:
+    try:
+        import openpyxl  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def run_case(workload: str, source_count: int, reference_count: int, engine: str,
+             repeat: int, seed: int = 1) -> Dict:
+    """
+    워크로드 하나를 단계별로 측정
+
+    Returns:
+        {'workload', 'sources', 'references', 'engine', 'index_stats': 정규화 통계 또는 None,
+         'timings': {단계: 초 또는 None}}
+    """
+    source_text, reference_text = generate(workload, source_count, reference_count, seed)
+    # 큰 규모는 한 번만 측정
+    repeat = repeat if source_count < 100000 else 1
+
+    timings = {}
+    timings['parse_source'], _ = _timed(lambda: IPParser.parse_text_input(source_text), repeat)
+    timings['parse_source_compact'], source_list = _timed(
+        lambda: IPParser.parse_text_compact(source_text), repeat)
+    timings['parse_reference'], reference_list = _timed(
+        lambda: IPParser.parse_text_compact(reference_text), repeat)
+
+    index = None
+    if Matcher.ENGINES[engine] is not None:
+        timings['build_index'], index = _timed(lambda: Matcher.build_index(reference_list, engine), repeat)
+    else:
+        timings['build_index'] = None
+
+    # 정렬 구간 인덱스 정규화 통계 (축소율, DualStackIndex/VectorizedIndex는 내부 IntervalIndex 기준)
+    interval = getattr(index, 'v4', index)
+    interval = getattr(interval, 'interval', interval)
+    index_stats = getattr(interval, 'stats', None)
+
+    timings['match'], results = _timed(
+        lambda: Matcher.match(source_list, reference_list, engine=engine, index=index), repeat)
+
+    timings['export_xlsx'] = None
+    if _has_openpyxl() and len(results) <= EXPORT_MAX_ROWS:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'result.xlsx')
+            timings['export_xlsx'], _ = _timed(lambda: export_excel(results, path), 1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'result.csv')
+        timings['export_csv'], _ = _timed(lambda: export_delimited(results, path), 1)
+
+    return {
+        'workload': workload,
+        'sources': len(source_list),
+        'references': len(reference_list),
+        'engine': engine,
+        'index_stats': index_stats,
+        'timings': {step: round(seconds, 4) if seconds is not None else None
+                    for step, seconds in timings.items()},
+    }
+
+
+def run_suite(workloads: List[str], sizes: List[int], engines: List[str],
+              reference_count: int = DEFAULT_REFERENCE_COUNT, repeat: int = 3,
+              log=None) -> Dict:
+    """
+    워크로드 × Source 개수 × 엔진 조합 전체 측정
+
+    Returns:
+        {'meta': 실행 환경, 'results': [run_case 결과, ...]}
+    """
+    results = []
+    for workload in workloads:
+        for size in sizes:
+            for engine in engines:
+                case = run_case(workload, size, reference_count, engine, repeat)
+                results.append(case)
+                if log:
+                    log(format_case(case))
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'reference_count': reference_count,
+            'repeat': repeat,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def format_case(case: Dict) -> str:
+    """측정 결과 한 줄 요약"""
+    steps = ', '.join(
+        f"{step}={seconds:.3f}s" for step, seconds in case['timings'].items() if seconds is not None)
+    return f"{case['workload']:<12} src={case['sources']:>8,} ref={case['references']:>6,} {case['engine']:<7} {steps}"
+
+
+def _case_key(case: Dict):
+    return (case['workload'], case['sources'], case['references'], case['engine'])
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = THRESHOLD,
+            min_delta: float = MIN_DELTA_SECONDS) -> List[str]:
+    """
+    기준값과 비교하여 회귀 목록 반환
+
+    Args:
+        current: 이번 측정 결과
+        baseline: 저장된 기준 결과
+        threshold: 허용 비율 (0.25 = 25% 느려짐까지 허용)
+        min_delta: 허용 절대 차이 (초)
+
+    Returns:
+        회귀 설명 문자열 리스트 (없으면 빈 리스트)
+    """
+    baseline_cases = {_case_key(case): case for case in baseline.get('results', [])}
+    regressions = []
+    for case in current['results']:
+        base_case = baseline_cases.get(_case_key(case))
+        if base_case is None:
+            continue
+        for step, seconds in case['timings'].items():
+            base_seconds = base_case['timings'].get(step)
+            if seconds is None or base_seconds is None:
+                continue
+            if seconds > base_seconds * (1 + threshold) and seconds - base_seconds >= min_delta:
+                regressions.append(
+                    f"{case['workload']} src={case['sources']:,} {case['engine']} {step}: "
+                    f"{base_seconds:.3f}s → {seconds:.3f}s (+{(seconds / base_seconds - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+                                     description='파싱/인덱스 생성/매칭/내보내기 단계별 벤치마크')
+    parser.add_argument('--workloads', nargs='+', choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument('--sizes', nargs='+', type=int, help='Source 개수 (기본: 1천/1만/10만)')
+    parser.add_argument('--full', action='store_true', help='Source 100만 개 규모 포함')
+    parser.add_argument('--references', type=int, default=DEFAULT_REFERENCE_COUNT, help='Reference 개수')
+    parser.add_argument('--engines', nargs='+', choices=list(Matcher.ENGINES), default=[Matcher.DEFAULT_ENGINE])
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', nargs='?', const=BASELINE_PATH, metavar='BASELINE',
+                        help='기준 결과와 비교 (경로 생략 시 benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='결과를 benchmarks/baseline.json에 저장')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='회귀 허용 비율')
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    log = lambda line: print(line, file=sys.stderr)  # noqa: E731
+    report = run_suite(args.workloads, sizes, args.engines, args.references, args.repeat, log)
+
+    output_paths = [path for path in (args.output, BASELINE_PATH if args.save_baseline else None) if path]
+    for path in output_paths:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+    if not output_paths:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"회귀: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("회귀 없음", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""벤치마크용 합성 Source/Reference 생성 (시드 고정으로 재현 가능)"""
+from typing import Callable, Dict, List, Tuple
+import ipaddress
+import random
+
+
+# Reference 개수 기본값 (README 성능 표 기준 규모)
+DEFAULT_REFERENCE_COUNT = 30000
+
+
+def _ip(value: int) -> str:
+    return str(ipaddress.IPv4Address(value & 0xFFFFFFFF))
+
+
+def _network(rng: random.Random, min_prefix: int, max_prefix: int) -> str:
+    prefix_len = rng.randint(min_prefix, max_prefix)
+    network_int = rng.getrandbits(32) & ((0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF)
+    return f"{_ip(network_int)}/{prefix_len}"
+
+
+def _range(rng: random.Random, max_size: int) -> str:
+    start_int = rng.getrandbits(32)
+    end_int = min(start_int + rng.randint(0, max_size), 0xFFFFFFFF)
+    return f"{_ip(start_int)}-{_ip(end_int)}"
+
+
+def mixed_references(rng: random.Random, count: int) -> List[str]:
+    """Single/CIDR/Range가 섞인 Reference"""
+    items = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            items.append(_ip(rng.getrandbits(32)))
+        elif kind < 0.8:
+            items.append(_network(rng, 8, 32))
+        else:
+            items.append(_range(rng, 4096))
+    return items
+
+
+def all_24_references(rng: random.Random, count: int) -> List[str]:
+    """모두 /24인 Reference (방화벽/라우팅 테이블 형태)"""
+    return [_network(rng, 24, 24) for _ in range(count)]
+
+
+def range_heavy_references(rng: random.Random, count: int) -> List[str]:
+    """Range 위주 Reference (80% Range)"""
+    items = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            items.append(_range(rng, 1 << 16))
+        else:
+            items.append(_network(rng, 16, 28))
+    return items
+
+
+def nested_references(rng: random.Random, count: int) -> List[str]:
+    """
+    깊게 중첩된 Range Reference (16개 중심마다 바깥으로 넓어지는 Range)
+    주소마다 덮는 Reference가 수천 개라 기본 구간별 멤버 집합이 커지는 경우
+    """
+    centers = [rng.getrandbits(32) for _ in range(16)]
+    items = []
+    for position in range(count):
+        center = centers[position % len(centers)]
+        radius = rng.randint(1, 1 << 26)
+        items.append(f"{_ip(max(center - radius, 0))}-{_ip(min(center + radius, 0xFFFFFFFF))}")
+    return items
+
+
+def single_sources(rng: random.Random, count: int) -> List[str]:
+    """Single IP만 있는 Source (로그 IP 형태)"""
+    return [_ip(rng.getrandbits(32)) for _ in range(count)]
+
+
+def mixed_sources(rng: random.Random, count: int) -> List[str]:
+    """Single IP 90%, CIDR/Range 10% Source"""
+    items = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.9:
+            items.append(_ip(rng.getrandbits(32)))
+        elif kind < 0.95:
+            items.append(_network(rng, 20, 32))
+        else:
+            items.append(_range(rng, 256))
+    return items
+
+
+# 워크로드 {이름: (Source 생성 함수, Reference 생성 함수)}
+WORKLOADS: Dict[str, Tuple[Callable, Callable]] = {
+    'mixed': (mixed_sources, mixed_references),
+    'all_24': (single_sources, all_24_references),
+    'range_heavy': (mixed_sources, range_heavy_references),
+    'nested': (mixed_sources, nested_references),
+}
+
+
+def generate(workload: str, source_count: int, reference_count: int = DEFAULT_REFERENCE_COUNT,
+             seed: int = 1) -> Tuple[str, str]:
+    """
+    워크로드 텍스트 생성
+
+    Args:
+        workload: 워크로드 이름 (WORKLOADS 참고)
+        source_count: Source 개수
+        reference_count: Reference 개수
+        seed: 난수 시드 (같은 인자면 항상 같은 텍스트)
+
+    Returns:
+        (source_text, reference_text) 개행 구분 텍스트
+    """
+    make_sources, make_references = WORKLOADS[workload]
+    rng = random.Random(f"{workload}:{seed}")
+    reference_text = '\n'.join(make_references(rng, reference_count))
+    source_text = '\n'.join(make_sources(rng, source_count))
+    return source_text, reference_text
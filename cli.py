@@ -0,0 +1,359 @@
+"""
+IP Network Matcher 명령줄 진입점 (GUI 없이 실행)
+
+사용 예:
+    python main.py source.txt -r reference.txt > result.tsv
+    cat source.txt | python main.py - -r reference.txt -f json
+    python main.py -r reference.txt --serve /tmp/ip-matcher.sock
+
+UI 모듈과 customtkinter를 import하지 않으므로 서버/cron 환경에서도 실행된다.
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, List, Optional, TextIO
+
+from core.matcher import Matcher
+from core.match_result import iter_rows
+from core.memo import MatchMemo
+from core.parser import IPParser
+
+
+# 출력 형식
+OUTPUT_FORMATS = ('tsv', 'csv', 'json')
+
+# --count 모드 (출력할 Source 수)
+COUNT_MODES = ('matched', 'unmatched')
+
+# 결과 헤더 (GUI 엑셀 내보내기/스트리밍 매칭과 동일)
+HEADER = ['대상 IP', '매칭된 IP']
+
+# 한 번에 매칭할 Source 개수 (메모리에는 배치 하나의 결과만 유지)
+BATCH_SIZE = 10000
+
+# 병렬 매칭 시 배치 크기 (배치마다 프로세스 풀을 만들므로 크게 잡음)
+PARALLEL_BATCH_SIZE = 1000000
+
+# import + 시작 시간 예산 (초) - --check-startup으로 확인
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog='ip-matcher',
+        description='Source IP를 Reference IP 대역과 매칭하여 결과를 표준 출력으로 내보냅니다.')
+    parser.add_argument('source', nargs='?',
+                        help="Source IP 파일 경로 ('-'이면 표준 입력)")
+    parser.add_argument('-r', '--reference',
+                        help="Reference IP 파일 경로 ('-'이면 표준 입력, .json이면 GUI에서 저장한 reference_data.json)")
+    parser.add_argument('-i', '--index',
+                        help="컴파일된 Reference 인덱스 파일 (reference_index.bin, Reference 파싱 생략)")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='tsv',
+                        help='출력 형식 (기본: tsv)')
+    parser.add_argument('-e', '--engine', choices=list(Matcher.ENGINES), default=Matcher.DEFAULT_ENGINE,
+                        help=f'매칭 엔진 (기본: {Matcher.DEFAULT_ENGINE})')
+    parser.add_argument('--longest-prefix', action='store_true',
+                        help='가장 구체적인 Reference만 출력')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='병렬 매칭/Reference 파싱 프로세스 수 (기본: 1)')
+    parser.add_argument('--no-header', action='store_true',
+                        help='TSV/CSV 헤더 생략')
+    parser.add_argument('--count', choices=COUNT_MODES,
+                        help='행별 결과 대신 매칭된(matched)/매칭되지 않은(unmatched) Source 수만 출력')
+    parser.add_argument('--serve', metavar='ADDRESS',
+                        help="Reference를 메모리에 두고 로컬 매칭 서비스 실행 "
+                             "(포트 또는 127.0.0.1:포트이면 localhost HTTP, 그 외는 Unix 소켓 경로)")
+    parser.add_argument('--reload-interval', type=float, default=1.0, metavar='SECONDS',
+                        help='--serve 중 Reference/인덱스 파일 변경 확인 주기 (기본: 1초, 0이면 감시 안 함)')
+    parser.add_argument('--stats', action='store_true',
+                        help='Reference 정규화 축소율과 중복 Source 재사용(메모 적중/미스) 횟수를 표준 오류로 출력')
+    parser.add_argument('--check-startup', action='store_true',
+                        help=f'import + 시작 시간을 측정하여 예산({STARTUP_BUDGET_SECONDS}초) 초과 시 실패')
+    return parser
+
+
+def _open_input(path: str):
+    """파일 경로 또는 '-'(표준 입력)를 텍스트 스트림 컨텍스트로 열기 (표준 입력은 닫지 않음)"""
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, 'r', encoding='utf-8')
+
+
+class _ResultWriter:
+    """형식별 결과 출력 (배치 단위로 바로 기록)"""
+
+    def __init__(self, output: TextIO, output_format: str, header: bool = True):
+        self.output = output
+        self.output_format = output_format
+        self._first = True
+
+        if output_format == 'json':
+            output.write('[')
+            self._writer = None
+        else:
+            delimiter = '\t' if output_format == 'tsv' else ','
+            self._writer = csv.writer(output, delimiter=delimiter, lineterminator='\n')
+            if header:
+                self._writer.writerow(HEADER)
+
+    def write(self, results: List[dict]):
+        """매칭 결과 기록"""
+        if self._writer is not None:
+            self._writer.writerows(iter_rows(results))
+            return
+
+        for result in results:
+            self.output.write('\n  ' if self._first else ',\n  ')
+            self.output.write(json.dumps(result, ensure_ascii=False))
+            self._first = False
+
+    def close(self):
+        """출력 마무리 (JSON 배열 닫기)"""
+        if self._writer is None:
+            self.output.write('\n]\n' if not self._first else ']\n')
+        self.output.flush()
+
+
+def check_startup(budget: float = STARTUP_BUDGET_SECONDS) -> int:
+    """
+    새 인터프리터에서 CLI 모듈 import + 인자 파싱까지의 시간을 측정
+
+    Args:
+        budget: 허용 시간 (초)
+
+    Returns:
+        종료 코드 (예산 이내 0, 초과 1)
+    """
+    # 인터프리터 시작 + import + 인자 파서 생성까지 측정하고, UI 모듈이 로드되지 않았는지 확인
+    command = [sys.executable, '-c',
+               'import sys, cli; cli.build_arg_parser(); '
+               'print(any(name == "customtkinter" or name.split(".")[0] == "ui" for name in sys.modules))']
+    started = time.perf_counter()
+    completed = subprocess.run(command, cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    elapsed = time.perf_counter() - started
+    ui_loaded = completed.stdout.strip() == 'True'
+
+    print(f"시작 시간: {elapsed * 1000:.0f}ms (예산 {budget * 1000:.0f}ms)", file=sys.stderr)
+    if ui_loaded:
+        print("UI 모듈이 import되었습니다.", file=sys.stderr)
+        return 1
+    return 0 if elapsed <= budget else 1
+
+
+def _print_stats(index):
+    """
+    정렬 구간 인덱스의 정규화 통계를 표준 오류로 출력 (통계가 없는 엔진/인덱스 파일은 생략)
+    dir24 엔진은 테이블 메모리와 생성/조회 손익분기 보고도 출력
+    """
+    from core.dir24_index import Dir24Index, format_report
+    from core.interval_index import format_stats
+    index = getattr(index, 'v4', index)
+    if isinstance(index, Dir24Index):
+        print(format_report(index.report()), file=sys.stderr)
+    index = getattr(index, 'interval', index)
+    stats = getattr(index, 'stats', None)
+    if stats:
+        print(format_stats(stats), file=sys.stderr)
+    else:
+        print("정규화 통계는 Reference 파일로 만든 bisect/numpy/dir24 엔진에서만 제공됩니다.", file=sys.stderr)
+
+
+def _run_count(args: argparse.Namespace, reference_list, index, memo: MatchMemo, output: TextIO) -> int:
+    """--count 모드: 배치마다 매칭 여부만 세어 선택한 Source 수를 한 줄로 출력"""
+    count = 0
+    with _open_input(args.source) as source_file:
+        for batch in IPParser.iter_compact_batches(source_file, BATCH_SIZE):
+            if not batch.all_single() and not reference_list:
+                print("Network/Range 또는 IPv6 Source는 Reference 파일(-r)이 필요합니다.", file=sys.stderr)
+                return 1
+            count += Matcher.count_matches(batch, reference_list, index, memo)[args.count]
+    output.write(f"{count}\n")
+    return 0
+
+
+def _load_reference(args: argparse.Namespace, engine: str, warn: Optional[Callable[[str], None]] = None):
+    """
+    Reference 파싱 또는 컴파일된 인덱스 로드 (Reference 파일 변경 시 다시 불러올 때도 사용)
+
+    Reference 파일과 인덱스 파일을 함께 지정하면 인덱스 파일의 내용 해시가 Reference와 같을 때만
+    인덱스 파일을 사용하고, 다르면 경고 후 Reference로 인덱스를 생성한다.
+
+    Args:
+        warn: 경고 메시지 처리 함수 (없으면 표준 오류로 출력)
+
+    Returns:
+        (reference_list, index) - 인덱스 파일만 지정하면 reference_list는 빈 리스트
+
+    Raises:
+        ValueError: 인덱스 파일만으로 사용할 수 없는 엔진
+    """
+    reference_text = None
+    if args.reference == '-':
+        reference_text = sys.stdin.read()
+    elif args.reference:
+        from core.hot_reload import read_reference_text
+        reference_text = read_reference_text(args.reference)
+    reference_list = []
+    if reference_text is not None:
+        reference_list = IPParser.parse_text_compact(reference_text, workers=args.workers)
+
+    index = None
+    compiled = None
+    if args.index:
+        from core.index_store import content_hash, load_index
+        compiled = load_index(args.index)
+        # Reference 파일도 지정했으면 내용 해시가 같은 인덱스 파일만 사용 (GUI 불러오기와 동일)
+        if reference_text is not None and compiled.content_hash != content_hash(reference_text):
+            message = f"인덱스 파일({args.index})이 Reference 내용과 다릅니다. 인덱스 파일을 무시하고 Reference로 인덱스를 생성합니다."
+            if warn:
+                warn(message)
+            else:
+                print(message, file=sys.stderr)
+            compiled = None
+    if compiled is not None:
+        if engine == 'bisect':
+            index = compiled.index
+        elif engine == 'hash':
+            index = compiled.build_prefix_index()
+        elif engine == 'dir24':
+            from core.dir24_index import Dir24Index
+            index = Dir24Index(compiled.index)
+    if index is None and reference_list and Matcher.ENGINES.get(engine) is not None:
+        index = Matcher.build_index(reference_list, engine)
+    if index is None and not reference_list:
+        raise ValueError("인덱스 파일만으로는 bisect/hash/dir24 엔진만 사용할 수 있습니다. Reference 파일(-r)을 지정하세요.")
+    return reference_list, index
+
+
+def run(args: argparse.Namespace, output: TextIO) -> int:
+    """
+    인자대로 매칭을 수행하고 결과를 출력
+
+    Returns:
+        종료 코드
+    """
+    if args.source == '-' and args.reference == '-':
+        print("Source와 Reference를 모두 표준 입력으로 받을 수 없습니다.", file=sys.stderr)
+        return 2
+
+    engine = 'trie' if args.longest_prefix else args.engine
+    reference_list, index = _load_reference(args, engine)
+    if args.stats:
+        _print_stats(index)
+
+    batch_size = PARALLEL_BATCH_SIZE if args.workers > 1 else BATCH_SIZE
+    # 배치 간에도 같은 Source는 한 번만 매칭 (Reference가 같으므로 메모 공유)
+    memo = MatchMemo()
+    if args.count:
+        return _run_count(args, reference_list, index, memo, output)
+    writer = _ResultWriter(output, args.format, header=not args.no_header)
+    with _open_input(args.source) as source_file:
+        for batch in IPParser.iter_compact_batches(source_file, batch_size):
+            if not batch.all_single() and not reference_list:
+                print("Network/Range 또는 IPv6 Source는 Reference 파일(-r)이 필요합니다.", file=sys.stderr)
+                return 1
+            writer.write(Matcher.match(batch, reference_list, engine=engine, index=index,
+                                       longest_prefix_only=args.longest_prefix,
+                                       workers=args.workers, memo=memo))
+    writer.close()
+    if args.stats:
+        print(memo.summary(), file=sys.stderr)
+    return 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """
+    --serve 모드: Reference 인덱스를 한 번 만들어 두고 로컬 매칭 서비스 실행 (Ctrl+C로 종료)
+    Reference/인덱스 파일이 바뀌면 백그라운드에서 다시 만들어 교체 (--reload-interval 0이면 끔)
+
+    Returns:
+        종료 코드
+    """
+    import asyncio
+    from core.hot_reload import ReferenceReloader
+    from core.service import MatchService, serve
+
+    started = time.perf_counter()
+    reference_list, index = _load_reference(args, args.engine)
+    build_seconds = time.perf_counter() - started
+    if args.stats:
+        _print_stats(index)
+
+    def reloaded(snapshot, error: Optional[str]):
+        if snapshot is None:
+            print(f"Reference 다시 불러오기 실패 (이전 버전 유지): {error}", file=sys.stderr)
+            return
+        if error is not None:
+            print(f"Reference 다시 불러오기 경고: {error}", file=sys.stderr)
+        print(f"Reference 인덱스 버전 {snapshot.version}: 항목 {len(snapshot.reference_list):,}개, "
+              f"생성 {snapshot.build_seconds:.2f}초", file=sys.stderr)
+
+    watched = [path for path in (args.reference, args.index) if path and path != '-']
+    reloader = None
+    if watched and args.reload_interval > 0:
+        reloader = ReferenceReloader(watched, lambda warn: _load_reference(args, args.engine, warn),
+                                     interval=args.reload_interval, on_reload=reloaded)
+    service = MatchService(reference_list, engine=args.engine, index=index,
+                           build_seconds=build_seconds, reloader=reloader)
+
+    def ready(address: str):
+        print(f"매칭 서비스 시작: {address} (POST /match, GET /stats)", file=sys.stderr)
+        reloaded(service.snapshot, None)
+
+    try:
+        asyncio.run(serve(service, args.serve, ready_callback=ready))
+    except KeyboardInterrupt:
+        pass
+    if args.stats:
+        print(service.snapshot.memo.summary(), file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령줄 진입점
+
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv[1:])
+
+    Returns:
+        종료 코드 (0: 성공, 1: 오류, 2: 잘못된 인자)
+    """
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    if args.check_startup:
+        return check_startup()
+    if args.serve:
+        if args.source or args.count or args.longest_prefix:
+            parser.error("--serve는 Source 파일, --count, --longest-prefix와 함께 사용할 수 없습니다")
+        if not args.reference and not args.index:
+            parser.error("Reference 파일(-r) 또는 인덱스 파일(-i)을 지정하세요")
+    if not args.source and not args.serve:
+        parser.error("Source 파일을 지정하세요 ('-'이면 표준 입력)")
+    if not args.reference and not args.index:
+        parser.error("Reference 파일(-r) 또는 인덱스 파일(-i)을 지정하세요")
+    if args.count and args.longest_prefix:
+        parser.error("--count는 --longest-prefix와 함께 사용할 수 없습니다")
+
+    try:
+        if args.serve:
+            return run_serve(args)
+        return run(args, sys.stdout)
+    except BrokenPipeError:
+        # head 등으로 출력이 일찍 닫힌 경우
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Reference 커버리지 비트맵 - 어떤 Reference와도 매칭되지 않는 Single IP를 O(1)로 거름"""
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+from core.interval_index import iter_reference_intervals
+from core.parsed_list import ParsedList
+from utils.ip_utils import KIND_V6
+
+
+class CoverageBitmap:
+    """
+    /24 단위 IPv4 커버리지 비트맵 (2^24비트 = 2MB)
+
+    Reference가 주소 하나라도 덮는 /24의 비트를 켜 둔다.
+    비트가 꺼진 /24의 IP는 어떤 Reference와도 매칭되지 않으므로 조회 없이 매칭 없음으로 처리하고,
+    비트가 켜진 /24는 /24 일부만 덮을 수 있으므로 인덱스로 정확히 다시 조회한다.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]]):
+        """
+        Args:
+            intervals: IPv4 Reference 정수 구간 [(start_int, end_int), ...]
+        """
+        self.bits = bytearray(1 << 21)
+        for start_int, end_int in intervals:
+            self._mark(start_int >> 8, end_int >> 8)
+
+    @classmethod
+    def from_references(cls, reference_list: Union[List[Dict], ParsedList]) -> 'CoverageBitmap':
+        """파싱된 Reference 리스트의 IPv4 항목으로 비트맵 생성"""
+        return cls(_iter_ipv4_spans(reference_list))
+
+    def _mark(self, first_chunk: int, last_chunk: int):
+        """/24 번호 [first_chunk, last_chunk]의 비트를 켬 (가운데 바이트는 한 번에)"""
+        bits = self.bits
+        first_byte = first_chunk >> 3
+        last_byte = last_chunk >> 3
+        first_mask = (0xFF << (first_chunk & 7)) & 0xFF
+        last_mask = 0xFF >> (7 - (last_chunk & 7))
+        if first_byte == last_byte:
+            bits[first_byte] |= first_mask & last_mask
+            return
+        bits[first_byte] |= first_mask
+        bits[first_byte + 1:last_byte] = b'\xff' * (last_byte - first_byte - 1)
+        bits[last_byte] |= last_mask
+
+    def may_match(self, ip_int: int) -> bool:
+        """IP의 /24를 덮는 Reference가 있는지 (False면 매칭 없음 확정, True면 인덱스로 확인)"""
+        chunk = ip_int >> 8
+        return bool((self.bits[chunk >> 3] >> (chunk & 7)) & 1)
+
+    def covered_ratio(self) -> float:
+        """비트가 켜진 /24의 비율 (낮을수록 거르는 Source가 많음)"""
+        return int.from_bytes(self.bits, 'little').bit_count() / (1 << 24)
+
+
+def _iter_ipv4_spans(reference_list: Union[List[Dict], ParsedList]) -> Iterator[Tuple[int, int]]:
+    """Reference의 IPv4 정수 구간 순회 (IPv6 항목 제외)"""
+    for start_int, end_int, kind, _ in iter_reference_intervals(reference_list):
+        if not kind & KIND_V6:
+            yield start_int, end_int
@@ -0,0 +1,191 @@
+"""DIR-24-8 직접 조회 테이블 - 단일 IPv4 조회를 배열 읽기 두 번으로"""
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Union
+import random
+import time
+from core.interval_index import IntervalIndex, IPV4_MAX
+from core.parsed_list import ParsedList
+
+
+# 1단계 테이블 엔트리에서 2단계 블록 번호를 뜻하는 플래그 (나머지 비트가 블록 번호)
+BLOCK_FLAG = 0x80000000
+BLOCK_MASK = 0x7FFFFFFF
+
+# 2단계 블록 크기 (/24 하나의 마지막 8비트)
+BLOCK_SIZE = 256
+
+
+def format_report(report: Dict) -> str:
+    """
+    Dir24Index.report() 한 줄 요약
+
+    Returns:
+        '직접 조회 테이블: 1단계 64.0MB + 2단계 블록 ...개 ..MB, 생성 ..초, 조회 ..ns/IP (bisect ..ns/IP), 손익분기 Source ..개' 형식 문자열
+    """
+    memory = report['memory']
+    text = (f"직접 조회 테이블: 1단계 {memory['first_level'] / 1048576:.1f}MB + "
+            f"2단계 블록 {memory['blocks']:,}개 {memory['second_level'] / 1048576:.1f}MB, "
+            f"생성 {report['build_seconds']:.2f}초, "
+            f"조회 {report['lookup_ns']:.0f}ns/IP (bisect {report['bisect_ns']:.0f}ns/IP)")
+    if report['break_even_sources'] is None:
+        return text + ", bisect보다 빠르지 않아 손익분기 없음"
+    return text + f", 손익분기 Source {report['break_even_sources']:,}개"
+
+
+class Dir24Index:
+    """
+    DIR-24-8 방식 2단계 직접 조회 테이블
+
+    정렬 구간 인덱스(IntervalIndex)의 기본 구간을 주소 공간에 펼쳐 둔다.
+    - 1단계: 2^24개 엔트리 (/24 하나당 하나). /24 전체가 한 기본 구간 안이면 멤버 집합 번호,
+      /24 안에 구간 경계가 있으면 BLOCK_FLAG | 2단계 블록 번호
+    - 2단계: 경계가 있는 /24마다 256개 엔트리 블록 (주소별 멤버 집합 번호)
+
+    멤버 집합 번호는 정렬 구간 인덱스와 같으므로 결과 문자열/결과 번호는 interval을 그대로 사용한다.
+    1단계 테이블만 64MB이므로 같은 Reference로 아주 많은 Single IP를 매칭할 때 사용한다 (report() 참고).
+    """
+
+    def __init__(self, interval: IntervalIndex):
+        """
+        Args:
+            interval: IPv4 정렬 구간 인덱스
+        """
+        started = time.perf_counter()
+        self.interval = interval
+        self.first = array('I', [0]) * (1 << 24)
+        self.second = array('I')
+        self._build()
+        # 정렬 구간 인덱스 대비 추가 생성 시간 (손익분기 계산용)
+        self.build_seconds = time.perf_counter() - started
+
+    @classmethod
+    def from_references(cls, reference_list: Union[List[Dict], ParsedList]) -> 'Dir24Index':
+        """파싱된 Reference 리스트로 인덱스 생성"""
+        return cls(IntervalIndex.from_references(reference_list))
+
+    def __len__(self) -> int:
+        return len(self.interval)
+
+    def _build(self):
+        """기본 구간마다 완전히 덮는 /24는 1단계에 채우고, 경계가 걸친 /24는 2단계 블록 생성"""
+        first = self.first
+        bounds = self.interval.bounds
+        segment_sets = self.interval.segment_sets
+        count = len(bounds)
+
+        for segment_idx in range(count):
+            set_id = segment_sets[segment_idx]
+            if not set_id:
+                continue
+            segment_start = bounds[segment_idx]
+            segment_end = bounds[segment_idx + 1] - 1 if segment_idx + 1 < count else IPV4_MAX
+            chunk_start = (segment_start + BLOCK_SIZE - 1) >> 8
+            chunk_end = (segment_end + 1) >> 8
+            if chunk_start < chunk_end:
+                first[chunk_start:chunk_end] = array('I', [set_id]) * (chunk_end - chunk_start)
+
+        # /24 중간에서 시작하는 구간 경계가 있는 /24만 2단계 블록으로 (같은 /24의 경계는 한 블록)
+        for chunk in sorted({boundary >> 8 for boundary in bounds if boundary & 0xFF}):
+            first[chunk] = BLOCK_FLAG | (len(self.second) >> 8)
+            self.second.extend(self._block(chunk << 8))
+
+    def _block(self, base: int) -> array:
+        """base부터 256개 주소의 멤버 집합 번호 블록"""
+        bounds = self.interval.bounds
+        segment_sets = self.interval.segment_sets
+        count = len(bounds)
+        block = array('I')
+        block_end = base + BLOCK_SIZE
+        segment_idx = bisect_right(bounds, base) - 1
+        position = base
+        while position < block_end:
+            next_bound = bounds[segment_idx + 1] if segment_idx + 1 < count else block_end
+            stop = min(next_bound, block_end)
+            set_id = segment_sets[segment_idx] if segment_idx >= 0 else 0
+            block.extend(array('I', [set_id]) * (stop - position))
+            position = stop
+            segment_idx += 1
+        return block
+
+    def lookup_set(self, ip_int: int) -> int:
+        """
+        단일 IP의 멤버 집합 번호 반환 (배열 읽기 최대 두 번)
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            멤버 집합 번호 (매칭 없으면 0)
+        """
+        entry = self.first[ip_int >> 8]
+        if entry & BLOCK_FLAG:
+            return self.second[((entry & BLOCK_MASK) << 8) | (ip_int & 0xFF)]
+        return entry
+
+    def lookup(self, ip_int: int):
+        """단일 IP를 포함하는 Reference 번호 (출력 순서)"""
+        return self.interval.set_members_of(self.lookup_set(ip_int))
+
+    def lookup_label(self, ip_int: int) -> str:
+        """단일 IP의 매칭 결과 문자열 (매칭 없으면 빈 문자열)"""
+        return self.interval.set_label(self.lookup_set(ip_int))
+
+    def overlap_label(self, start_int: int, end_int: int) -> str:
+        """Network/Range 구간과 겹치는 Reference 결과 문자열 (정렬 구간 인덱스의 구간 조회)"""
+        return self.interval.overlap_label(start_int, end_int)
+
+    def memory(self) -> Dict[str, int]:
+        """
+        테이블 메모리 사용량 (바이트)
+
+        Returns:
+            {'first_level', 'second_level', 'blocks': 2단계 블록 수, 'total'}
+        """
+        first_level = len(self.first) * self.first.itemsize
+        second_level = len(self.second) * self.second.itemsize
+        return {
+            'first_level': first_level,
+            'second_level': second_level,
+            'blocks': len(self.second) // BLOCK_SIZE,
+            'total': first_level + second_level,
+        }
+
+    def report(self, sample_size: int = 100000, seed: int = 0) -> Dict:
+        """
+        생성 시간 대 조회 시간 손익분기 보고
+
+        임의 주소 sample_size개로 이 테이블과 정렬 구간 인덱스(bisect)의 단일 IP 조회 시간을 재고,
+        테이블 생성 시간(정렬 구간 인덱스 이후 추가분)을 조회 한 번당 절약 시간으로 나눠
+        테이블 생성이 이득이 되는 Single IP Source 개수를 구한다.
+
+        Args:
+            sample_size: 조회 시간 측정에 쓸 주소 개수
+            seed: 측정 주소 난수 시드
+
+        Returns:
+            {'memory': memory(), 'build_seconds', 'lookup_ns', 'bisect_ns',
+             'break_even_sources': 손익분기 Source 개수 (이득이 없으면 None)}
+        """
+        rng = random.Random(seed)
+        sample = [rng.getrandbits(32) for _ in range(sample_size)]
+
+        started = time.perf_counter()
+        for ip_int in sample:
+            self.lookup_set(ip_int)
+        lookup_seconds = (time.perf_counter() - started) / sample_size
+
+        bisect_lookup = self.interval.lookup_set
+        started = time.perf_counter()
+        for ip_int in sample:
+            bisect_lookup(ip_int)
+        bisect_seconds = (time.perf_counter() - started) / sample_size
+
+        saving = bisect_seconds - lookup_seconds
+        return {
+            'memory': self.memory(),
+            'build_seconds': self.build_seconds,
+            'lookup_ns': lookup_seconds * 1e9,
+            'bisect_ns': bisect_seconds * 1e9,
+            'break_even_sources': int(self.build_seconds / saving) + 1 if saving > 0 else None,
+        }
@@ -0,0 +1,162 @@
+"""매칭 결과 내보내기 - 엑셀(.xlsx) 또는 CSV/TSV 파일 저장 (스트리밍 기록)"""
+import csv
+import os
+from typing import Callable, Dict, List, Optional
+from core.match_result import iter_rows
+
+
+# 결과 헤더
+HEADERS = ['대상 IP', '매칭된 IP']
+
+# 진행률 콜백 호출 단위 (행)
+PROGRESS_CHUNK = 10000
+
+# 엑셀 시트 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1048576
+
+# 확장자별 구분자 (그 외 확장자는 엑셀)
+DELIMITERS = {'.csv': ',', '.tsv': '\t', '.txt': '\t'}
+
+# 확장자별 텍스트 인코딩 (.csv는 엑셀이 한글 헤더를 UTF-8로 읽도록 BOM 포함)
+ENCODINGS = {'.csv': 'utf-8-sig'}
+
+
+def text_encoding(file_path: str) -> str:
+    """CSV/TSV 결과 파일의 인코딩 (.csv는 'utf-8-sig', 그 외는 'utf-8')"""
+    return ENCODINGS.get(os.path.splitext(file_path)[1].lower(), 'utf-8')
+
+
+def export_results(results: List[Dict], file_path: str,
+                   progress_callback: Optional[Callable[[int, int], None]] = None):
+    """
+    확장자에 맞는 형식으로 매칭 결과 저장 (.csv/.tsv/.txt는 텍스트, 그 외는 엑셀)
+
+    Args:
+        results: 매칭 결과 (MatchResult 또는 [{'source': ..., 'matched_ips': ...}, ...])
+        file_path: 저장할 파일 경로
+        progress_callback: 진행률 콜백 함수 (current, total)
+    """
+    delimiter = DELIMITERS.get(os.path.splitext(file_path)[1].lower())
+    if delimiter is None:
+        export_excel(results, file_path, progress_callback)
+    else:
+        export_delimited(results, file_path, delimiter, progress_callback)
+
+
+def export_delimited(results: List[Dict], file_path: str, delimiter: str = ',',
+                     progress_callback: Optional[Callable[[int, int], None]] = None):
+    """
+    매칭 결과를 CSV/TSV로 저장 (서식 없이 행을 바로 기록하는 빠른 경로)
+
+    Args:
+        results: 매칭 결과 리스트
+        file_path: 저장할 경로
+        delimiter: 구분자 (',' 또는 '\\t')
+        progress_callback: 진행률 콜백 함수 (current, total)
+    """
+    total = len(results)
+    with open(file_path, 'w', encoding=text_encoding(file_path), newline='') as output_file:
+        writer = csv.writer(output_file, delimiter=delimiter)
+        writer.writerow(HEADERS)
+        for start in range(0, total, PROGRESS_CHUNK):
+            writer.writerows(iter_rows(results, start, start + PROGRESS_CHUNK))
+            if progress_callback:
+                progress_callback(min(start + PROGRESS_CHUNK, total), total)
+
+
+def export_excel(results: List[Dict], file_path: str,
+                 progress_callback: Optional[Callable[[int, int], None]] = None):
+    """
+    매칭 결과를 서식이 적용된 엑셀 파일로 저장
+
+    쓰기 전용(write_only) 워크북으로 행을 바로 파일에 기록하므로 메모리 사용량이 행 수와 무관하다.
+    서식은 셀마다 만들지 않고 헤더/데이터용 NamedStyle 두 개를 공유하며,
+    행 높이도 행마다 지정하지 않고 시트 기본 행 높이로 설정한다.
+    시트 최대 행 수를 넘으면 다음 시트("매칭 결과 (2)" ...)에 이어서 기록한다.
+
+    Args:
+        results: 매칭 결과 리스트 [{'source': ..., 'matched_ips': ...}, ...]
+        file_path: 저장할 .xlsx 경로
+        progress_callback: 진행률 콜백 함수 (current, total)
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+
+    # 워크북 생성 (쓰기 전용)
+    wb = Workbook(write_only=True)
+
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    # 헤더/데이터 공유 스타일
+    header_style = NamedStyle(
+        name="result_header",
+        fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        font=Font(bold=True, color="FFFFFF", size=11),
+        alignment=Alignment(horizontal="center", vertical="center"),
+        border=border
+    )
+    data_style = NamedStyle(
+        name="result_data",
+        font=Font(size=10),
+        alignment=Alignment(horizontal="left", vertical="center", wrap_text=True),
+        border=border
+    )
+    wb.add_named_style(header_style)
+    wb.add_named_style(data_style)
+
+    total = len(results)
+    sheet_rows = EXCEL_MAX_ROWS - 1  # 헤더 제외
+    for sheet_start in range(0, max(total, 1), sheet_rows):
+        sheet_number = sheet_start // sheet_rows + 1
+        title = "매칭 결과" if sheet_number == 1 else f"매칭 결과 ({sheet_number})"
+        ws = _create_result_sheet(wb, title)
+
+        # 데이터 입력 (append 시 행이 바로 기록되므로 서식이 적용된 셀 두 개를 값만 바꿔 재사용)
+        source_cell = WriteOnlyCell(ws)
+        source_cell.style = "result_data"
+        matched_cell = WriteOnlyCell(ws)
+        matched_cell.style = "result_data"
+        row = (source_cell, matched_cell)
+
+        sheet_end = min(sheet_start + sheet_rows, total)
+        for start in range(sheet_start, sheet_end, PROGRESS_CHUNK):
+            end = min(start + PROGRESS_CHUNK, sheet_end)
+            for source_original, matched_ips_str in iter_rows(results, start, end):
+                source_cell.value = source_original
+                matched_cell.value = matched_ips_str
+                ws.append(row)
+            if progress_callback:
+                progress_callback(end, total)
+
+    # 저장
+    wb.save(file_path)
+
+
+def _create_result_sheet(wb, title: str):
+    """쓰기 전용 워크북에 결과 시트를 추가하고 너비/행 높이/헤더를 기록"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.worksheet.dimensions import RowDimension
+
+    ws = wb.create_sheet(title)
+
+    # 컬럼 너비/행 높이 (쓰기 전용 시트는 행 기록 전에 설정)
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 50
+    ws.sheet_format.defaultRowHeight = 20
+    ws.sheet_format.customHeight = True
+    ws.row_dimensions[1] = RowDimension(ws, index=1, ht=25)  # 헤더 높이
+
+    # 헤더 설정
+    header_row = []
+    for header in HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = "result_header"
+        header_row.append(cell)
+    ws.append(header_row)
+    return ws
@@ -0,0 +1,170 @@
+"""
+Reference 파일 변경 감지와 인덱스 교체 - 실행 중인 매칭 서비스가 Reference 파일 변경을 반영
+
+파일의 (mtime, inode, 크기)를 주기적으로 확인하고, 바뀌면 백그라운드 스레드에서 Reference를
+다시 파싱/인덱스 생성하여 새 IndexSnapshot으로 통째로 교체한다.
+스냅샷은 만든 뒤 수정하지 않으므로 (ReferenceSet의 증분 인덱스와 달리) 교체 전에 시작한 매칭은
+이전 버전으로 끝나고, 조회 쪽은 잠금 없이 현재 스냅샷 속성 하나만 읽는다.
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.memo import MatchMemo
+from core.parsed_list import ParsedList
+
+
+def read_reference_text(path: str) -> str:
+    """
+    Reference 파일 텍스트 읽기
+
+    Args:
+        path: 일반 텍스트 파일 또는 GUI가 저장한 reference_data.json ({"reference_text": ...})
+
+    Returns:
+        Reference 텍스트
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if not path.lower().endswith('.json'):
+            return f.read()
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get('reference_text', ''), str):
+        raise ValueError(f"Reference JSON 형식이 아닙니다: {path}")
+    return data.get('reference_text', '')
+
+
+def file_signature(paths: Sequence[str]) -> Tuple:
+    """
+    파일 변경 확인용 서명 (파일별 (mtime_ns, inode, 크기), 없는 파일은 None)
+
+    제자리 수정은 mtime/크기, 새 파일로 바꿔치기(rename)는 inode로 감지한다.
+    """
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((st.st_mtime_ns, st.st_ino, st.st_size))
+    return tuple(signature)
+
+
+class IndexSnapshot:
+    """
+    한 버전의 Reference와 인덱스/메모 (생성 후 수정하지 않음)
+
+    메모는 Reference 한 버전에만 유효하므로 스냅샷마다 새로 만든다.
+    커버리지 비트맵은 첫 요청이 기다리지 않도록 스냅샷을 만들 때(백그라운드 생성 중) 미리 만든다.
+    """
+
+    __slots__ = ('version', 'reference_list', 'index', 'memo', 'build_seconds', 'loaded_at')
+
+    def __init__(self, version: int, reference_list: ParsedList, index, build_seconds: float = 0.0):
+        """
+        Args:
+            version: 인덱스 버전 번호 (처음 1, 교체마다 1씩 증가)
+            reference_list: 파싱된 Reference 리스트
+            index: Reference 인덱스 (legacy 엔진이면 None)
+            build_seconds: Reference 파싱 + 인덱스 생성 시간 (초, 비트맵 생성 시간은 이후 더함)
+        """
+        started = time.perf_counter()
+        self.version = version
+        self.reference_list = reference_list
+        self.index = index
+        self.memo = MatchMemo()
+        if reference_list:
+            self.memo.coverage(reference_list)
+        self.build_seconds = build_seconds + time.perf_counter() - started
+        self.loaded_at = time.time()
+
+    def info(self) -> Dict:
+        """버전 정보 dict (/stats 응답용)"""
+        return {
+            'version': self.version,
+            'references': len(self.reference_list),
+            'build_seconds': round(self.build_seconds, 3),
+            'loaded_at': self.loaded_at,
+        }
+
+
+class ReferenceReloader:
+    """
+    Reference 파일을 감시하다가 바뀌면 새 IndexSnapshot 생성
+
+    변경 확인은 os.stat뿐이라 짧은 주기로 돌려도 부담이 작다. 생성 중 파일이 다시 바뀌면
+    다음 확인 때 한 번 더 생성한다. 생성이 실패하면 (쓰는 중인 파일 등) 현재 스냅샷을 유지하고
+    last_error에 기록한 뒤 파일이 다시 바뀔 때 재시도한다.
+    생성 함수가 경고를 알리면 (Reference와 내용이 다른 인덱스 파일을 무시한 경우 등) 교체는 하되
+    경고를 last_error에 남긴다.
+    """
+
+    def __init__(self, paths: Sequence[str],
+                 build: Callable[[Callable[[str], None]], Tuple[ParsedList, object]],
+                 interval: float = 1.0,
+                 on_reload: Optional[Callable[[Optional[IndexSnapshot], Optional[str]], None]] = None):
+        """
+        Args:
+            paths: 감시할 파일 경로 (Reference 파일, 컴파일된 인덱스 파일)
+            build: (reference_list, index)를 새로 만드는 함수 (백그라운드 스레드에서 호출)
+                   경고 메시지를 받는 함수 하나를 인자로 받는다.
+            interval: 변경 확인 주기 (초)
+            on_reload: 교체 후 (새 스냅샷, 경고 메시지 또는 None), 실패 시 (None, 오류 메시지)로 호출
+        """
+        self.paths: List[str] = list(paths)
+        self.build = build
+        self.interval = interval
+        self.on_reload = on_reload
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        self._warnings: List[str] = []  # 마지막 load()에서 생성 함수가 알린 경고
+        self._signature = file_signature(self.paths)
+
+    def changed(self) -> bool:
+        """마지막 생성 이후 감시 파일이 바뀌었는지"""
+        return file_signature(self.paths) != self._signature
+
+    def load(self, version: int) -> IndexSnapshot:
+        """
+        현재 파일로 스냅샷 생성 (서명은 읽기 전에 기록하므로 읽는 도중의 변경은 다음 확인 때 반영)
+
+        Args:
+            version: 새 스냅샷 버전 번호
+        """
+        self._signature = file_signature(self.paths)
+        self._warnings = []
+        started = time.perf_counter()
+        reference_list, index = self.build(self._warnings.append)
+        return IndexSnapshot(version, reference_list, index, time.perf_counter() - started)
+
+    async def watch(self, service):
+        """
+        interval마다 변경을 확인하여 service.swap()으로 교체 (취소될 때까지)
+
+        생성은 기본 스레드 풀에서 하므로 그동안에도 이전 스냅샷으로 요청을 처리한다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval)
+            if not self.changed():
+                continue
+            version = service.snapshot.version + 1
+            try:
+                snapshot = await loop.run_in_executor(None, self.load, version)
+            except Exception as e:
+                self.last_error = str(e)
+                if self.on_reload:
+                    self.on_reload(None, self.last_error)
+                continue
+            service.swap(snapshot)
+            self.reloads += 1
+            self.last_error = '; '.join(self._warnings) or None
+            if self.on_reload:
+                self.on_reload(snapshot, self.last_error)
+
+    def stats(self) -> Dict:
+        """감시 상태 dict (/stats 응답용)"""
+        return {'paths': self.paths, 'interval': self.interval,
+                'reloads': self.reloads, 'last_error': self.last_error}
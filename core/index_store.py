@@ -0,0 +1,235 @@
+"""컴파일된 Reference 인덱스 파일 - 버전이 있는 바이너리 포맷, mmap 로드"""
+from array import array
+from typing import Tuple, Iterator, Optional
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from core.interval_index import IntervalIndex
+from core.ipv6_index import DualStackIndex
+from core.prefix_index import PrefixHashIndex
+from utils.ip_utils import range_to_cidrs
+
+
+# 파일 포맷
+# [헤더 68바이트]
+#   magic(8) version(H) reserved(H) content_hash(32)
+#   n_refs(I) n_bounds(I) n_sets(I) n_members(I) n_blocks(I) blob_size(I)
+# [uint32 섹션] starts, ends, bounds, segment_sets(n_bounds), set_offsets(n_sets + 1), set_members,
+#               block_networks, block_ranks, string_offsets(n_refs + 1)
+# [uint8 섹션]  block_prefix_lens
+# [문자열 blob] UTF-8로 이어 붙인 Reference original
+# 정수는 모두 little-endian
+# 버전 3: 슬롯 상한으로 멤버를 저장하지 않은 집합 (CSR 범위가 빈 0번 이외 집합) 허용
+# 버전 2 파일은 그런 집합이 없으므로 그대로 읽는다.
+MAGIC = b'IPSMIDX\0'
+FORMAT_VERSION = 3
+READABLE_VERSIONS = (2, 3)
+_HEADER = struct.Struct('<8sHH32sIIIIII')
+
+
+def content_hash(reference_text: str) -> bytes:
+    """Reference 텍스트의 내용 해시 (인덱스 파일 유효성 확인용)"""
+    return hashlib.sha256(reference_text.strip().encode('utf-8')).digest()
+
+
+class StringTable:
+    """오프셋 배열 + UTF-8 blob으로 된 문자열 테이블 (접근할 때만 디코딩)"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        return bytes(self.blob[self.offsets[idx]:self.offsets[idx + 1]]).decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+class CompiledIndex:
+    """mmap으로 불러온 컴파일된 Reference 인덱스"""
+
+    def __init__(self, mapped: Optional[mmap.mmap], content_hash: bytes, index: IntervalIndex,
+                 block_networks, block_prefix_lens, block_ranks):
+        self._mapped = mapped
+        self.content_hash = content_hash
+        self.index = index  # 정렬 구간 인덱스 (bisect 엔진)
+        self.block_networks = block_networks
+        self.block_prefix_lens = block_prefix_lens
+        self.block_ranks = block_ranks
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self):
+        """
+        파일 mmap 해제 (같은 경로에 인덱스를 다시 저장하기 전에 호출)
+
+        Windows는 매핑된 파일을 교체(os.replace)할 수 없으므로 먼저 해제해야 한다.
+        인덱스 배열과 Reference 문자열은 메모리로 복사하여 제자리에서 바꾸므로, 이 인덱스를 참조하는
+        매칭 결과/Dir24Index 등은 해제 후에도 그대로 동작한다.
+
+        Raises:
+            BufferError: 다른 객체(numpy 배열 등)가 아직 파일 페이지를 참조하는 경우
+        """
+        if self._mapped is None:
+            return
+        index = self.index
+        for name in ('starts', 'ends', 'bounds', 'segment_sets', 'set_offsets', 'set_members'):
+            setattr(index, name, array('I', getattr(index, name)))
+        index.originals = list(index.originals)
+        self.block_networks = array('I', self.block_networks)
+        self.block_prefix_lens = array('B', self.block_prefix_lens)
+        self.block_ranks = array('I', self.block_ranks)
+        # 실패하면 (BufferError) _mapped를 그대로 두어 참조를 정리한 뒤 다시 close()할 수 있게 함
+        self._mapped.close()
+        self._mapped = None
+
+    def blocks(self) -> Iterator[Tuple[int, int, int]]:
+        """CIDR 블록 테이블 [(network_int, prefix_len, rank), ...]"""
+        return zip(self.block_networks, self.block_prefix_lens, self.block_ranks)
+
+    def build_prefix_index(self) -> PrefixHashIndex:
+        """
+        저장된 CIDR 블록 테이블로 prefix별 해시 인덱스 생성 (Reference 파싱 없음)
+        Reference 문자열은 복사해서 넘기므로 해시 인덱스는 파일 mmap을 참조하지 않는다 (close() 가능).
+        """
+        return PrefixHashIndex.from_blocks(list(self.index.originals), self.blocks())
+
+
+def save_index(path: str, index: IntervalIndex, reference_text: str):
+    """
+    정렬 구간 인덱스를 바이너리 파일로 저장
+
+    Args:
+        path: 저장 경로
+        index: Reference로 만든 IntervalIndex (DualStackIndex면 IPv4 인덱스만 저장)
+        reference_text: 인덱스를 만든 Reference 원문 (내용 해시 계산용)
+    """
+    if isinstance(index, DualStackIndex):
+        # IPv6 Reference는 저장하지 않음 (IPv6 Source가 있으면 Reference를 파싱하여 매칭)
+        index = index.v4
+
+    block_networks = array('I')
+    block_ranks = array('I')
+    block_prefix_lens = array('B')
+    for rank, (start_int, end_int) in enumerate(zip(index.starts, index.ends)):
+        for network_int, prefix_len in range_to_cidrs(start_int, end_int):
+            block_networks.append(network_int)
+            block_ranks.append(rank)
+            block_prefix_lens.append(prefix_len)
+
+    encoded = [original.encode('utf-8') for original in index.originals]
+    string_offsets = array('I', [0])
+    for item in encoded:
+        string_offsets.append(string_offsets[-1] + len(item))
+    blob = b''.join(encoded)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, content_hash(reference_text),
+                          len(index.originals), len(index.bounds), len(index.set_offsets) - 1,
+                          len(index.set_members),
+                          len(block_networks), len(blob))
+
+    sections = [
+        array('I', index.starts), array('I', index.ends),
+        array('I', index.bounds), array('I', index.segment_sets),
+        array('I', index.set_offsets), array('I', index.set_members),
+        block_networks, block_ranks, string_offsets,
+    ]
+    if sys.byteorder != 'little':
+        for section in sections:
+            section.byteswap()
+
+    # 임시 파일에 쓴 뒤 교체 (POSIX에서는 기존 파일을 mmap으로 쓰는 중인 인덱스가 이전 내용을 그대로 봄)
+    # Windows는 매핑된 파일을 교체할 수 없으므로 같은 경로를 불러온 CompiledIndex는 먼저 close()해야 한다.
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            for section in sections:
+                f.write(section.tobytes())
+            f.write(block_prefix_lens.tobytes())
+            f.write(blob)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_index(path: str) -> CompiledIndex:
+    """
+    바이너리 인덱스 파일을 mmap으로 로드 (배열은 복사 없이 파일 페이지를 그대로 사용)
+
+    Args:
+        path: 인덱스 파일 경로
+
+    Returns:
+        CompiledIndex
+
+    Raises:
+        ValueError: 포맷/버전이 맞지 않거나 파일이 손상된 경우
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError("빈 인덱스 파일입니다.")
+
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        raise ValueError("인덱스 파일 헤더가 손상되었습니다.")
+
+    (magic, version, _, stored_hash, n_refs, n_bounds,
+     n_sets, n_members, n_blocks, blob_size) = _HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        mapped.close()
+        raise ValueError("인덱스 파일 형식이 아닙니다.")
+    if version not in READABLE_VERSIONS:
+        mapped.close()
+        raise ValueError(f"지원하지 않는 인덱스 버전입니다: {version}")
+
+    expected_size = (_HEADER.size
+                     + 4 * (2 * n_refs + 2 * n_bounds + (n_sets + 1) + n_members + 2 * n_blocks + (n_refs + 1))
+                     + n_blocks + blob_size)
+    if len(mapped) != expected_size:
+        mapped.close()
+        raise ValueError("인덱스 파일 크기가 올바르지 않습니다.")
+
+    view = memoryview(mapped)
+    position = _HEADER.size
+
+    def take_uint32(count: int):
+        nonlocal position
+        section = view[position:position + 4 * count]
+        position += 4 * count
+        if sys.byteorder != 'little':
+            # big-endian 환경은 복사 후 변환
+            converted = array('I', bytes(section))
+            converted.byteswap()
+            return converted
+        return section.cast('I')
+
+    starts = take_uint32(n_refs)
+    ends = take_uint32(n_refs)
+    bounds = take_uint32(n_bounds)
+    segment_sets = take_uint32(n_bounds)
+    set_offsets = take_uint32(n_sets + 1)
+    set_members = take_uint32(n_members)
+    block_networks = take_uint32(n_blocks)
+    block_ranks = take_uint32(n_blocks)
+    string_offsets = take_uint32(n_refs + 1)
+    block_prefix_lens = view[position:position + n_blocks]
+    position += n_blocks
+    blob = view[position:position + blob_size]
+
+    originals = StringTable(string_offsets, blob)
+    index = IntervalIndex.from_arrays(originals, starts, ends, bounds,
+                                      segment_sets, set_offsets, set_members)
+    return CompiledIndex(mapped, stored_hash, index, block_networks, block_prefix_lens, block_ranks)
@@ -0,0 +1,558 @@
+"""정렬된 구간 인덱스 - 이진 탐색 기반 단일 IP 조회 / 구간 겹침 조회"""
+from array import array
+from bisect import bisect_right
+from itertools import chain
+from typing import List, Dict, Tuple, Sequence, Iterator, Union
+import ipaddress
+import random
+from core.parsed_list import ParsedList
+from utils.ip_utils import KIND_SINGLE, KIND_CIDR, KIND_RANGE, KIND_V6, KIND_MASK, IPV4_BITS, IPV6_BITS
+
+
+# IPv4 주소 공간의 마지막 값
+IPV4_MAX = 0xFFFFFFFF
+
+# 출력 순서 카테고리 (기존 매칭 순서: Address → Network(긴 prefix 우선) → Range)
+ORDER_ADDRESS = 0
+ORDER_NETWORK = 1
+ORDER_RANGE = 2
+
+# 이 크기 이하의 멤버 집합은 항상 멤버를 그대로 저장
+INLINE_SET_SIZE = 32
+
+# 멤버를 그대로 저장하는 슬롯 수 상한 (Reference 수 배수)
+# 겹침이 깊으면 (중첩 Range 등) 구간마다 큰 집합이 생겨 슬롯이 O(R^2)로 늘어나므로,
+# 상한을 넘는 큰 집합은 멤버 없이 대표 주소만 기록하고 조회할 때 시작점 정렬 배열에서 계산한다.
+MAX_SLOTS_PER_REFERENCE = 8
+
+
+def iter_reference_intervals(reference_list: Union[List[Dict], ParsedList]) -> Iterator[Tuple[int, int, int, str]]:
+    """
+    Reference를 입력 순서대로 (start_int, end_int, kind, original)로 순회
+    dict 리스트와 ParsedList를 모두 지원한다 (Set 타입은 Range로 취급).
+
+    Args:
+        reference_list: 파싱된 Reference 리스트
+
+    Yields:
+        (start_int, end_int, kind, original) (kind: utils.ip_utils.KIND_*, IPv6는 KIND_V6 포함)
+    """
+    if isinstance(reference_list, ParsedList):
+        for (start_int, end_int, kind), original in zip(reference_list.intervals(), reference_list.originals()):
+            yield start_int, end_int, kind, original
+        return
+
+    for ref in reference_list:
+        ref_parsed = ref['parsed']
+        ref_original = ref['original']
+
+        if isinstance(ref_parsed, ipaddress.IPv4Network):
+            yield (int(ref_parsed.network_address), int(ref_parsed.broadcast_address),
+                   KIND_CIDR, ref_original)
+        elif isinstance(ref_parsed, ipaddress.IPv4Address):
+            addr_int = int(ref_parsed)
+            yield addr_int, addr_int, KIND_SINGLE, ref_original
+        elif isinstance(ref_parsed, tuple):
+            if isinstance(ref_parsed[0], ipaddress.IPv6Address):
+                yield int(ref_parsed[0]), int(ref_parsed[1]), KIND_RANGE | KIND_V6, ref_original
+            else:
+                yield ref_parsed[0], ref_parsed[1], KIND_RANGE, ref_original
+        elif isinstance(ref_parsed, ipaddress.IPv6Network):
+            yield (int(ref_parsed.network_address), int(ref_parsed.broadcast_address),
+                   KIND_CIDR | KIND_V6, ref_original)
+        elif isinstance(ref_parsed, ipaddress.IPv6Address):
+            addr_int = int(ref_parsed)
+            yield addr_int, addr_int, KIND_SINGLE | KIND_V6, ref_original
+        elif isinstance(ref_parsed, set):
+            # Set 타입 (하위 호환성)
+            if ref_parsed:
+                sorted_ips = sorted(ref_parsed)
+                yield int(sorted_ips[0]), int(sorted_ips[-1]), KIND_RANGE, ref_original
+
+
+def order_key(start_int: int, end_int: int, kind: int, position, bits: int = IPV4_BITS) -> Tuple:
+    """
+    Reference 하나의 출력 순서 키 (작을수록 앞)
+
+    Args:
+        start_int, end_int: 정수 구간
+        kind: KIND_SINGLE/KIND_CIDR/KIND_RANGE (KIND_V6 제외)
+        position: 입력 순서 (정수 또는 증분 갱신 시 사이값)
+        bits: 주소 비트 수
+
+    Returns:
+        (카테고리, -prefix 길이 또는 0, position)
+    """
+    if kind == KIND_CIDR:
+        return ORDER_NETWORK, (end_int - start_int).bit_length() - bits, position
+    if kind == KIND_SINGLE:
+        return ORDER_ADDRESS, 0, position
+    return ORDER_RANGE, 0, position
+
+
+def rank_entries(reference_list: Union[List[Dict], ParsedList],
+                 family: int = 4) -> List[Tuple[Tuple, int, int, str]]:
+    """
+    Reference 리스트를 출력 순서 키와 함께 정렬 (rank_references 참고)
+
+    Returns:
+        [(order_key, start_int, end_int, original), ...] (출력 순서대로 정렬)
+    """
+    family_flag = KIND_V6 if family == 6 else 0
+    bits = IPV6_BITS if family == 6 else IPV4_BITS
+    addresses = {}  # {addr_int: (order_key, original)}
+    ranked = []  # [(order_key, start_int, end_int, original), ...]
+
+    for position, (start_int, end_int, kind, ref_original) in enumerate(iter_reference_intervals(reference_list)):
+        if (kind & KIND_V6) != family_flag:
+            continue
+        kind &= KIND_MASK
+        if kind == KIND_SINGLE:
+            # 기존 address_set과 동일하게 처음 위치를 유지하고 original만 갱신
+            if start_int in addresses:
+                addresses[start_int] = (addresses[start_int][0], ref_original)
+            else:
+                addresses[start_int] = (order_key(start_int, end_int, kind, position, bits), ref_original)
+        else:
+            ranked.append((order_key(start_int, end_int, kind, position, bits), start_int, end_int, ref_original))
+
+    for addr_int, (key, ref_original) in addresses.items():
+        ranked.append((key, addr_int, addr_int, ref_original))
+
+    ranked.sort(key=lambda item: item[0])
+    return ranked
+
+
+def rank_references(reference_list: Union[List[Dict], ParsedList], family: int = 4) -> List[Tuple[int, int, str]]:
+    """
+    Reference 리스트를 기존 매칭 결과와 같은 출력 순서의 정수 구간으로 변환
+
+    - Address: 같은 주소는 하나만 유지 (마지막 original 사용)
+    - Network: prefix 길이가 긴 순서, 같은 길이는 입력 순서
+    - Range: 입력 순서
+
+    Args:
+        reference_list: 파싱된 Reference 리스트
+        family: 주소 체계 (4 또는 6, 다른 체계의 Reference는 제외)
+
+    Returns:
+        [(start_int, end_int, original), ...] (출력 순서대로 정렬)
+    """
+    return [(start_int, end_int, ref_original)
+            for _, start_int, end_int, ref_original in rank_entries(reference_list, family)]
+
+
+def collapse_references(intervals: List[Tuple[int, int, str]]) -> List[Tuple[int, int, str]]:
+    """
+    같은 구간 + 같은 original인 중복 Reference를 하나로 합침 (앞선 순서 유지)
+    결과 문자열은 original 기준으로 중복 제거되므로 매칭 결과는 바뀌지 않는다.
+
+    Args:
+        intervals: rank_references 결과
+
+    Returns:
+        중복이 제거된 [(start_int, end_int, original), ...]
+    """
+    return list(dict.fromkeys(intervals))
+
+
+def format_stats(stats: Dict[str, int]) -> str:
+    """
+    정규화 통계 한 줄 요약
+
+    Args:
+        stats: IntervalIndex.stats
+
+    Returns:
+        '정규화: Reference 1,000 → 900, 구간 ..., 멤버 슬롯 ... (-40.0%)' 형식 문자열
+    """
+    def ratio(before: int, after: int) -> str:
+        return f"-{(1 - after / before) * 100:.1f}%" if before else "-0.0%"
+
+    lazy_sets = stats.get('lazy_sets', 0)
+    lazy = f", 조회 시 계산 {lazy_sets:,}개" if lazy_sets else ''
+    return (f"정규화: Reference {stats['references_in']:,} → {stats['references']:,} "
+            f"({ratio(stats['references_in'], stats['references'])}), "
+            f"구간 {stats['segments_in']:,} → {stats['segments']:,} "
+            f"({ratio(stats['segments_in'], stats['segments'])}), "
+            f"멤버 슬롯 {stats['member_slots_in']:,} → {stats['member_slots']:,} "
+            f"({ratio(stats['member_slots_in'], stats['member_slots'])}, 고유 집합 {stats['member_sets']:,}개{lazy})")
+
+
+class IntervalIndex:
+    """
+    Reference 구간을 겹치지 않는 기본 구간(elementary segment)으로 나눈 정렬 인덱스
+
+    모든 구간의 시작점과 (끝점 + 1)을 경계값으로 정렬해 두고, 각 기본 구간은
+    자신을 덮는 Reference 번호 집합의 번호(set id)만 가진다. 같은 집합은 한 번만
+    저장하고(CSR 형태), 같은 집합을 가리키는 인접 구간은 하나로 합친다 (정규화).
+    단일 IP 조회는 경계값 이진 탐색 한 번과 해당 집합의 멤버 순회로 끝난다 (O(log R + k)).
+    멤버 슬롯이 상한(MAX_SLOTS_PER_REFERENCE * R)을 넘으면 이후의 큰 집합은 멤버를 저장하지 않고
+    (CSR 범위가 빈 0번 이외 집합) 대표 주소를 덮는 Reference를 시작점 정렬 + 최대 끝점 트리로 찾는다 (O(k log R)).
+    Network/Range 구간 조회는 시작점을 덮는 집합과 시작점 정렬 배열의 이진 탐색을 합친다 (O(log R + k)).
+    IPv6(bits=128)는 주소값이 array('I')에 들어가지 않으므로 starts/ends/bounds를 리스트로 둔다.
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, str]], bits: int = IPV4_BITS):
+        """
+        Args:
+            intervals: 출력 순서대로 정렬된 [(start_int, end_int, original), ...]
+            bits: 주소 비트 수 (IPv4: 32, IPv6: 128)
+        """
+        self.bits = bits
+        make_values = (lambda values: array('I', values)) if bits == IPV4_BITS else list
+        self.originals = [original for _, _, original in intervals]
+        self.starts = make_values(start_int for start_int, _, _ in intervals)
+        self.ends = make_values(end_int for _, end_int, _ in intervals)
+
+        self.bounds = make_values(())  # 기본 구간 시작 경계값 (정렬됨)
+        self.segment_sets = array('I')  # bounds[i] 구간의 멤버 집합 번호
+        self.set_offsets = array('I', [0, 0])  # 집합 j의 멤버는 set_members[set_offsets[j]:set_offsets[j + 1]]
+        self.set_members = array('I')  # Reference 번호 (출력 순서), 0번 집합은 빈 집합
+        self._set_points = {}  # 멤버를 저장하지 않은 집합의 대표 주소 {set_id: 주소}
+        self.stats = self._build_segments()
+
+        # 멤버 집합별 결과 문자열 캐시 {set_id: 'a, b, ...'}
+        self._label_cache = {}
+        # 구간 조회용 (시작점 순 Reference 번호, 정렬된 시작점) - 처음 구간 조회 때 생성
+        self._start_order = None
+        # 시작점 순 위치별 끝점의 최대값 트리 - 멤버를 저장하지 않은 집합을 처음 조회할 때 생성
+        self._end_tree = None
+
+    @classmethod
+    def from_references(cls, reference_list: List[Dict]) -> 'IntervalIndex':
+        """파싱된 Reference 리스트로 인덱스 생성 (중복 Reference는 합침)"""
+        intervals = rank_references(reference_list)
+        index = cls(collapse_references(intervals))
+        index.stats['references_in'] = len(intervals)
+        return index
+
+    @classmethod
+    def from_arrays(cls, originals: Sequence[str], starts: Sequence[int], ends: Sequence[int],
+                    bounds: Sequence[int], segment_sets: Sequence[int],
+                    set_offsets: Sequence[int], set_members: Sequence[int]) -> 'IntervalIndex':
+        """
+        이미 계산된 배열로 인덱스 생성 (컴파일된 인덱스 파일 로드용, 재계산 없음)
+        배열은 array('I') 또는 mmap 위의 memoryview 등 정수 시퀀스면 된다.
+        """
+        index = cls.__new__(cls)
+        index.bits = IPV4_BITS
+        index.originals = originals
+        index.starts = starts
+        index.ends = ends
+        index.bounds = bounds
+        index.segment_sets = segment_sets
+        index.set_offsets = set_offsets
+        index.set_members = set_members
+        index.stats = None
+        index._label_cache = {}
+        index._start_order = None
+        index._set_points = None  # 멤버를 저장하지 않은 집합이 처음 조회될 때 segment_sets에서 찾음
+        index._end_tree = None
+        return index
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def __getstate__(self):
+        """pickle 시 mmap 기반 배열을 일반 배열로 복사 (spawn 워커 전달용)"""
+        state = self.__dict__.copy()
+        value_names = ('starts', 'ends', 'bounds') if self.bits == IPV4_BITS else ()
+        for name in value_names + ('segment_sets', 'set_offsets', 'set_members'):
+            state[name] = array('I', state[name])
+        state['originals'] = list(self.originals)
+        state['_label_cache'] = {}
+        state['_start_order'] = None
+        state['_end_tree'] = None
+        return state
+
+    def _build_segments(self) -> Dict[str, int]:
+        """
+        스윕 라인으로 경계값과 구간별 멤버 집합 생성
+
+        INLINE_SET_SIZE보다 큰 집합은 멤버 튜플 대신 Reference별 난수의 합(크기가 큰 동안 증분 갱신)으로
+        같은 집합을 판별하므로 구간마다 멤버를 정렬/복사하지 않는다. 멤버는 슬롯 상한 안에서만 저장한다.
+
+        Returns:
+            정규화 통계 (정규화 전/후 구간 수와 멤버 슬롯 수)
+        """
+        events = {}  # {boundary: ([추가 번호], [제거 번호])}
+        max_value = (1 << self.bits) - 1
+        for rank, (start_int, end_int) in enumerate(zip(self.starts, self.ends)):
+            event = events.get(start_int)
+            if event is None:
+                event = events[start_int] = ([], [])
+            event[0].append(rank)
+            if end_int < max_value:
+                event = events.get(end_int + 1)
+                if event is None:
+                    event = events[end_int + 1] = ([], [])
+                event[1].append(rank)
+
+        bounds = self.bounds
+        segment_sets = self.segment_sets
+        set_offsets = self.set_offsets
+        set_members = self.set_members
+        set_ids = {(): 0}  # {멤버 튜플: set_id} (작은 집합)
+        large_set_ids = {}  # {(크기, 난수 합): set_id} (큰 집합)
+        set_count = 1
+        slot_limit = MAX_SLOTS_PER_REFERENCE * len(self.originals)
+        # Reference별 128비트 난수 (합이 같은 서로 다른 집합은 사실상 생기지 않음) - 큰 집합이 처음 나올 때 생성
+        weights = None
+        weight_sum = None  # 큰 집합인 동안만 증분 갱신, 작은 집합이 되면 None
+        segments_in = 0
+        member_slots_in = 0
+        last_set_id = None
+        active = set()
+        for boundary in sorted(events):
+            added, removed = events[boundary]
+            if removed:
+                active.difference_update(removed)
+            active.update(added)
+
+            size = len(active)
+            segments_in += 1
+            member_slots_in += size
+
+            if size <= INLINE_SET_SIZE:
+                weight_sum = None
+                members = tuple(sorted(active))
+                set_id = set_ids.get(members)
+                if set_id is None:
+                    set_id = set_ids[members] = set_count
+                    set_count += 1
+                    set_members.extend(members)
+                    set_offsets.append(len(set_members))
+            else:
+                if weight_sum is None:
+                    if weights is None:
+                        rng = random.Random(len(self.originals))
+                        weights = [rng.getrandbits(128) for _ in range(len(self.originals))]
+                    weight_sum = sum(map(weights.__getitem__, active))
+                else:
+                    weight_sum += sum(map(weights.__getitem__, added)) - sum(map(weights.__getitem__, removed))
+                key = (size, weight_sum)
+                set_id = large_set_ids.get(key)
+                if set_id is None:
+                    set_id = large_set_ids[key] = set_count
+                    set_count += 1
+                    if len(set_members) + size <= slot_limit:
+                        set_members.extend(sorted(active))
+                    else:
+                        self._set_points[set_id] = boundary
+                    set_offsets.append(len(set_members))
+
+            # 같은 집합을 가리키는 인접 구간은 합침
+            if set_id == last_set_id:
+                continue
+            last_set_id = set_id
+            bounds.append(boundary)
+            segment_sets.append(set_id)
+
+        return {
+            'references_in': len(self.originals),
+            'references': len(self.originals),
+            'segments_in': segments_in,
+            'segments': len(self.bounds),
+            'member_slots_in': member_slots_in,
+            'member_slots': len(self.set_members),
+            'member_sets': set_count,
+            'lazy_sets': len(self._set_points),
+        }
+
+    def lookup(self, ip_int: int) -> Sequence[int]:
+        """
+        단일 IP를 포함하는 Reference 번호 반환
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            Reference 번호 시퀀스 (출력 순서)
+        """
+        segment_idx = bisect_right(self.bounds, ip_int) - 1
+        if segment_idx < 0:
+            return ()
+        return self.set_members_of(self.segment_sets[segment_idx])
+
+    def lookup_set(self, ip_int: int) -> int:
+        """
+        단일 IP가 속한 기본 구간의 멤버 집합 번호 반환
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            멤버 집합 번호 (어떤 구간에도 속하지 않으면 빈 집합 0)
+        """
+        segment_idx = bisect_right(self.bounds, ip_int) - 1
+        if segment_idx < 0:
+            return 0
+        return self.segment_sets[segment_idx]
+
+    def set_members_of(self, set_id: int) -> Sequence[int]:
+        """멤버 집합의 Reference 번호 (출력 순서)"""
+        start, stop = self.set_offsets[set_id], self.set_offsets[set_id + 1]
+        if start == stop and set_id:
+            # 슬롯 상한으로 멤버를 저장하지 않은 집합
+            return self._covering(self._set_point(set_id))
+        return self.set_members[start:stop]
+
+    def _set_point(self, set_id: int) -> int:
+        """멤버를 저장하지 않은 집합의 대표 주소 (파일에서 불러온 인덱스는 처음 호출 때 segment_sets에서 찾음)"""
+        if self._set_points is None:
+            offsets = self.set_offsets
+            points = {}
+            for boundary, segment_set in zip(self.bounds, self.segment_sets):
+                if segment_set and offsets[segment_set] == offsets[segment_set + 1]:
+                    points.setdefault(segment_set, boundary)
+            self._set_points = points
+        return self._set_points[set_id]
+
+    def _covering(self, ip_int: int) -> Sequence[int]:
+        """
+        주소를 덮는 Reference 번호 (출력 순서) - 저장된 멤버 집합을 쓰지 않는 조회
+
+        시작점이 ip_int 이하인 Reference(시작점 정렬 배열의 앞부분) 중 끝점이 ip_int 이상인 것을
+        최대 끝점 트리에서 끝점이 작은 부분 트리를 건너뛰며 찾는다 (O(k log R)).
+        """
+        start_order, sorted_starts = self._sorted_starts()
+        tree = self._max_end_tree()
+        leaf_base = len(tree) // 2
+        limit = bisect_right(sorted_starts, ip_int)
+        ranks = []
+        stack = [(1, 0, leaf_base)]  # (노드, 덮는 위치 [lo, hi))
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= limit or tree[node] < ip_int:
+                continue
+            if node >= leaf_base:
+                ranks.append(start_order[lo])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node, lo, mid))
+            stack.append((2 * node + 1, mid, hi))
+        ranks.sort()
+        return array('I', ranks)
+
+    def _max_end_tree(self) -> Sequence[int]:
+        """시작점 순 위치별 끝점의 최대값 트리 (1번이 루트, 잎은 leaf_base + 위치)"""
+        if self._end_tree is None:
+            start_order, _ = self._sorted_starts()
+            leaf_base = 1
+            while leaf_base < len(start_order):
+                leaf_base *= 2
+            tree = [0] * (2 * leaf_base)
+            ends = self.ends
+            for position, rank in enumerate(start_order):
+                tree[leaf_base + position] = ends[rank]
+            for node in range(leaf_base - 1, 0, -1):
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            self._end_tree = array('I', tree) if self.bits == IPV4_BITS else tree
+        return self._end_tree
+
+    def lookup_label(self, ip_int: int) -> str:
+        """
+        단일 IP의 매칭 결과 문자열 반환 (멤버 집합 단위로 캐시)
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        segment_idx = bisect_right(self.bounds, ip_int) - 1
+        if segment_idx < 0:
+            return ''
+        return self.set_label(self.segment_sets[segment_idx])
+
+    def segment_label(self, segment_idx: int) -> str:
+        """
+        기본 구간의 매칭 결과 문자열 반환
+
+        Args:
+            segment_idx: 기본 구간 번호 (bounds 위치)
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        return self.set_label(self.segment_sets[segment_idx])
+
+    def set_label(self, set_id: int) -> str:
+        """
+        멤버 집합의 매칭 결과 문자열 반환 (집합 단위로 캐시)
+
+        Args:
+            set_id: 멤버 집합 번호 (segment_sets 값)
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (빈 집합이면 빈 문자열)
+        """
+        label = self._label_cache.get(set_id)
+        if label is None:
+            originals = self.originals
+            members = self.set_members_of(set_id)
+            # 순서 유지하며 중복 제거
+            label = ', '.join(dict.fromkeys(originals[rank] for rank in members))
+            self._label_cache[set_id] = label
+        return label
+
+    def _sorted_starts(self) -> Tuple[Sequence[int], Sequence[int]]:
+        """(시작점 순 Reference 번호, 정렬된 시작점) - 처음 구간 조회 때 생성"""
+        if self._start_order is None:
+            make_values = (lambda values: array('I', values)) if self.bits == IPV4_BITS else list
+            order = sorted(range(len(self.starts)), key=self.starts.__getitem__)
+            self._start_order = (array('I', order), make_values(self.starts[rank] for rank in order))
+        return self._start_order
+
+    def _starts_within(self, start_int: int, end_int: int) -> Sequence[int]:
+        """시작점이 (start_int, end_int]에 있는 Reference 번호 (시작점 순)"""
+        start_order, sorted_starts = self._sorted_starts()
+        lo = bisect_right(sorted_starts, start_int)
+        hi = bisect_right(sorted_starts, end_int, lo)
+        return start_order[lo:hi]
+
+    def overlap(self, start_int: int, end_int: int) -> List[int]:
+        """
+        구간과 겹치는 Reference 번호 반환
+
+        겹치는 Reference는 start_int를 덮는 것(기본 구간의 멤버 집합)과
+        시작점이 (start_int, end_int]에 있는 것으로 빠짐없이, 서로 겹치지 않게 나뉜다.
+
+        Args:
+            start_int, end_int: 정수 구간 (Network/Range Source)
+
+        Returns:
+            Reference 번호 리스트 (출력 순서)
+        """
+        ranks = list(self.set_members_of(self.lookup_set(start_int)))
+        ranks.extend(self._starts_within(start_int, end_int))
+        ranks.sort()
+        return ranks
+
+    def overlaps(self, start_int: int, end_int: int) -> bool:
+        """구간과 겹치는 Reference가 있는지 (Reference 번호/결과 문자열을 만들지 않음, O(log R))"""
+        if self.lookup_set(start_int):
+            return True
+        _, sorted_starts = self._sorted_starts()
+        return bisect_right(sorted_starts, end_int) > bisect_right(sorted_starts, start_int)
+
+    def overlap_label(self, start_int: int, end_int: int) -> str:
+        """
+        구간과 겹치는 Reference 결과 문자열 반환 (포함/걸침 모두 매칭)
+
+        Args:
+            start_int, end_int: 정수 구간 (Network/Range Source)
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        set_id = self.lookup_set(start_int)
+        inner = self._starts_within(start_int, end_int)
+        if not inner:
+            # 구간 안에서 시작하는 Reference가 없으면 시작점의 집합과 같음 (집합 단위 캐시)
+            return self.set_label(set_id)
+        originals = self.originals
+        ranks = sorted(chain(self.set_members_of(set_id), inner))
+        # 순서 유지하며 중복 제거
+        return ', '.join(dict.fromkeys(originals[rank] for rank in ranks))
@@ -0,0 +1,86 @@
+"""IPv6 Reference 인덱스 (128비트 정수) 및 IPv4/IPv6 통합 인덱스"""
+from typing import List, Dict, Tuple, Union
+from core.interval_index import IntervalIndex, rank_references, collapse_references
+from core.parsed_list import ParsedList
+from core.prefix_index import PrefixHashIndex
+from utils.ip_utils import IPV6_BITS
+
+
+class IPv6Index:
+    """
+    IPv6 Reference 인덱스
+
+    IPv4와 같은 정렬 구간(bisect) 또는 prefix별 해시 테이블(hash) 조회를 128비트 정수로 수행한다.
+    - Single IP: lookup_index 조회
+    - Network/Range: 구간이 겹치는 Reference 전체 (정렬 구간 인덱스의 구간 조회, 출력 순서)
+    - 최장 prefix: prefix별 해시 테이블을 긴 prefix부터 조회 (필요할 때 생성)
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, str]], use_prefix_table: bool = False):
+        """
+        Args:
+            intervals: 출력 순서대로 정렬된 IPv6 [(start_int, end_int, original), ...]
+            use_prefix_table: True면 prefix별 해시 테이블, False면 정렬 구간 인덱스로 단일 IP 조회
+        """
+        self.originals = [original for _, _, original in intervals]
+        self.starts = [start_int for start_int, _, _ in intervals]
+        self.ends = [end_int for _, end_int, _ in intervals]
+
+        if use_prefix_table:
+            self._prefix_index = PrefixHashIndex(intervals, IPV6_BITS)
+            self.lookup_index = self._prefix_index
+        else:
+            self._prefix_index = None
+            self.lookup_index = IntervalIndex(intervals, IPV6_BITS)
+        # Network/Range 구간 조회용 정렬 구간 인덱스 (hash 조회면 필요할 때 생성)
+        self._overlap_index = None
+
+    @classmethod
+    def from_references(cls, reference_list: Union[List[Dict], ParsedList],
+                        engine: str = 'bisect') -> 'IPv6Index':
+        """
+        파싱된 Reference 리스트의 IPv6 항목으로 인덱스 생성
+
+        Args:
+            reference_list: 파싱된 Reference 리스트 (IPv4 항목은 무시)
+            engine: 'hash'/'trie'면 prefix별 해시 테이블, 그 외는 정렬 구간 인덱스
+        """
+        return cls(collapse_references(rank_references(reference_list, family=6)), engine in ('hash', 'trie'))
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def _intervals(self) -> List[Tuple[int, int, str]]:
+        return list(zip(self.starts, self.ends, self.originals))
+
+    def lookup_label(self, ip_int: int) -> str:
+        """단일 IPv6의 매칭 결과 문자열 (매칭 없으면 빈 문자열)"""
+        return self.lookup_index.lookup_label(ip_int)
+
+    def overlap_label(self, start_int: int, end_int: int) -> str:
+        """구간과 겹치는 Reference 문자열 (출력 순서, 매칭 없으면 빈 문자열)"""
+        if self._overlap_index is None:
+            lookup_index = self.lookup_index
+            self._overlap_index = (lookup_index if isinstance(lookup_index, IntervalIndex)
+                                   else IntervalIndex(self._intervals(), IPV6_BITS))
+        return self._overlap_index.overlap_label(start_int, end_int)
+
+    def lookup_longest_label(self, start_int: int, end_int: int) -> str:
+        """구간 전체를 포함하는 최장 prefix Reference 문자열 (매칭 없으면 빈 문자열)"""
+        if self._prefix_index is None:
+            self._prefix_index = PrefixHashIndex(self._intervals(), IPV6_BITS)
+        return self._prefix_index.lookup_longest_label(start_int, end_int)
+
+
+class DualStackIndex:
+    """
+    IPv4 인덱스와 IPv6 인덱스 묶음 (Reference에 IPv6가 있을 때 Matcher.build_index가 반환)
+    IPv4 Source는 v4(엔진별 인덱스), IPv6 Source는 v6(IPv6Index)로 조회한다.
+    """
+
+    def __init__(self, v4, v6: IPv6Index):
+        self.v4 = v4
+        self.v6 = v6
+
+    def __len__(self) -> int:
+        return len(self.v4) + len(self.v6)
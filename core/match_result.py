@@ -0,0 +1,193 @@
+"""컬럼형 매칭 결과 - 행별 dict/결과 문자열 대신 결과 번호 배열, 문자열은 표시/내보내기 시점에 생성"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from core.parsed_list import ParsedList
+
+
+class LabelTable:
+    """
+    결과 번호 → 매칭 Reference
+
+    - 0: 매칭 없음
+    - 1 ~ set_count-1: 정렬 구간 인덱스(IntervalIndex)의 멤버 집합 번호
+      멤버는 인덱스의 CSR 배열(set_offsets/set_members)에 있는 Reference 번호이며,
+      결과 문자열은 처음 요청될 때 인덱스의 집합별 캐시(set_label)로 만든다.
+    - set_count 이상: 멤버 집합이 없는 엔진(hash/trie/증분 인덱스/IPv6/그룹 비교)이 만든 결과 문자열
+      (같은 문자열은 같은 번호)
+
+    결과 번호는 같은 Reference에 대해서만 의미가 있으므로 MatchMemo가 Reference별로 하나를 보관한다.
+    """
+
+    def __init__(self, index=None):
+        """
+        Args:
+            index: 멤버 집합 번호를 그대로 결과 번호로 쓸 IntervalIndex (없으면 문자열 번호만 사용)
+        """
+        self.index = index
+        self.set_count = len(index.set_offsets) - 1 if index is not None else 1
+        self._labels = []  # 결과 문자열 (번호 set_count + i)
+        self._ids = {'': 0}  # {결과 문자열: 번호}
+
+    def __len__(self) -> int:
+        """문자열로 등록된 결과 수 (멤버 집합 번호 제외)"""
+        return len(self._labels)
+
+    def intern(self, label: str) -> int:
+        """결과 문자열의 번호 (처음 보는 문자열이면 새 번호)"""
+        label_id = self._ids.get(label)
+        if label_id is None:
+            label_id = self._ids[label] = self.set_count + len(self._labels)
+            self._labels.append(label)
+        return label_id
+
+    def label(self, label_id: int) -> str:
+        """결과 번호의 매칭 Reference 문자열 (콤마 구분, 매칭 없으면 빈 문자열)"""
+        if label_id < self.set_count:
+            return self.index.set_label(label_id) if label_id else ''
+        return self._labels[label_id - self.set_count]
+
+    def members(self, label_id: int) -> List[str]:
+        """결과 번호의 매칭 Reference original 리스트 (출력 순서, 중복 제거)"""
+        if not label_id:
+            return []
+        if label_id < self.set_count:
+            originals = self.index.originals
+            return list(dict.fromkeys(originals[rank] for rank in self.index.set_members_of(label_id)))
+        return self._labels[label_id - self.set_count].split(', ')
+
+
+class MatchResult:
+    """
+    매칭 결과 (Source 순서, 컬럼형)
+
+    - sources: Source 원본 문자열 (ParsedList면 복사 없이 그대로 참조, 그 외는 문자열 리스트)
+    - label_ids: 행별 결과 번호 array('I') (0이면 매칭 없음)
+    - table: 결과 번호 → 매칭 Reference (LabelTable)
+
+    행마다 {'source', 'matched_ips'} dict와 결과 문자열을 만들지 않으므로 메모리가 행당 수 바이트이다.
+    표시/내보내기는 rows()로 필요한 구간만 (source, matched_ips) 문자열로 바꾼다.
+    정수 인덱스 접근/순회 시에는 기존 코드와의 호환을 위해 dict를 만들어 반환하고,
+    slice는 MatchResult를 반환한다.
+    """
+
+    def __init__(self, sources: Union[ParsedList, Sequence[str]], label_ids: array, table: LabelTable):
+        self.sources = sources
+        self.label_ids = label_ids
+        self.table = table
+
+    @classmethod
+    def from_labels(cls, sources: Union[ParsedList, Sequence[str]], labels: Iterable[str],
+                    table: Optional[LabelTable] = None) -> 'MatchResult':
+        """결과 문자열 리스트로 생성 (문자열은 table에 번호로 등록)"""
+        table = table if table is not None else LabelTable()
+        intern = table.intern
+        return cls(sources, array('I', map(intern, labels)), table)
+
+    @classmethod
+    def from_dicts(cls, results: Sequence[Dict], table: Optional[LabelTable] = None) -> 'MatchResult':
+        """기존 형식 결과 리스트 [{'source', 'matched_ips'}, ...]로 생성"""
+        if isinstance(results, MatchResult) and (table is None or results.table is table):
+            return results
+        return cls.from_labels([result['source'] for result in results],
+                               [result['matched_ips'] for result in results], table)
+
+    @classmethod
+    def interleave(cls, sources: Union[ParsedList, Sequence[str]], is_second: Sequence[bool],
+                   first: Sequence[Dict], second: Sequence[Dict]) -> 'MatchResult':
+        """
+        두 결과를 위치별 선택 순서대로 합침 (IPv4/IPv6 결과를 원래 Source 순서로)
+
+        Args:
+            sources: 합친 결과의 Source 원본 (원래 순서)
+            is_second: 위치별로 second에서 가져올지 여부
+            first, second: 각 부분 결과 (MatchResult 또는 기존 형식 리스트)
+        """
+        first = cls.from_dicts(first)
+        second = cls.from_dicts(second, first.table)
+        ids = first.label_ids
+        if second.table is first.table:
+            second_ids = second.label_ids
+        else:
+            # 결과 번호 체계가 다르면 (병렬 매칭 등) 문자열로 바꿔 first 쪽에 등록
+            remap = {}
+            second_ids = array('I')
+            for label_id in second.label_ids:
+                new_id = remap.get(label_id)
+                if new_id is None:
+                    new_id = remap[label_id] = first.table.intern(second.table.label(label_id))
+                second_ids.append(new_id)
+        iter_first = iter(ids)
+        iter_second = iter(second_ids)
+        label_ids = array('I', [next(iter_second) if pick else next(iter_first) for pick in is_second])
+        return cls(sources, label_ids, first.table)
+
+    def __len__(self) -> int:
+        return len(self.label_ids)
+
+    def source(self, idx: int) -> str:
+        """idx번째 Source 원본 문자열"""
+        if isinstance(self.sources, ParsedList):
+            return self.sources.original(idx)
+        return self.sources[idx]
+
+    def label(self, idx: int) -> str:
+        """idx번째 행의 매칭 Reference 문자열"""
+        return self.table.label(self.label_ids[idx])
+
+    def members(self, idx: int) -> List[str]:
+        """idx번째 행의 매칭 Reference original 리스트"""
+        return self.table.members(self.label_ids[idx])
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """[start, stop) 행의 (source, matched_ips) 순회 (이때 결과 문자열 생성)"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        label = self.table.label
+        label_ids = self.label_ids
+        if isinstance(self.sources, ParsedList):
+            original = self.sources.original
+            return ((original(idx), label(label_ids[idx])) for idx in range(start, stop))
+        return zip(self.sources[start:stop], map(label, label_ids[start:stop]))
+
+    def matched_count(self) -> int:
+        """매칭된 행 수 (결과 문자열 없이 번호로 계산)"""
+        return len(self.label_ids) - self.label_ids.count(0)
+
+    def __getitem__(self, idx: Union[int, slice]):
+        """정수 인덱스는 dict(호환용), slice는 MatchResult 반환"""
+        if isinstance(idx, slice):
+            return MatchResult(self.sources[idx], self.label_ids[idx], self.table)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("MatchResult index out of range")
+        return {'source': self.source(idx), 'matched_ips': self.label(idx)}
+
+    def __iter__(self) -> Iterator[Dict]:
+        for source_original, matched_ips_str in self.rows():
+            yield {'source': source_original, 'matched_ips': matched_ips_str}
+
+    def __repr__(self) -> str:
+        return f"MatchResult({len(self)} rows, {self.matched_count()} matched)"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (MatchResult, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+def iter_rows(results: Sequence[Dict], start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """
+    매칭 결과의 [start, stop) 행을 (source, matched_ips)로 순회 (MatchResult/기존 dict 리스트 공용)
+    """
+    if isinstance(results, MatchResult):
+        return results.rows(start, stop)
+    return ((result.get('source', ''), result.get('matched_ips', '')) for result in results[start:stop])
+
+
+def count_matched(results: Sequence[Dict]) -> int:
+    """매칭된 행 수 (MatchResult는 결과 문자열을 만들지 않고 계산)"""
+    if isinstance(results, MatchResult):
+        return results.matched_count()
+    return sum(1 for result in results if result.get('matched_ips'))
@@ -1,14 +1,45 @@
 """IP 매칭 엔진 - 고성능 최적화 버전"""
-from typing import List, Dict, Optional, Callable
+from array import array
+from itertools import repeat
+from typing import List, Dict, Optional, Callable, Tuple, Iterator, Union
 import ipaddress
+from core.dir24_index import Dir24Index
+from core.interval_index import IntervalIndex, iter_reference_intervals
+from core.ipv6_index import IPv6Index, DualStackIndex
+from core.match_result import MatchResult
+from core.memo import MatchMemo
+from core.parsed_list import ParsedList
+from core.prefix_index import PrefixHashIndex
+from core.radix_trie import RadixTrie
+from core.vectorized import VectorizedIndex, HAS_NUMPY
+from utils.ip_utils import KIND_SINGLE, KIND_CIDR, KIND_V6, KIND_MASK, interval_to_parsed, is_ipv6_parsed
 
 
 class Matcher:
     """IP 매칭 엔진 클래스 - 고성능 최적화"""
     
+    # 사용 가능한 매칭 엔진 {이름: 인덱스 클래스} (legacy는 인덱스 없이 전체 비교)
+    ENGINES = {
+        'bisect': IntervalIndex,
+        'hash': PrefixHashIndex,
+        'trie': RadixTrie,
+        # NumPy가 없으면 같은 결과의 정렬 구간 인덱스로 대체
+        'numpy': VectorizedIndex if HAS_NUMPY else IntervalIndex,
+        # DIR-24-8 직접 조회 테이블 (1단계만 64MB, 대량 Single IP용)
+        'dir24': Dir24Index,
+        'legacy': None,
+    }
+    DEFAULT_ENGINE = 'bisect'
+    
+    # 인덱스 엔진의 진행률 콜백 주기 (Source 개수)
+    PROGRESS_INTERVAL = 1000
+    
     @staticmethod
     def match(source_list: List[Dict], reference_list: List[Dict], 
-              progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+              progress_callback: Optional[Callable[[int, int], None]] = None,
+              engine: str = DEFAULT_ENGINE,
+              index=None, longest_prefix_only: bool = False,
+              workers: int = 1, memo: Optional[MatchMemo] = None) -> MatchResult:
         """
         Source IP 리스트와 Reference 네트워크 리스트를 매칭 (고성능 최적화)
         
@@ -16,188 +47,750 @@ class Matcher:
             source_list: Source IP 리스트
             reference_list: Reference 네트워크 리스트
             progress_callback: 진행률 콜백 함수 (current, total)
+            engine: 매칭 엔진 이름 (Matcher.ENGINES 참고)
+            index: 미리 생성한 Reference 인덱스 (Matcher.build_index, 같은 엔진으로 생성)
+            longest_prefix_only: 겹치는 전체 대신 가장 구체적인 Reference만 반환 (trie 엔진 사용)
+            workers: 2 이상이면 인덱스를 한 번 만들고 Source를 나눠 여러 프로세스에서 매칭
+            memo: 같은 Source를 한 번만 매칭하기 위한 결과 메모 (없으면 호출마다 새로 생성)
+                  같은 Reference로 여러 번 매칭할 때 넘기면 재사용되고, 적중/미스 횟수를 확인할 수 있다.
+            
+        Returns:
+            매칭 결과 (MatchResult: 행별 결과 번호만 보관하고 결과 문자열은 접근할 때 생성,
+            순회/인덱스 접근 시 기존과 같은 {'source', 'matched_ips'} dict)
+            Source 또는 Reference가 비어 있으면 빈 리스트
+        """
+        if engine not in Matcher.ENGINES:
+            raise ValueError(f"알 수 없는 매칭 엔진: {engine}")
+        if memo is None:
+            memo = MatchMemo()
+        
+        # IPv6가 있으면 주소 체계별 인덱스로 나눠 매칭 (ParsedList는 O(1) 확인)
+        if (isinstance(index, DualStackIndex) or Matcher._has_ipv6(source_list)
+                or Matcher._has_ipv6(reference_list)):
+            return Matcher.match_dual_stack(source_list, reference_list, progress_callback, engine,
+                                            index, longest_prefix_only, workers, memo)
+        return Matcher._match_ipv4(source_list, reference_list, progress_callback, engine,
+                                   index, longest_prefix_only, workers, memo)
+    
+    @staticmethod
+    def _match_ipv4(source_list, reference_list, progress_callback, engine, index,
+                    longest_prefix_only, workers, memo=None) -> MatchResult:
+        """IPv4 Source 매칭 (Matcher.match 참고, Reference의 IPv6 항목은 무시)"""
+        if longest_prefix_only:
+            if not isinstance(index, RadixTrie):
+                index = None
+            return Matcher.match_longest_prefix(source_list, reference_list, progress_callback, index, memo)
+        
+        if Matcher.ENGINES[engine] is None:
+            return Matcher.match_ultra_optimized(source_list, reference_list, progress_callback, memo)
+        
+        if index is None and source_list and reference_list:
+            index = Matcher.ENGINES[engine].from_references(reference_list)
+        if index is None:
+            return []
+        if workers > 1:
+            from core.parallel import match_parallel
+            return match_parallel(source_list, reference_list, progress_callback, index, workers)
+        if isinstance(index, VectorizedIndex):
+            return Matcher.match_vectorized(source_list, reference_list, progress_callback, index, memo)
+        return Matcher.match_indexed(source_list, reference_list, progress_callback, index, memo)
+    
+    @staticmethod
+    def build_index(reference_list: List[Dict], engine: str = DEFAULT_ENGINE):
+        """
+        Reference 리스트로 단일 IP 조회용 인덱스 생성
+        
+        Args:
+            reference_list: Reference 네트워크 리스트
+            engine: 매칭 엔진 이름 ('bisect': 정렬 구간, 'hash': prefix별 해시 테이블, 'trie': radix 트라이,
+                    'numpy': NumPy 배치, 'dir24': 2단계 직접 조회 테이블)
+            
+        Returns:
+            엔진별 인덱스 (IntervalIndex, PrefixHashIndex, RadixTrie, VectorizedIndex, Dir24Index)
+            Reference에 IPv6가 있으면 IPv4 인덱스와 IPv6Index를 묶은 DualStackIndex
+        """
+        index_class = Matcher.ENGINES.get(engine)
+        if index_class is None:
+            raise ValueError(f"인덱스를 사용하지 않는 매칭 엔진: {engine}")
+        index = index_class.from_references(reference_list)
+        if Matcher._has_ipv6(reference_list):
+            return DualStackIndex(index, IPv6Index.from_references(reference_list, engine))
+        return index
+    
+    @staticmethod
+    def _has_ipv6(items) -> bool:
+        """IPv6 항목 포함 여부 (ParsedList는 O(1), dict 리스트는 순회)"""
+        if isinstance(items, ParsedList):
+            return items.has_ipv6()
+        return any(is_ipv6_parsed(item['parsed']) for item in items)
+    
+    @staticmethod
+    def match_dual_stack(source_list, reference_list,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         engine: str = DEFAULT_ENGINE, index=None,
+                         longest_prefix_only: bool = False, workers: int = 1,
+                         memo: Optional[MatchMemo] = None) -> MatchResult:
+        """
+        IPv4/IPv6 혼합 매칭
+        Source를 주소 체계별로 나눠 IPv4는 기존 엔진, IPv6는 IPv6Index로 매칭한 뒤 원래 순서로 합친다.
+        
+        Args:
+            Matcher.match와 동일 (index는 DualStackIndex 또는 IPv4 인덱스)
+            
+        Returns:
+            매칭 결과 리스트
+        """
+        if not source_list or (not reference_list and index is None):
+            return []
+        
+        if isinstance(index, DualStackIndex):
+            index, index6 = index.v4, index.v6
+        else:
+            index6 = None
+        
+        # IPv6 Source가 없으면 나누지 않고 그대로 IPv4 매칭
+        if not Matcher._has_ipv6(source_list):
+            return Matcher._match_ipv4(source_list, reference_list, progress_callback, engine,
+                                       index, longest_prefix_only, workers, memo)
+        
+        v4_sources, v6_sources, is_v6 = Matcher._split_families(source_list)
+        total_sources = len(is_v6)
+        v4_count = len(v4_sources)
+        
+        results4 = []
+        if v4_sources:
+            v4_progress = None
+            if progress_callback:
+                v4_progress = lambda current, total: progress_callback(current, total_sources)  # noqa: E731
+            results4 = Matcher._match_ipv4(v4_sources, reference_list, v4_progress, engine,
+                                           index, longest_prefix_only, workers, memo)
+        
+        if index6 is None:
+            index6 = IPv6Index.from_references(reference_list, 'trie' if longest_prefix_only else engine)
+        v6_progress = None
+        if progress_callback:
+            v6_progress = lambda current, total: progress_callback(v4_count + current, total_sources)  # noqa: E731
+        results6 = Matcher.match_ipv6(v6_sources, index6, v6_progress, longest_prefix_only, memo)
+        
+        # 원래 Source 순서로 합침 (결과 번호 배열만 섞음)
+        return MatchResult.interleave(Matcher._source_column(source_list), is_v6, results4, results6)
+    
+    @staticmethod
+    def _split_families(source_list) -> Tuple[object, object, List[bool]]:
+        """
+        Source를 주소 체계별로 분리
+        
+        Returns:
+            (IPv4 Source, IPv6 Source, 위치별 IPv6 여부) - 입력이 ParsedList면 ParsedList로 반환
+        """
+        if isinstance(source_list, ParsedList):
+            if source_list.ipv6_count() == len(source_list):
+                return ParsedList(), source_list, [True] * len(source_list)
+            v4_sources = ParsedList()
+            v6_sources = ParsedList()
+            is_v6 = []
+            for source_original, (start_int, end_int, kind) in zip(source_list.originals(), source_list.intervals()):
+                v6 = bool(kind & KIND_V6)
+                (v6_sources if v6 else v4_sources).append(source_original, start_int, end_int, kind)
+                is_v6.append(v6)
+            return v4_sources, v6_sources, is_v6
+        
+        is_v6 = [is_ipv6_parsed(source['parsed']) for source in source_list]
+        v4_sources = [source for source, v6 in zip(source_list, is_v6) if not v6]
+        v6_sources = [source for source, v6 in zip(source_list, is_v6) if v6]
+        return v4_sources, v6_sources, is_v6
+    
+    @staticmethod
+    def count_matches(source_list, reference_list, index=None,
+                      memo: Optional[MatchMemo] = None) -> Dict[str, int]:
+        """
+        매칭된/매칭되지 않은 Source 수만 계산 (행별 결과 번호와 결과 문자열을 만들지 않음)
+        - IPv4 Single IP: 커버리지 비트맵으로 먼저 거르고, 통과한 것만 인덱스로 확인
+        - IPv4 Network/Range: 겹치는 Reference가 있는지만 확인 (IntervalIndex.overlaps)
+        - IPv6: IPv6Index 조회 결과로 판정
+        
+        Args:
+            source_list: Source IP 리스트
+            reference_list: Reference 네트워크 리스트
+            index: 미리 생성한 Reference 인덱스 (DualStackIndex 또는 IPv4 인덱스, 없으면 정렬 구간 인덱스 생성)
+            memo: 커버리지 비트맵을 보관할 메모 (같은 Reference로 여러 번 셀 때 재사용)
+            
+        Returns:
+            {'total': Source 수, 'matched': 매칭된 수, 'unmatched': 매칭되지 않은 수}
+        """
+        total_sources = len(source_list)
+        if not source_list or (not reference_list and index is None):
+            return {'total': total_sources, 'matched': 0, 'unmatched': total_sources}
+        if memo is None:
+            memo = MatchMemo()
+        
+        index6 = None
+        if isinstance(index, DualStackIndex):
+            index, index6 = index.v4, index.v6
+        if index is None:
+            index = IntervalIndex.from_references(reference_list)
+        
+        # 결과 문자열 없이 매칭 여부만 확인할 수 있으면 사용 (멤버 집합 번호 0 = 매칭 없음)
+        single_hit = getattr(index, 'lookup_set', index.lookup_label)
+        set_index = getattr(index, 'interval', index)
+        if isinstance(set_index, IntervalIndex):
+            span_hit = set_index.overlaps
+        else:
+            span_hit = Matcher._overlap_labeler(index, reference_list)
+        grouped_label = Matcher._grouped_labeler(reference_list)
+        coverage_bits = memo.coverage(reference_list).bits if reference_list else None
+        
+        matched = 0
+        for _, source_int, source_parsed in Matcher._iter_sources(source_list, originals=False):
+            if source_int is not None:
+                if coverage_bits is not None and not (coverage_bits[source_int >> 11] >> ((source_int >> 8) & 7)) & 1:
+                    continue
+                hit = single_hit(source_int)
+            elif isinstance(source_parsed, set):
+                hit = grouped_label(source_parsed)
+            elif is_ipv6_parsed(source_parsed):
+                if index6 is None:
+                    index6 = IPv6Index.from_references(reference_list)
+                if isinstance(source_parsed, ipaddress.IPv6Address):
+                    hit = index6.lookup_label(int(source_parsed))
+                elif isinstance(source_parsed, tuple):
+                    hit = index6.overlap_label(int(source_parsed[0]), int(source_parsed[1]))
+                else:
+                    hit = index6.overlap_label(int(source_parsed.network_address),
+                                               int(source_parsed.broadcast_address))
+            else:
+                hit = span_hit(*Matcher._source_span(source_parsed))
+            if hit:
+                matched += 1
+        
+        return {'total': total_sources, 'matched': matched, 'unmatched': total_sources - matched}
+    
+    @staticmethod
+    def match_ipv6(source_list, index: IPv6Index,
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   longest_prefix_only: bool = False, memo: Optional[MatchMemo] = None) -> MatchResult:
+        """
+        IPv6 Source 매칭
+        - Single IP: 인덱스 조회 (정렬 구간 또는 prefix 해시)
+        - Network/Range: 구간이 겹치는 Reference 전체
+        - 최장 prefix 모드: 구간 전체를 포함하는 최장 prefix Reference
+        
+        Args:
+            source_list: IPv6 Source 리스트
+            index: IPv6Index
+            progress_callback: 진행률 콜백 함수
+            longest_prefix_only: 최장 prefix만 반환
+            memo: Source 구간별 결과 메모 (없으면 새로 생성)
+            
+        Returns:
+            매칭 결과 리스트
+        """
+        if memo is None:
+            memo = MatchMemo()
+        intern = memo.label_table().intern
+        
+        def span_label_id(start_int: int, end_int: int, kind: int) -> int:
+            if longest_prefix_only:
+                return intern(index.lookup_longest_label(start_int, end_int))
+            if kind & KIND_MASK == KIND_SINGLE:
+                return intern(index.lookup_label(start_int))
+            return intern(index.overlap_label(start_int, end_int))
+        
+        span_label_id = memo.cached('v6_longest' if longest_prefix_only else 'v6', span_label_id)
+        label_ids = array('I')
+        total_sources = len(source_list)
+        progress_interval = Matcher.PROGRESS_INTERVAL
+        
+        for idx, (start_int, end_int, kind, _) in enumerate(iter_reference_intervals(source_list)):
+            label_ids.append(span_label_id(start_int, end_int, kind))
+            
+            if progress_callback and (idx % progress_interval == 0 or idx == total_sources - 1):
+                progress_callback(idx + 1, total_sources)
+        
+        return MatchResult(Matcher._source_column(source_list), label_ids, memo.label_table())
+    
+    @staticmethod
+    def match_indexed(source_list: List[Dict], reference_list: List[Dict],
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      index=None, memo: Optional[MatchMemo] = None) -> MatchResult:
+        """
+        인덱스 기반 매칭
+        - Single IP: 인덱스 조회 (bisect: O(log R + k), hash: prefix 길이별 dict 조회, trie: O(32),
+          dir24: 배열 읽기 두 번 - 메모 dict보다 빨라 메모 없이 조회)
+        - Network/Range: 구간 겹침 조회 (정렬 구간 인덱스의 overlap_label, O(log R + k))
+        
+        결과는 match_ultra_optimized와 동일하다.
+        
+        Args:
+            source_list: Source IP 리스트
+            reference_list: Reference 네트워크 리스트
+            progress_callback: 진행률 콜백 함수
+            index: 미리 생성한 Reference 인덱스 (없으면 정렬 구간 인덱스 생성)
+                   인덱스를 주면 Single IP Source는 reference_list 없이도 매칭된다.
+            memo: Source별 결과 메모 (없으면 새로 생성, 같은 Source는 한 번만 조회)
+            
+        Returns:
+            매칭 결과 (정렬 구간 인덱스면 결과 번호가 멤버 집합 번호라 결과 문자열은 접근할 때 생성)
+        """
+        if not source_list or (not reference_list and index is None):
+            return []
+        
+        if index is None:
+            index = IntervalIndex.from_references(reference_list)
+        if memo is None:
+            memo = MatchMemo()
+        
+        direct = isinstance(index, Dir24Index)
+        set_index = index.interval if direct else index
+        table = memo.label_table(set_index if isinstance(set_index, IntervalIndex) else None)
+        if table.index is set_index:
+            # 멤버 집합 번호가 곧 결과 번호 (결과 문자열을 만들지 않음)
+            lookup_id = index.lookup_set
+        else:
+            lookup_label = index.lookup_label
+            intern = table.intern
+            lookup_id = lambda source_int: intern(lookup_label(source_int))  # noqa: E731
+        # 덮는 Reference가 없는 /24의 Single IP는 조회/메모 없이 매칭 없음 (Reference가 있을 때만)
+        coverage_bits = memo.coverage(reference_list).bits if reference_list and not direct else None
+        single_ids = memo.table('single')  # Single IP는 dict로 바로 조회 (함수 래퍼 비용 없음)
+        memo_size = memo.max_size
+        grouped_id = memo.cached('grouped', Matcher._grouped_label_ids(reference_list, table))
+        overlap_label = Matcher._overlap_labeler(index, reference_list)
+        intern_label = table.intern
+        
+        def overlap_id(start_int: int, end_int: int) -> int:
+            return intern_label(overlap_label(start_int, end_int))
+        
+        overlap_id = memo.cached('overlap', overlap_id)
+        span_count = 0
+        single_misses = 0
+        filtered = 0
+        label_ids = array('I')
+        append = label_ids.append
+        total_sources = len(source_list)
+        progress_interval = Matcher.PROGRESS_INTERVAL
+        
+        for idx, (_, source_int, source_parsed) in enumerate(Matcher._iter_sources(source_list, originals=False)):
+            if direct and source_int is not None:
+                label_id = lookup_id(source_int)
+            elif source_int is not None:
+                if coverage_bits is not None and not (coverage_bits[source_int >> 11] >> ((source_int >> 8) & 7)) & 1:
+                    # 비트맵 확인 (CoverageBitmap.may_match를 함수 호출 없이)
+                    filtered += 1
+                    label_id = 0
+                else:
+                    label_id = single_ids.get(source_int)
+                    if label_id is None:
+                        if len(single_ids) >= memo_size:
+                            single_ids.clear()
+                        single_misses += 1
+                        label_id = single_ids[source_int] = lookup_id(source_int)
+            elif isinstance(source_parsed, set):
+                # Set(하위 호환)은 해시할 수 없으므로 메모 없이 매칭
+                span_count += 1
+                label_id = grouped_id.__wrapped__(source_parsed)
+            else:
+                span_count += 1
+                label_id = overlap_id(*Matcher._source_span(source_parsed))
+            append(label_id)
+            
+            if progress_callback and (idx % progress_interval == 0 or idx == total_sources - 1):
+                progress_callback(idx + 1, total_sources)
+        
+        if not direct:
+            memo.record(total_sources - span_count - filtered, single_misses)
+        return MatchResult(Matcher._source_column(source_list), label_ids, table)
+    
+    @staticmethod
+    def match_vectorized(source_list: List[Dict], reference_list: List[Dict],
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         index: Optional[VectorizedIndex] = None,
+                         memo: Optional[MatchMemo] = None) -> MatchResult:
+        """
+        NumPy 벡터화 배치 매칭
+        Source를 배치 단위 정수 배열로 바꿔 searchsorted/불리언 마스크로 매칭한다.
+        결과는 match_ultra_optimized와 동일하다.
+        
+        Args:
+            source_list: Source IP 리스트
+            reference_list: Reference 네트워크 리스트
+            progress_callback: 진행률 콜백 함수 (배치마다 호출)
+            index: 미리 생성한 VectorizedIndex (없으면 생성)
+            memo: Network/Range Source 결과 메모 (Single IP는 배치 안에서 고유 구간별로 한 번만 계산)
+            
+        Returns:
+            매칭 결과 (ParsedList Source는 행별 멤버 집합 번호 배열을 그대로 사용)
+        """
+        if not source_list or not reference_list:
+            return []
+        
+        if index is None:
+            index = VectorizedIndex.from_references(reference_list)
+        if memo is None:
+            memo = MatchMemo()
+        table = memo.label_table(index.interval)
+        
+        if isinstance(source_list, ParsedList):
+            # 컬럼을 그대로 사용 (Set 타입이 없으므로 None 결과도 없음)
+            label_ids = index.match_column_ids(source_list, table, progress_callback, memo)
+            return MatchResult(source_list, label_ids, table)
+        
+        parsed_list = [source['parsed'] for source in source_list]
+        labels = index.match_labels(parsed_list, progress_callback)
+        
+        grouped_label = None  # 하위 호환 타입(Set)이 있을 때만 기존 그룹 구조 생성
+        for position, (source, matched_ips_str) in enumerate(zip(source_list, labels)):
+            if matched_ips_str is None:
+                if grouped_label is None:
+                    grouped_label = Matcher._grouped_labeler(reference_list)
+                labels[position] = grouped_label(source['parsed'])
+        
+        return MatchResult.from_labels(Matcher._source_column(source_list), labels, table)
+    
+    @staticmethod
+    def match_longest_prefix(source_list: List[Dict], reference_list: List[Dict],
+                             progress_callback: Optional[Callable[[int, int], None]] = None,
+                             index: Optional[RadixTrie] = None,
+                             memo: Optional[MatchMemo] = None) -> MatchResult:
+        """
+        최장 prefix 매칭 (라우팅 감사용)
+        Source 전체를 포함하는 Reference 중 가장 구체적인 것만 반환한다.
+        - Single IP: IP를 포함하는 최장 prefix
+        - Network/Range: 구간 전체를 포함하는 최장 prefix (Range Reference는 분해된 CIDR 블록 기준)
+        
+        Args:
+            source_list: Source IP 리스트
+            reference_list: Reference 네트워크 리스트
+            progress_callback: 진행률 콜백 함수
+            index: 미리 생성한 RadixTrie (없으면 생성)
+            memo: Source 구간별 결과 메모 (없으면 새로 생성)
             
         Returns:
             매칭 결과 리스트
         """
-        return Matcher.match_ultra_optimized(source_list, reference_list, progress_callback)
+        if not source_list or not reference_list:
+            return []
+        
+        if index is None:
+            index = RadixTrie.from_references(reference_list)
+        if memo is None:
+            memo = MatchMemo()
+        
+        table = memo.label_table()
+        intern = table.intern
+        lookup_longest_label = index.lookup_longest_label
+        
+        def longest_label_id(start_int: int, end_int: int) -> int:
+            return intern(lookup_longest_label(start_int, end_int))
+        
+        longest_label_id = memo.cached('longest', longest_label_id)
+        label_ids = array('I')
+        total_sources = len(source_list)
+        progress_interval = Matcher.PROGRESS_INTERVAL
+        
+        if isinstance(source_list, ParsedList):
+            spans = zip(source_list.starts, source_list.ends)
+        else:
+            spans = (Matcher._source_span(source['parsed']) for source in source_list)
+        
+        for idx, span in enumerate(spans):
+            label_ids.append(longest_label_id(*span) if span else 0)
+            
+            if progress_callback and (idx % progress_interval == 0 or idx == total_sources - 1):
+                progress_callback(idx + 1, total_sources)
+        
+        return MatchResult(Matcher._source_column(source_list), label_ids, table)
+    
+    @staticmethod
+    def _source_column(source_list) -> Union[ParsedList, List[str]]:
+        """결과의 Source 원본 컬럼 (ParsedList는 그대로, dict 리스트는 original 리스트)"""
+        if isinstance(source_list, ParsedList):
+            return source_list
+        return [source['original'] for source in source_list]
+    
+    @staticmethod
+    def _iter_sources(source_list, originals: bool = True) -> Iterator[Tuple[Optional[str], Optional[int], object]]:
+        """
+        Source를 (original, source_int, source_parsed)로 순회
+        Single IP는 source_int에 정수를 담고, 그 외에는 source_int가 None이다.
+        ParsedList는 Single IP에 대해 ipaddress 객체를 만들지 않고,
+        originals=False면 원본 문자열도 만들지 않는다 (original은 None).
+        """
+        if isinstance(source_list, ParsedList):
+            names = source_list.originals() if originals else repeat(None)
+            for source_original, (start_int, end_int, kind) in zip(names, source_list.intervals()):
+                if kind == KIND_SINGLE:
+                    yield source_original, start_int, None
+                else:
+                    yield source_original, None, interval_to_parsed(start_int, end_int, kind)
+            return
+        
+        for source in source_list:
+            source_parsed = source['parsed']
+            if isinstance(source_parsed, ipaddress.IPv4Address):
+                yield source['original'], int(source_parsed), source_parsed
+            else:
+                yield source['original'], None, source_parsed
+    
+    @staticmethod
+    def _source_span(source_parsed) -> Optional[Tuple[int, int]]:
+        """
+        파싱된 Source를 (start_int, end_int) 정수 구간으로 변환
+        
+        Returns:
+            (start_int, end_int) 또는 None (빈 Set 등)
+        """
+        if isinstance(source_parsed, ipaddress.IPv4Address):
+            source_int = int(source_parsed)
+            return (source_int, source_int)
+        if isinstance(source_parsed, ipaddress.IPv4Network):
+            return (int(source_parsed.network_address), int(source_parsed.broadcast_address))
+        if isinstance(source_parsed, tuple):
+            return source_parsed
+        if isinstance(source_parsed, set) and source_parsed:
+            return (int(min(source_parsed)), int(max(source_parsed)))
+        return None
     
     @staticmethod
     def match_ultra_optimized(source_list: List[Dict], reference_list: List[Dict],
-                              progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+                              progress_callback: Optional[Callable[[int, int], None]] = None,
+                              memo: Optional[MatchMemo] = None) -> MatchResult:
         """
         초고성능 최적화 매칭
         - Network: prefix 길이별 그룹화 및 정수 변환으로 빠른 비교
         - Address: set으로 O(1) 조회
         - Range: 정수 범위로 변환하여 빠른 비교
+        - Single IP는 먼저 커버리지 비트맵으로 확인하여, 덮는 Reference가 없는 /24면 비교 없이 매칭 없음
         
         Args:
             source_list: Source IP 리스트
             reference_list: Reference 네트워크 리스트
             progress_callback: 진행률 콜백 함수
+            memo: Source별 결과 메모 (없으면 새로 생성, 같은 Source는 한 번만 비교, 커버리지 비트맵 보관)
             
         Returns:
             매칭 결과 리스트
         """
         if not source_list or not reference_list:
             return []
+        if memo is None:
+            memo = MatchMemo()
         
         # Reference를 타입별로 그룹화 및 최적화
+        groups = Matcher._group_references(reference_list)
+        table = memo.label_table()
+        grouped_id = memo.cached('grouped', Matcher._grouped_label_ids(reference_list, table, groups))
+        may_match = memo.coverage(reference_list).may_match
+        
+        label_ids = array('I')
+        total_sources = len(source_list)
+        
+        # Source별로 매칭 수행
+        for idx, source in enumerate(source_list):
+            source_parsed = source['parsed']
+            
+            # 덮는 Reference가 없는 /24의 Single IP는 비교 없이 매칭 없음
+            # 같은 Source는 메모에서 재사용 (Set은 해시할 수 없으므로 매번 비교)
+            if isinstance(source_parsed, ipaddress.IPv4Address) and not may_match(int(source_parsed)):
+                label_ids.append(0)
+            elif isinstance(source_parsed, set):
+                label_ids.append(grouped_id.__wrapped__(source_parsed))
+            else:
+                label_ids.append(grouped_id(source_parsed))
+            
+            # 진행률 콜백 호출 (매 20개마다 또는 마지막) - Source 하나의 비교 비용이 커서 자주 기록 (취소 확인 주기)
+            if progress_callback and (idx % 20 == 0 or idx == total_sources - 1):
+                progress_callback(idx + 1, total_sources)
+        
+        return MatchResult(Matcher._source_column(source_list), label_ids, table)
+    
+    @staticmethod
+    def _grouped_labeler(reference_list: List[Dict], groups: Optional[Tuple] = None) -> Callable[[object], str]:
+        """
+        기존 그룹 비교 방식으로 Source 하나의 결과 문자열을 만드는 함수 반환
+        
+        Args:
+            reference_list: Reference 네트워크 리스트
+            groups: 미리 만든 _group_references 결과 (없으면 처음 호출할 때 생성)
+            
+        Returns:
+            source_parsed → 콤마로 구분된 매칭 Reference 문자열
+        """
+        groups = list(groups) if groups is not None else []
+        
+        def grouped_label(source_parsed) -> str:
+            if not groups:
+                groups.extend(Matcher._group_references(reference_list))
+            matched_ips = Matcher._match_grouped(source_parsed, *groups)
+            if not matched_ips:
+                return ''
+            # 순서 유지하며 중복 제거
+            return ', '.join(dict.fromkeys(matched_ips))
+        
+        return grouped_label
+    
+    @staticmethod
+    def _overlap_labeler(index, reference_list: List[Dict]) -> Callable[[int, int], str]:
+        """
+        Network/Range 구간의 결과 문자열을 만드는 함수 반환
+        
+        구간 조회를 지원하는 인덱스(정렬 구간, 증분)는 그대로 사용하고,
+        그 외(hash/trie)는 처음 호출할 때 Reference로 정렬 구간 인덱스를 만든다.
+        
+        Returns:
+            (start_int, end_int) → 콤마로 구분된 매칭 Reference 문자열
+        """
+        if hasattr(index, 'overlap_label'):
+            return index.overlap_label
+        overlap_index = []
+        
+        def overlap_label(start_int: int, end_int: int) -> str:
+            if not overlap_index:
+                overlap_index.append(IntervalIndex.from_references(reference_list))
+            return overlap_index[0].overlap_label(start_int, end_int)
+        
+        return overlap_label
+    
+    @staticmethod
+    def _grouped_label_ids(reference_list: List[Dict], table, groups: Optional[Tuple] = None) -> Callable[[object], int]:
+        """
+        _grouped_labeler의 결과 문자열을 결과 번호로 바꿔 반환하는 함수 (메모 값은 결과 번호)
+        
+        Args:
+            reference_list: Reference 네트워크 리스트
+            table: 결과 번호 표 (LabelTable)
+            groups: 미리 만든 _group_references 결과
+        """
+        grouped_label = Matcher._grouped_labeler(reference_list, groups)
+        intern = table.intern
+        
+        def grouped_label_id(source_parsed) -> int:
+            return intern(grouped_label(source_parsed))
+        
+        return grouped_label_id
+    
+    @staticmethod
+    def _group_references(reference_list: List[Dict]) -> Tuple[Dict, Dict, List]:
+        """
+        Reference를 타입별로 그룹화
+        
+        Returns:
+            (network_groups, address_set, range_list)
+        """
         network_groups = {}  # prefix 길이별로 그룹화 {prefix_len: [(network_int, original), ...]}
         address_set = {}  # {int(ip): original}
         range_list = []  # [(start_int, end_int, original), ...]
+        seen = set()  # 중복 Reference (같은 구간 + 같은 original)는 한 번만 넣음
         
-        for ref in reference_list:
-            ref_parsed = ref['parsed']
-            ref_original = ref['original']
-            
-            if isinstance(ref_parsed, ipaddress.IPv4Network):
+        # Set 타입(하위 호환성)은 iter_reference_intervals에서 Range로 변환됨
+        for entry in iter_reference_intervals(reference_list):
+            start_int, end_int, kind, ref_original = entry
+            if kind & KIND_V6:
+                # IPv6 Reference는 IPv6Index에서 처리
+                continue
+            if entry in seen:
+                continue
+            seen.add(entry)
+            if kind == KIND_CIDR:
                 # Network: prefix 길이별로 그룹화
-                prefix_len = ref_parsed.prefixlen
-                network_int = int(ref_parsed.network_address)
+                prefix_len = 32 - (end_int - start_int).bit_length()
                 network_mask = (0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF
                 
                 if prefix_len not in network_groups:
                     network_groups[prefix_len] = []
-                network_groups[prefix_len].append((network_int, network_mask, ref_original))
+                network_groups[prefix_len].append((start_int, network_mask, ref_original))
                 
-            elif isinstance(ref_parsed, ipaddress.IPv4Address):
-                # Address: 정수로 변환하여 dict에 저장 (O(1) 조회)
-                addr_int = int(ref_parsed)
-                address_set[addr_int] = ref_original
+            elif kind == KIND_SINGLE:
+                # Address: 정수로 dict에 저장 (O(1) 조회)
+                address_set[start_int] = ref_original
                 
-            elif isinstance(ref_parsed, tuple):
+            else:
                 # Range: (start_int, end_int) 튜플
-                start_int, end_int = ref_parsed
                 range_list.append((start_int, end_int, ref_original))
-            elif isinstance(ref_parsed, set):
-                # Set 타입 (하위 호환성)
-                if ref_parsed:
-                    sorted_ips = sorted(ref_parsed)
-                    start_int = int(sorted_ips[0])
-                    end_int = int(sorted_ips[-1])
-                    range_list.append((start_int, end_int, ref_original))
-        
-        results = []
-        total_sources = len(source_list)
         
-        # Source별로 매칭 수행
-        for idx, source in enumerate(source_list):
-            source_parsed = source['parsed']
-            source_original = source['original']
-            
-            matched_ips = []
-            
-            # Source를 정수로 변환
-            if isinstance(source_parsed, ipaddress.IPv4Address):
-                source_int = int(source_parsed)
-                
-                # 1. Address 매칭 (O(1))
-                if source_int in address_set:
-                    matched_ips.append(address_set[source_int])
-                
-                # 2. Network 매칭 (prefix 길이별로 그룹화하여 빠른 검색)
-                for prefix_len in sorted(network_groups.keys(), reverse=True):
-                    # 더 긴 prefix부터 확인 (더 구체적인 네트워크 우선)
-                    for network_int, network_mask, ref_original in network_groups[prefix_len]:
-                        if (source_int & network_mask) == network_int:
-                            matched_ips.append(ref_original)
-                            # 여러 매칭 허용 (break 제거)
-                
-                # 3. Range 매칭
-                for start_int, end_int, ref_original in range_list:
-                    if start_int <= source_int <= end_int:
-                        matched_ips.append(ref_original)
-                        
-            elif isinstance(source_parsed, ipaddress.IPv4Network):
-                # Network vs Network/Address/Range 매칭
-                source_network_int = int(source_parsed.network_address)
-                source_prefix_len = source_parsed.prefixlen
-                source_mask = (0xFFFFFFFF << (32 - source_prefix_len)) & 0xFFFFFFFF
-                
-                # Network 매칭
-                for prefix_len in network_groups.keys():
-                    for network_int, network_mask, ref_original in network_groups[prefix_len]:
-                        # 네트워크 겹침 확인
-                        if (source_network_int & network_mask) == network_int or \
-                           (network_int & source_mask) == source_network_int:
-                            matched_ips.append(ref_original)
-                
-                # Address 매칭 (Network에 포함되는지)
-                for addr_int, ref_original in address_set.items():
-                    if (addr_int & source_mask) == source_network_int:
-                        matched_ips.append(ref_original)
-                
-                # Range 매칭
-                for start_int, end_int, ref_original in range_list:
-                    # Range의 시작/끝이 Network에 포함되는지 확인
-                    if (start_int & source_mask) == source_network_int or \
-                       (end_int & source_mask) == source_network_int:
+        return network_groups, address_set, range_list
+    
+    @staticmethod
+    def _match_grouped(source_parsed, network_groups: Dict, address_set: Dict, range_list: List) -> List[str]:
+        """
+        그룹화된 Reference에 대해 Source 하나를 매칭
+        
+        Returns:
+            매칭된 Reference original 리스트 (중복 포함)
+        """
+        matched_ips = []
+        
+        # Source를 정수로 변환
+        if isinstance(source_parsed, ipaddress.IPv4Address):
+            source_int = int(source_parsed)
+        
+            # 1. Address 매칭 (O(1))
+            if source_int in address_set:
+                matched_ips.append(address_set[source_int])
+        
+            # 2. Network 매칭 (prefix 길이별로 그룹화하여 빠른 검색)
+            for prefix_len in sorted(network_groups.keys(), reverse=True):
+                # 더 긴 prefix부터 확인 (더 구체적인 네트워크 우선)
+                for network_int, network_mask, ref_original in network_groups[prefix_len]:
+                    if (source_int & network_mask) == network_int:
                         matched_ips.append(ref_original)
-                        
-            elif isinstance(source_parsed, tuple):
-                # Range vs Network/Address/Range 매칭
+                        # 여러 매칭 허용 (break 제거)
+        
+            # 3. Range 매칭
+            for start_int, end_int, ref_original in range_list:
+                if start_int <= source_int <= end_int:
+                    matched_ips.append(ref_original)
+        
+        elif isinstance(source_parsed, (ipaddress.IPv4Network, tuple)):
+            # Network/Range vs Network/Address/Range 매칭 (구간이 겹치면 매칭, 포함 관계 포함)
+            # 출력 순서는 Single IP와 같다 (Address → Network(긴 prefix 우선) → Range)
+            if isinstance(source_parsed, tuple):
                 source_start, source_end = source_parsed
-                
-                # Network 매칭 (Range의 시작/끝이 Network에 포함되는지)
-                for prefix_len in network_groups.keys():
-                    for network_int, network_mask, ref_original in network_groups[prefix_len]:
-                        if ((source_start & network_mask) == network_int) or \
-                           ((source_end & network_mask) == network_int):
-                            matched_ips.append(ref_original)
-                
-                # Address 매칭
-                for addr_int, ref_original in address_set.items():
-                    if source_start <= addr_int <= source_end:
-                        matched_ips.append(ref_original)
-                
-                # Range 매칭 (범위 겹침 확인)
-                for start_int, end_int, ref_original in range_list:
-                    if not (source_end < start_int or source_start > end_int):
+            else:
+                source_start = int(source_parsed.network_address)
+                source_end = int(source_parsed.broadcast_address)
+        
+            # Address 매칭 (구간에 포함되는지)
+            for addr_int, ref_original in address_set.items():
+                if source_start <= addr_int <= source_end:
+                    matched_ips.append(ref_original)
+        
+            # Network 매칭
+            for prefix_len in sorted(network_groups.keys(), reverse=True):
+                for network_int, network_mask, ref_original in network_groups[prefix_len]:
+                    broadcast_int = network_int | (~network_mask & 0xFFFFFFFF)
+                    if network_int <= source_end and source_start <= broadcast_int:
                         matched_ips.append(ref_original)
-                        
-            elif isinstance(source_parsed, set):
-                # Set vs Network/Address/Range 매칭 (하위 호환성)
-                source_ips = sorted(source_parsed)
-                
-                # Network 매칭
-                for prefix_len in network_groups.keys():
-                    for network_int, network_mask, ref_original in network_groups[prefix_len]:
-                        for ip in source_ips:
-                            if (int(ip) & network_mask) == network_int:
-                                matched_ips.append(ref_original)
-                                break
-                
-                # Address 매칭
-                for ip in source_ips:
-                    ip_int = int(ip)
-                    if ip_int in address_set:
-                        matched_ips.append(address_set[ip_int])
-                
-                # Range 매칭
-                for start_int, end_int, ref_original in range_list:
+        
+            # Range 매칭 (범위 겹침 확인)
+            for start_int, end_int, ref_original in range_list:
+                if not (source_end < start_int or source_start > end_int):
+                    matched_ips.append(ref_original)
+        
+        elif isinstance(source_parsed, set):
+            # Set vs Network/Address/Range 매칭 (하위 호환성)
+            source_ips = sorted(source_parsed)
+        
+            # Network 매칭
+            for prefix_len in network_groups.keys():
+                for network_int, network_mask, ref_original in network_groups[prefix_len]:
                     for ip in source_ips:
-                        ip_int = int(ip)
-                        if start_int <= ip_int <= end_int:
+                        if (int(ip) & network_mask) == network_int:
                             matched_ips.append(ref_original)
                             break
-            
-            # 중복 제거 및 정렬
-            matched_ips_unique = list(dict.fromkeys(matched_ips))  # 순서 유지하며 중복 제거
-            
-            # 매칭된 IP들을 콤마로 구분
-            matched_ips_str = ', '.join(matched_ips_unique) if matched_ips_unique else ''
-            
-            results.append({
-                'source': source_original,
-                'matched_ips': matched_ips_str
-            })
-            
-            # 진행률 콜백 호출 (매 20개마다 또는 마지막) - 성능과 UI 반응성 균형
-            if progress_callback and (idx % 20 == 0 or idx == total_sources - 1):
-                progress_callback(idx + 1, total_sources)
-                # 스레드에서 실행 중이므로 매우 짧은 대기로 GIL이 다른 스레드에 양보
-                import time
-                time.sleep(0.001)  # 1ms 대기로 UI 스레드에 최소한의 시간 제공
         
-        return results
+            # Address 매칭
+            for ip in source_ips:
+                ip_int = int(ip)
+                if ip_int in address_set:
+                    matched_ips.append(address_set[ip_int])
+        
+            # Range 매칭
+            for start_int, end_int, ref_original in range_list:
+                for ip in source_ips:
+                    ip_int = int(ip)
+                    if start_int <= ip_int <= end_int:
+                        matched_ips.append(ref_original)
+                        break
+        
+        return matched_ips
@@ -0,0 +1,141 @@
+"""Source 매칭 결과 메모 - 같은 Source(정수 구간)는 한 번만 매칭하고 결과를 재사용"""
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+from core.coverage import CoverageBitmap
+from core.match_result import LabelTable
+
+
+class MatchMemo:
+    """
+    Source 키별 매칭 결과 LRU 메모 (크기 제한) + 적중/미스 카운터
+
+    접속 로그처럼 같은 IP가 반복되는 Source에서 고유 키마다 한 번만 매칭한다.
+    키는 Single IP 정수 또는 (start_int, end_int, kind) 등 조회 함수의 인자이고, 값은 결과 번호(label_table())이다.
+    메모는 Reference(인덱스) 하나에만 유효하다. Reference가 바뀌면 새 메모를 사용한다.
+    """
+
+    # 조회 함수별 최대 항목 수
+    DEFAULT_SIZE = 1 << 16
+
+    # 오래 실행되는 매칭(서비스, 스트리밍)에서 결과 문자열 표 최대 크기 (trim_labels 기본값)
+    # hash/trie 엔진이나 Network/Range Source의 결과 문자열은 서로 다르면 계속 쌓이므로 상한을 둔다.
+    MAX_LABELS = 1 << 16
+
+    def __init__(self, max_size: int = DEFAULT_SIZE):
+        """
+        Args:
+            max_size: 조회 함수별 최대 메모 항목 수 (가장 오래 쓰지 않은 항목부터 제거)
+        """
+        self.max_size = max_size
+        self._cached = {}  # {이름: lru_cache로 감싼 조회 함수}
+        self._tables = {}  # {이름: 결과 dict}
+        self._table_lookups = 0
+        self._table_misses = 0
+        self._label_table = None
+        self._coverage = None
+        self.label_resets = 0
+
+    def cached(self, name: str, func: Callable[..., str]) -> Callable[..., str]:
+        """
+        조회 함수를 메모로 감싸 반환 (같은 이름은 처음 감싼 함수를 계속 사용)
+
+        Args:
+            name: 조회 종류 이름 (예: 'single', 'span')
+            func: 해시 가능한 인자로 결과(결과 번호 등)를 반환하는 함수
+
+        Returns:
+            메모가 적용된 함수
+        """
+        wrapped = self._cached.get(name)
+        if wrapped is None:
+            wrapped = self._cached[name] = lru_cache(maxsize=self.max_size)(func)
+        return wrapped
+
+    def table(self, name: str) -> Dict:
+        """
+        이름별 결과 dict 반환 (Single IP처럼 조회 자체가 가벼워 함수 래퍼 비용이 아까운 경우)
+
+        사용하는 쪽이 직접 get/대입하고, 크기가 max_size에 이르면 비운 뒤 다시 채운다.
+        사용 후 record()로 조회/미스 횟수를 알려야 집계된다.
+        """
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = {}
+        return table
+
+    def label_table(self, index=None) -> LabelTable:
+        """
+        메모 값(결과 번호)이 가리키는 결과 번호 표 (처음 호출할 때 생성, 이후 같은 표 반환)
+
+        Args:
+            index: 멤버 집합 번호를 결과 번호로 쓸 IntervalIndex (처음 호출할 때만 사용)
+        """
+        if self._label_table is None:
+            self._label_table = LabelTable(index)
+        return self._label_table
+
+    def trim_labels(self, max_labels: Optional[int] = None) -> bool:
+        """
+        결과 문자열 표가 max_labels개를 넘으면 메모 값과 결과 번호 표를 함께 비움 (서비스/스트리밍 매칭용)
+
+        메모 값은 표의 결과 번호이므로 둘은 같이 비운다. 표는 제자리에서 비우지 않고 새로 만들므로
+        이미 반환한 MatchResult는 이전 표로 그대로 읽힌다. 조회 함수 래퍼는 이전 표의 intern을 잡고 있어
+        다음 cached() 호출 때 새로 감싼다. 커버리지 비트맵과 적중/미스 횟수는 유지한다.
+
+        Args:
+            max_labels: 결과 문자열 표 최대 크기 (None이면 MAX_LABELS)
+
+        Returns:
+            비웠는지 여부
+        """
+        if max_labels is None:
+            max_labels = self.MAX_LABELS
+        if self._label_table is None or len(self._label_table) <= max_labels:
+            return False
+        for wrapped in self._cached.values():
+            info = wrapped.cache_info()
+            self._table_lookups += info.hits + info.misses
+            self._table_misses += info.misses
+        self._cached = {}
+        self._tables = {}
+        self._label_table = None
+        self.label_resets += 1
+        return True
+
+    def coverage(self, reference_list) -> CoverageBitmap:
+        """
+        Reference 커버리지 비트맵 (처음 호출할 때 생성, 이후 같은 비트맵 반환)
+
+        Args:
+            reference_list: 파싱된 Reference 리스트 (처음 호출할 때만 사용)
+        """
+        if self._coverage is None:
+            self._coverage = CoverageBitmap.from_references(reference_list)
+        return self._coverage
+
+    def record(self, lookups: int, misses: int):
+        """table() 사용분의 조회/미스 횟수 집계"""
+        self._table_lookups += lookups
+        self._table_misses += misses
+
+    @property
+    def hits(self) -> int:
+        return (sum(wrapped.cache_info().hits for wrapped in self._cached.values())
+                + self._table_lookups - self._table_misses)
+
+    @property
+    def misses(self) -> int:
+        return sum(wrapped.cache_info().misses for wrapped in self._cached.values()) + self._table_misses
+
+    def stats(self) -> Dict[str, int]:
+        """{'hits': 재사용 횟수, 'misses': 실제 매칭 횟수, 'labels': 결과 문자열 표 크기, 'label_resets': 비운 횟수}"""
+        return {'hits': self.hits, 'misses': self.misses,
+                'labels': len(self._label_table) if self._label_table is not None else 0,
+                'label_resets': self.label_resets}
+
+    def summary(self) -> str:
+        """결과 요약용 한 줄 문자열"""
+        hits, misses = self.hits, self.misses
+        total = hits + misses
+        ratio = hits * 100 / total if total else 0.0
+        return f"중복 Source 재사용 {hits:,}/{total:,} ({ratio:.1f}%)"
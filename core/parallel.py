@@ -0,0 +1,218 @@
+"""멀티 프로세스 병렬 처리 - Source를 분할하여 여러 코어에서 매칭/파싱"""
+from array import array
+from typing import List, Dict, Optional, Callable, Tuple
+import multiprocessing
+import os
+import sys
+import threading
+from core.interval_index import IntervalIndex
+from core.match_result import LabelTable, MatchResult
+from core.matcher import Matcher
+from core.parsed_list import ParsedList
+from core.parser import IPParser
+
+
+# 병렬 처리가 유리한 최소 Source 개수 (이보다 적으면 프로세스 시작 비용이 더 큼)
+PARALLEL_MIN_SOURCES = 50000
+
+# 워커당 분할 개수 (작게 나눌수록 진행률이 자주 갱신됨)
+SHARDS_PER_WORKER = 4
+
+# 워커 프로세스 전역 상태: (index, overlap_index, groups)
+# fork 환경에서는 부모가 설정한 값을 그대로 상속받고, spawn/forkserver 환경에서는 initializer로 전달받는다.
+_worker_state = None
+
+# 병렬 파싱 워커 전역 입력 텍스트 (fork 환경에서 부모의 텍스트를 복사 없이 상속받아 구간만 잘라 파싱)
+_parse_text = None
+
+
+def _init_worker(state):
+    """spawn/forkserver 워커 초기화 (인덱스를 워커당 한 번만 전달)"""
+    global _worker_state
+    _worker_state = state
+
+
+def _match_shard(shard: List) -> List[str]:
+    """
+    워커에서 Source 조각 하나를 매칭
+
+    Args:
+        shard: Single IP는 정수, 그 외는 파싱된 값 그대로
+
+    Returns:
+        Source별 매칭 문자열 리스트
+    """
+    index, overlap_index, groups = _worker_state
+    labels = []
+    for item in shard:
+        if isinstance(item, int):
+            labels.append(index.lookup_label(item))
+        elif isinstance(item, set):
+            matched_ips = Matcher._match_grouped(item, *groups)
+            labels.append(', '.join(dict.fromkeys(matched_ips)))
+        else:
+            labels.append(overlap_index.overlap_label(*Matcher._source_span(item)))
+    return labels
+
+
+def _get_context():
+    """
+    프로세스 시작 방식 선택
+
+    Linux는 fork로 인덱스를 복사 없이 상속하되, 다른 스레드가 있으면 (GUI 작업 스레드, 서비스의
+    Reference 재생성 스레드 등) forkserver를 사용한다. 다중 스레드 프로세스를 fork하면 다른 스레드가
+    잡고 있던 잠금이 그대로 복제되어 자식이 교착될 수 있다 (Python 3.12+는 DeprecationWarning).
+    Windows/macOS(GUI 프레임워크와 fork 충돌)는 spawn 사용.
+    """
+    if sys.platform.startswith('linux'):
+        if threading.active_count() == 1:
+            return multiprocessing.get_context('fork')
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def match_parallel(source_list: List[Dict], reference_list: List[Dict],
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   index=None, workers: Optional[int] = None) -> MatchResult:
+    """
+    Reference 인덱스를 한 번만 만들고 Source를 조각으로 나눠 여러 프로세스에서 매칭
+    결과는 원래 Source 순서대로 합쳐지며 Matcher.match_indexed와 동일하다.
+
+    Args:
+        source_list: Source IP 리스트
+        reference_list: Reference 네트워크 리스트
+        progress_callback: 진행률 콜백 함수 (조각이 끝날 때마다 부모 프로세스에서 호출)
+        index: 미리 생성한 Reference 인덱스 (없으면 정렬 구간 인덱스 생성)
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+
+    Returns:
+        매칭 결과 (MatchResult, 결과 번호는 결과 문자열별로 부여)
+    """
+    global _worker_state
+
+    if not source_list or (not reference_list and index is None):
+        return []
+
+    if index is None:
+        index = IntervalIndex.from_references(reference_list)
+
+    # Single IP는 정수로 보내 전송량 최소화
+    originals = []
+    payload = []
+    for source_original, source_int, source_parsed in Matcher._iter_sources(source_list):
+        originals.append(source_original)
+        payload.append(source_int if source_int is not None else source_parsed)
+    # Network/Range Source가 있을 때만 구간 조회 인덱스, Set(하위 호환)이 있을 때만 기존 그룹 구조 생성
+    has_spans = any(not isinstance(item, int) for item in payload)
+    overlap_index = None
+    if has_spans:
+        overlap_index = index if hasattr(index, 'overlap_label') else IntervalIndex.from_references(reference_list)
+    has_sets = has_spans and any(isinstance(item, set) for item in payload)
+    groups = Matcher._group_references(reference_list) if has_sets else None
+
+    workers = workers or os.cpu_count() or 1
+    total_sources = len(payload)
+    shard_size = max(1000, -(-total_sources // (workers * SHARDS_PER_WORKER)))
+    shards = [payload[start:start + shard_size] for start in range(0, total_sources, shard_size)]
+
+    state = (index, overlap_index, groups)
+    context = _get_context()
+    if context.get_start_method() == 'fork':
+        _worker_state = state
+        pool = context.Pool(workers)
+    else:
+        pool = context.Pool(workers, initializer=_init_worker, initargs=(state,))
+
+    # 워커는 결과 문자열을 보내고, 부모는 결과 번호로 바꿔 컬럼형 결과에 모음
+    table = LabelTable()
+    intern = table.intern
+    label_ids = array('I')
+    try:
+        with pool:
+            for labels in pool.imap(_match_shard, shards):
+                label_ids.extend(map(intern, labels))
+                if progress_callback:
+                    progress_callback(len(label_ids), total_sources)
+    finally:
+        _worker_state = None
+
+    sources = source_list if isinstance(source_list, ParsedList) else originals
+    return MatchResult(sources, label_ids, table)
+
+
+def split_at_separators(text: str, count: int) -> List[Tuple[int, int]]:
+    """
+    텍스트를 구분자(콤마/개행) 바로 뒤에서 잘라 약 count개의 [start, stop) 구간으로 나눔
+    항목이 두 구간에 걸치지 않으므로 구간별 파싱 결과를 이어 붙이면 전체 파싱과 같다.
+
+    Args:
+        text: 입력 텍스트
+        count: 나눌 구간 수 (구분자가 부족하면 더 적음)
+
+    Returns:
+        [(start, stop), ...] (텍스트 순서)
+    """
+    size = len(text)
+    step = max(1, -(-size // max(1, count)))
+    separator = IPParser._SEPARATOR
+    cuts = [0]
+    target = step
+    while target < size:
+        found = separator.search(text, target)
+        if found is None or found.end() >= size:
+            break
+        cuts.append(found.end())
+        target = found.end() + step
+    cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+
+def _parse_range(bounds: Tuple[int, int]) -> ParsedList:
+    """fork 워커에서 상속받은 텍스트의 구간 하나를 파싱"""
+    start, stop = bounds
+    return IPParser.parse_text_compact(_parse_text[start:stop])
+
+
+def _parse_chunk(chunk: str) -> ParsedList:
+    """spawn/forkserver 워커에서 전달받은 텍스트 조각 하나를 파싱"""
+    return IPParser.parse_text_compact(chunk)
+
+
+def parse_parallel(text: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+                   workers: Optional[int] = None) -> ParsedList:
+    """
+    큰 입력 텍스트를 구분자 경계에서 나눠 여러 프로세스에서 ParsedList로 파싱
+    결과는 텍스트 순서대로 이어 붙이며 IPParser.parse_text_compact(text)와 같다.
+
+    전체 텍스트를 한 번에 split하지 않으므로 항목 문자열 리스트는 워커마다 구간 크기만큼만 생긴다.
+    fork 환경에서는 워커가 텍스트를 상속받아 (start, stop)만 전달되고, 부모로는 정수 배열 형태만 돌아온다.
+
+    Args:
+        text: 입력 텍스트 (개행 또는 콤마로 구분)
+        progress_callback: 진행률 콜백 함수 (파싱이 끝난 문자 수, 전체 문자 수)
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+
+    Returns:
+        ParsedList
+    """
+    global _parse_text
+
+    workers = workers or os.cpu_count() or 1
+    ranges = split_at_separators(text, workers * SHARDS_PER_WORKER)
+    context = _get_context()
+    if context.get_start_method() == 'fork':
+        _parse_text = text
+        parse_task, tasks = _parse_range, ranges
+    else:
+        parse_task, tasks = _parse_chunk, (text[start:stop] for start, stop in ranges)
+
+    results = ParsedList()
+    try:
+        with context.Pool(min(workers, len(ranges))) as pool:
+            for (_, stop), part in zip(ranges, pool.imap(parse_task, tasks)):
+                results.extend(part)
+                if progress_callback:
+                    progress_callback(stop, len(text))
+    finally:
+        _parse_text = None
+    return results
@@ -0,0 +1,155 @@
+"""컬럼형 파싱 결과 컨테이너 - 항목별 dict/ipaddress 객체 대신 정수 배열로 저장"""
+from array import array
+from typing import Dict, Iterable, Iterator, Tuple, Union
+from utils.ip_utils import parse_ip_int, interval_to_parsed, KIND_SINGLE, KIND_NAMES, KIND_V6, KIND_MASK
+
+
+class ParsedList:
+    """
+    파싱된 IP 리스트 (컬럼형)
+
+    - starts/ends: array('I') 정수 구간
+    - kinds: array('B') 종류 (utils.ip_utils.KIND_*)
+    - original 문자열: UTF-8 blob 하나 + 오프셋 배열
+    - IPv6 항목(kind에 KIND_V6)은 128비트라 starts/ends에는 0을 두고 _wide에 따로 저장
+
+    항목당 약 20바이트로, 기존 {'original', 'parsed', 'type'} dict 리스트 대비 메모리를 크게 줄인다.
+    인덱스 접근/순회 시에는 기존 코드와의 호환을 위해 dict를 만들어 반환하지만,
+    Matcher는 컬럼을 직접 사용한다.
+    """
+
+    def __init__(self):
+        self.starts = array('I')
+        self.ends = array('I')
+        self.kinds = array('B')
+        self._offsets = array('I', [0])
+        self._blob = bytearray()
+        self._wide = {}  # IPv6 항목 {idx: (start_int, end_int)}
+
+    @classmethod
+    def from_items(cls, items: Iterable[str]) -> 'ParsedList':
+        """
+        항목 문자열들을 파싱하여 생성 (잘못된 항목은 제외)
+
+        Args:
+            items: 공백이 제거된 항목 문자열
+        """
+        parsed_list = cls()
+        append = parsed_list.append
+        for item in items:
+            interval = parse_ip_int(item)
+            if interval is not None:
+                append(item, *interval)
+        return parsed_list
+
+    def append(self, original: str, start_int: int, end_int: int, kind: int):
+        """항목 추가"""
+        if kind & KIND_V6:
+            self._wide[len(self.kinds)] = (start_int, end_int)
+            start_int = end_int = 0
+        self.starts.append(start_int)
+        self.ends.append(end_int)
+        self.kinds.append(kind)
+        self._blob += original.encode('utf-8')
+        self._offsets.append(len(self._blob))
+
+    def extend(self, other: 'ParsedList'):
+        """다른 ParsedList를 뒤에 이어 붙임"""
+        base = len(self._blob)
+        count = len(self)
+        for idx, interval in other._wide.items():
+            self._wide[count + idx] = interval
+        self.starts.extend(other.starts)
+        self.ends.extend(other.ends)
+        self.kinds.extend(other.kinds)
+        self._offsets.extend(offset + base for offset in other._offsets[1:])
+        self._blob += other._blob
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def original(self, idx: int) -> str:
+        """idx번째 항목의 원본 문자열"""
+        return self._blob[self._offsets[idx]:self._offsets[idx + 1]].decode('utf-8')
+
+    def originals(self) -> Iterator[str]:
+        """원본 문자열 순회"""
+        blob = self._blob
+        offsets = self._offsets
+        for idx in range(len(self)):
+            yield blob[offsets[idx]:offsets[idx + 1]].decode('utf-8')
+
+    def intervals(self) -> Iterator[Tuple[int, int, int]]:
+        """(start_int, end_int, kind) 순회"""
+        if not self._wide:
+            return zip(self.starts, self.ends, self.kinds)
+        return (self._interval(idx) for idx in range(len(self)))
+
+    def _interval(self, idx: int) -> Tuple[int, int, int]:
+        """idx번째 항목의 (start_int, end_int, kind)"""
+        kind = self.kinds[idx]
+        if kind & KIND_V6:
+            return self._wide[idx] + (kind,)
+        return self.starts[idx], self.ends[idx], kind
+
+    def all_single(self) -> bool:
+        """모든 항목이 IPv4 Single IP인지 여부"""
+        return self.kinds.count(KIND_SINGLE) == len(self)
+
+    def has_ipv6(self) -> bool:
+        """IPv6 항목 포함 여부 (O(1))"""
+        return bool(self._wide)
+
+    def ipv6_count(self) -> int:
+        """IPv6 항목 개수"""
+        return len(self._wide)
+
+    def nbytes(self) -> int:
+        """컬럼 데이터가 차지하는 바이트 수"""
+        return (self.starts.itemsize * len(self.starts) + self.ends.itemsize * len(self.ends)
+                + self.kinds.itemsize * len(self.kinds) + self._offsets.itemsize * len(self._offsets)
+                + len(self._blob))
+
+    def _record(self, idx: int) -> Dict:
+        """기존 파싱 결과 형식의 dict 생성"""
+        start_int, end_int, kind = self._interval(idx)
+        return {
+            'original': self.original(idx),
+            'parsed': interval_to_parsed(start_int, end_int, kind),
+            'type': KIND_NAMES[kind & KIND_MASK]
+        }
+
+    def __getitem__(self, idx: Union[int, slice]):
+        """정수 인덱스는 dict(호환용), slice는 ParsedList 반환"""
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step == 1:
+                return self._slice(start, max(start, stop))
+            sliced = ParsedList()
+            for position in range(start, stop, step):
+                sliced.append(self.original(position), *self._interval(position))
+            return sliced
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("ParsedList index out of range")
+        return self._record(idx)
+
+    def _slice(self, start: int, stop: int) -> 'ParsedList':
+        """연속 구간 [start, stop)을 배열 단위로 복사"""
+        sliced = ParsedList()
+        sliced.starts = self.starts[start:stop]
+        sliced.ends = self.ends[start:stop]
+        sliced.kinds = self.kinds[start:stop]
+        base = self._offsets[start]
+        sliced._blob = self._blob[base:self._offsets[stop]]
+        if base:
+            sliced._offsets = array('I', (offset - base for offset in self._offsets[start:stop + 1]))
+        else:
+            sliced._offsets = self._offsets[start:stop + 1]
+        sliced._wide = {idx - start: interval for idx, interval in self._wide.items() if start <= idx < stop}
+        return sliced
+
+    def __iter__(self) -> Iterator[Dict]:
+        for idx in range(len(self)):
+            yield self._record(idx)
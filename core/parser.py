@@ -1,8 +1,10 @@
 """IP 포맷 파싱 모듈 - 고성능 배치 처리"""
-from typing import List, Optional, Union, Callable, Iterator
+from array import array
+from typing import List, Optional, Union, Callable, Iterator, Tuple
 import ipaddress
 import re
-from utils.ip_utils import parse_ip_input
+from utils.ip_utils import parse_ip_input, parse_ip_int
+from core.parsed_list import ParsedList
 
 
 class IPParser:
@@ -11,6 +13,15 @@ class IPParser:
     # 배치 크기 (한 번에 처리할 항목 수) - 성능과 UI 반응성의 균형
     BATCH_SIZE = 500  # 적당한 크기로 성능 유지하면서 UI 업데이트 가능
     
+    # 파일을 나눠 읽는 크기 (문자 수)
+    READ_CHUNK_SIZE = 1 << 20
+    
+    # 병렬 파싱이 유리한 최소 입력 길이 (문자 수, 약 7만 줄) - 이보다 짧으면 프로세스 시작 비용이 더 큼
+    PARALLEL_MIN_CHARS = 1 << 20
+    
+    # 항목 구분자 (콤마/개행)
+    _SEPARATOR = re.compile(r'[,\n\r]+')
+    
     @staticmethod
     def parse_text_input(text: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[dict]:
         """
@@ -23,8 +34,8 @@ class IPParser:
         Returns:
             [{'original': str, 'parsed': IPv4Address|IPv4Network|Set, 'type': str}, ...]
         """
-        # 빠른 분리 (정규식 최적화)
-        items = re.split(r'[,\n\r]+', text.strip())
+        # 빠른 분리 (미리 컴파일한 구분자 정규식)
+        items = IPParser._SEPARATOR.split(text.strip())
         # 빈 항목 제거 및 공백 제거 (리스트 컴프리헨션으로 빠르게)
         items = [item.strip() for item in items if item.strip()]
         
@@ -46,13 +57,87 @@ class IPParser:
             # 진행률 업데이트 (콜백이 있으면 호출)
             if progress_callback:
                 progress_callback(batch_end, total)
-                # 스레드에서 실행 중이므로 매우 짧은 대기로 GIL이 다른 스레드에 양보
-                # 너무 길면 성능 저하, 너무 짧으면 의미 없음
-                import time
-                time.sleep(0.001)  # 1ms 대기로 UI 스레드에 최소한의 시간 제공
         
         return results
     
+    @staticmethod
+    def parse_text_compact(text: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+                           workers: int = 1) -> ParsedList:
+        """
+        텍스트 입력을 컬럼형 ParsedList로 파싱 (ipaddress 객체/항목별 dict 없음)
+        검증 규칙은 parse_text_input과 같으며 잘못된 항목은 제외된다.
+        
+        Args:
+            text: 입력 텍스트 (개행 또는 콤마로 구분)
+            progress_callback: 진행률 콜백 함수 (current, total)
+            workers: 2 이상이고 텍스트가 PARALLEL_MIN_CHARS 이상이면 구분자 경계에서 나눠 여러 프로세스에서 파싱
+                     (결과는 같고, 진행률은 문자 수 기준)
+            
+        Returns:
+            ParsedList
+        """
+        if workers > 1 and len(text) >= IPParser.PARALLEL_MIN_CHARS:
+            from core.parallel import parse_parallel
+            return parse_parallel(text, progress_callback, workers)
+        
+        items = IPParser._SEPARATOR.split(text.strip())
+        items = [item.strip() for item in items if item.strip()]
+        
+        total = len(items)
+        results = ParsedList()
+        append = results.append
+        
+        for batch_start in range(0, total, IPParser.BATCH_SIZE):
+            batch_end = min(batch_start + IPParser.BATCH_SIZE, total)
+            for item in items[batch_start:batch_end]:
+                interval = parse_ip_int(item)
+                if interval is not None:
+                    append(item, *interval)
+            
+            if progress_callback:
+                progress_callback(batch_end, total)
+        
+        return results
+    
+    @staticmethod
+    def parse_lines_compact(lines: List[str],
+                            progress_callback: Optional[Callable[[int, int], None]] = None) -> Tuple[ParsedList, array]:
+        """
+        줄 리스트를 ParsedList로 파싱하고 줄마다 유효 항목 수를 함께 반환 (증분 갱신용)
+        줄 결과를 이어 붙이면 parse_text_compact('\n'.join(lines))와 같다.
+        
+        Args:
+            lines: 개행 없이 나눈 텍스트 줄 (한 줄에 콤마로 여러 항목 가능)
+            progress_callback: 진행률 콜백 함수 (current, total, 줄 단위)
+            
+        Returns:
+            (ParsedList, 줄별 항목 수 array('I'))
+        """
+        separator = IPParser._SEPARATOR
+        results = ParsedList()
+        append = results.append
+        counts = array('I')
+        total = len(lines)
+        
+        for batch_start in range(0, total, IPParser.BATCH_SIZE):
+            batch_end = min(batch_start + IPParser.BATCH_SIZE, total)
+            for line in lines[batch_start:batch_end]:
+                count = 0
+                for item in separator.split(line):
+                    item = item.strip()
+                    if not item:
+                        continue
+                    interval = parse_ip_int(item)
+                    if interval is not None:
+                        append(item, *interval)
+                        count += 1
+                counts.append(count)
+            
+            if progress_callback:
+                progress_callback(batch_end, total)
+        
+        return results, counts
+    
     @staticmethod
     def _parse_batch(items: List[str]) -> List[dict]:
         """배치 단위로 빠르게 파싱"""
@@ -65,9 +150,9 @@ class IPParser:
                 continue
             
             # 타입 결정
-            if isinstance(parsed, ipaddress.IPv4Address):
+            if isinstance(parsed, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
                 ip_type = 'Single'
-            elif isinstance(parsed, ipaddress.IPv4Network):
+            elif isinstance(parsed, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
                 ip_type = 'CIDR'
             elif isinstance(parsed, tuple):  # Range는 (start, end) 튜플로 저장
                 ip_type = 'Range'
@@ -93,42 +178,123 @@ class IPParser:
         Returns:
             IPv4Address, IPv4Network, 또는 (start_int, end_int) 튜플
         """
-        ip_str = ip_str.strip()
-        if not ip_str:
-            return None
-        
-        # CIDR 포맷 확인 (가장 빠름)
-        if '/' in ip_str:
-            try:
-                return ipaddress.IPv4Network(ip_str, strict=False)
-            except ValueError:
-                return None
-        
-        # Range 포맷 확인
-        if '-' in ip_str and ip_str.count('-') == 1:
-            try:
-                parts = ip_str.split('-')
-                start_ip = ipaddress.IPv4Address(parts[0].strip())
-                end_ip = ipaddress.IPv4Address(parts[1].strip())
-                
-                if start_ip > end_ip:
-                    return None
-                
-                # Set 대신 튜플로 저장 (메모리 절약, 빠른 비교)
-                return (int(start_ip), int(end_ip))
-            except (ValueError, AttributeError):
-                return None
-        
-        # Single IP
-        try:
-            return ipaddress.IPv4Address(ip_str)
-        except ValueError:
-            return None
+        # 정수 파서로 검증 후 객체 생성 (Range는 Set 대신 튜플로 저장하여 메모리 절약)
+        return parse_ip_input(ip_str)
+    
+    @staticmethod
+    def parse_text_input_int(text: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[tuple]:
+        """
+        텍스트 입력을 ipaddress 객체 없이 정수 구간으로 파싱 (콤마/개행 지원, 배치 처리)
+        검증 규칙은 parse_text_input과 같으며 잘못된 항목은 제외된다.
+        
+        Args:
+            text: 입력 텍스트 (개행 또는 콤마로 구분)
+            progress_callback: 진행률 콜백 함수 (current, total)
+            
+        Returns:
+            [(original, start_int, end_int, kind), ...] (kind: utils.ip_utils.KIND_*)
+        """
+        items = IPParser._SEPARATOR.split(text.strip())
+        items = [item.strip() for item in items if item.strip()]
+        
+        total = len(items)
+        results = []
+        
+        for batch_start in range(0, total, IPParser.BATCH_SIZE):
+            batch_end = min(batch_start + IPParser.BATCH_SIZE, total)
+            for item in items[batch_start:batch_end]:
+                interval = parse_ip_int(item)
+                if interval is not None:
+                    results.append((item,) + interval)
+            
+            if progress_callback:
+                progress_callback(batch_end, total)
+        
+        return results
+    
+    @staticmethod
+    def iter_items(stream, chunk_size: Optional[int] = None) -> Iterator[str]:
+        """
+        텍스트 스트림을 청크 단위로 읽으며 항목 문자열을 하나씩 반환 (전체를 메모리에 올리지 않음)
+        
+        Args:
+            stream: 텍스트 모드 파일 객체
+            chunk_size: 한 번에 읽을 문자 수 (기본 READ_CHUNK_SIZE)
+            
+        Yields:
+            공백이 제거된 항목 문자열 (빈 항목 제외)
+        """
+        chunk_size = chunk_size or IPParser.READ_CHUNK_SIZE
+        separator = IPParser._SEPARATOR
+        remainder = ''
+        
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            parts = separator.split(remainder + chunk)
+            # 마지막 조각은 다음 청크와 이어질 수 있으므로 보관
+            remainder = parts.pop()
+            for item in parts:
+                item = item.strip()
+                if item:
+                    yield item
+        
+        remainder = remainder.strip()
+        if remainder:
+            yield remainder
+    
+    @staticmethod
+    def iter_parsed_batches(stream, batch_size: Optional[int] = None) -> Iterator[List[dict]]:
+        """
+        텍스트 스트림을 파싱된 IP 배치 단위로 반환 (메모리 사용량은 배치 크기로 제한)
+        
+        Args:
+            stream: 텍스트 모드 파일 객체
+            batch_size: 배치당 항목 수 (기본 BATCH_SIZE)
+            
+        Yields:
+            [{'original': str, 'parsed': ..., 'type': str}, ...]
+        """
+        batch_size = batch_size or IPParser.BATCH_SIZE
+        batch_items = []
+        for item in IPParser.iter_items(stream):
+            batch_items.append(item)
+            if len(batch_items) >= batch_size:
+                yield IPParser._parse_batch(batch_items)
+                batch_items = []
+        if batch_items:
+            yield IPParser._parse_batch(batch_items)
+    
+    @staticmethod
+    def iter_compact_batches(stream, batch_size: Optional[int] = None) -> Iterator[ParsedList]:
+        """
+        텍스트 스트림을 ParsedList 배치 단위로 반환 (메모리 사용량은 배치 크기로 제한)
+        
+        Args:
+            stream: 텍스트 모드 파일 객체
+            batch_size: 배치당 항목 수 (기본 BATCH_SIZE)
+            
+        Yields:
+            ParsedList
+        """
+        batch_size = batch_size or IPParser.BATCH_SIZE
+        batch = ParsedList()
+        for item in IPParser.iter_items(stream):
+            interval = parse_ip_int(item)
+            if interval is None:
+                continue
+            batch.append(item, *interval)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = ParsedList()
+        if len(batch):
+            yield batch
     
     @staticmethod
     def parse_file(file_path: str) -> List[dict]:
         """
-        파일에서 IP 리스트 읽기
+        파일에서 IP 리스트 읽기 (청크 단위로 읽어 파일 전체 문자열을 만들지 않음)
         
         Args:
             file_path: 파일 경로 (.txt 파일)
@@ -137,9 +303,11 @@ class IPParser:
             파싱된 IP 리스트
         """
         try:
+            results = []
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return IPParser.parse_text_input(content)
+                for batch in IPParser.iter_parsed_batches(f):
+                    results.extend(batch)
+            return results
         except Exception as e:
             print(f"파일 읽기 오류: {e}")
             return []
@@ -0,0 +1,135 @@
+"""prefix 길이별 해시 테이블 인덱스 - CIDR 포함 관계 조회"""
+from typing import List, Dict, Tuple, Sequence, Iterable
+from core.interval_index import rank_references, collapse_references
+from utils.ip_utils import range_to_cidrs, IPV4_BITS
+
+
+class PrefixHashIndex:
+    """
+    prefix 길이마다 {마스킹된 네트워크 정수: [Reference 번호, ...]} 해시 테이블을 두는 인덱스
+
+    Address는 /32, Range는 최소 CIDR 블록으로 분해하여 같은 테이블에 넣는다.
+    단일 IP 조회는 존재하는 prefix 길이마다 마스킹 후 dict 조회 한 번씩,
+    최대 33번의 조회로 끝나며 Reference 개수와 무관하다. (IPv6는 bits=128, 최대 129번)
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, str]], bits: int = IPV4_BITS):
+        """
+        Args:
+            intervals: 출력 순서대로 정렬된 [(start_int, end_int, original), ...]
+            bits: 주소 비트 수 (IPv4: 32, IPv6: 128)
+        """
+        blocks = (
+            (network_int, prefix_len, rank)
+            for rank, (start_int, end_int, _) in enumerate(intervals)
+            for network_int, prefix_len in range_to_cidrs(start_int, end_int, bits)
+        )
+        self._build([original for _, _, original in intervals], blocks, bits)
+
+    @classmethod
+    def from_references(cls, reference_list: List[Dict]) -> 'PrefixHashIndex':
+        """파싱된 Reference 리스트로 인덱스 생성 (중복 Reference는 합침)"""
+        return cls(collapse_references(rank_references(reference_list)))
+
+    @classmethod
+    def from_blocks(cls, originals: Sequence[str],
+                    blocks: Iterable[Tuple[int, int, int]]) -> 'PrefixHashIndex':
+        """
+        CIDR 블록 테이블로 인덱스 생성 (컴파일된 인덱스 파일 로드용, Range 재분해 없음)
+
+        Args:
+            originals: Reference 문자열 (출력 순서)
+            blocks: [(network_int, prefix_len, rank), ...]
+        """
+        index = cls.__new__(cls)
+        index._build(originals, blocks)
+        return index
+
+    def _build(self, originals: Sequence[str], blocks: Iterable[Tuple[int, int, int]], bits: int = IPV4_BITS):
+        """CIDR 블록으로 prefix별 해시 테이블 생성"""
+        self.originals = originals
+        self.bits = bits
+
+        tables = {}  # {prefix_len: {network_int: [rank, ...]}}
+        for network_int, prefix_len, rank in blocks:
+            tables.setdefault(prefix_len, {}).setdefault(network_int, []).append(rank)
+
+        # 긴 prefix부터 조회 (prefix_len, mask, table)
+        all_ones = (1 << bits) - 1
+        self.tables = [
+            (prefix_len, (all_ones << (bits - prefix_len)) & all_ones, tables[prefix_len])
+            for prefix_len in sorted(tables, reverse=True)
+        ]
+
+        # 매칭 번호 조합별 결과 문자열 캐시 {(rank, ...): 'a, b, ...'}
+        self._label_cache = {}
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def lookup(self, ip_int: int) -> List[int]:
+        """
+        단일 IP를 포함하는 Reference 번호 반환
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            Reference 번호 리스트 (출력 순서)
+        """
+        ranks = []
+        for _, mask, table in self.tables:
+            bucket = table.get(ip_int & mask)
+            if bucket is not None:
+                ranks.extend(bucket)
+        ranks.sort()
+        return ranks
+
+    def lookup_label(self, ip_int: int) -> str:
+        """
+        단일 IP의 매칭 결과 문자열 반환 (매칭 조합 단위로 캐시)
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        return self._label(tuple(self.lookup(ip_int)))
+
+    def lookup_longest(self, start_int: int, end_int: int) -> List[int]:
+        """
+        구간 전체를 포함하는 가장 구체적인(최장 prefix) Reference 번호 반환 (RadixTrie.lookup_longest와 동일)
+
+        Args:
+            start_int: 시작 IP (단일 IP는 start_int == end_int)
+            end_int: 끝 IP
+
+        Returns:
+            Reference 번호 리스트 (같은 블록의 Reference가 여럿이면 모두, 출력 순서)
+        """
+        max_len = self.bits - (start_int ^ end_int).bit_length()
+        for prefix_len, mask, table in self.tables:
+            if prefix_len > max_len:
+                continue
+            bucket = table.get(start_int & mask)
+            if bucket is not None:
+                return sorted(bucket)
+        return []
+
+    def lookup_longest_label(self, start_int: int, end_int: int) -> str:
+        """구간을 포함하는 최장 prefix Reference 문자열 (매칭 없으면 빈 문자열)"""
+        return self._label(tuple(self.lookup_longest(start_int, end_int)))
+
+    def _label(self, ranks: Tuple[int, ...]) -> str:
+        """Reference 번호 조합의 결과 문자열 (조합 단위로 캐시)"""
+        if not ranks:
+            return ''
+
+        label = self._label_cache.get(ranks)
+        if label is None:
+            originals = self.originals
+            # 순서 유지하며 중복 제거
+            label = ', '.join(dict.fromkeys(originals[rank] for rank in ranks))
+            self._label_cache[ranks] = label
+        return label
@@ -0,0 +1,82 @@
+"""작업 진행 상태/취소 - 작업 스레드가 기록하고 UI가 타이머로 읽는 공유 객체"""
+import time
+from typing import Callable, Tuple
+
+
+class AnalysisCancelled(Exception):
+    """사용자가 작업을 취소함 (취소 후 첫 진행률 콜백에서 발생)"""
+
+
+class ProgressState:
+    """
+    작업 진행 상태 + 취소 플래그
+
+    작업 스레드는 callback(stage)이 돌려주는 진행률 콜백으로 (단계, current, total)만 기록하고,
+    UI는 root.after 타이머로 snapshot()을 읽어 표시한다. 작업 스레드는 UI 함수를 호출하지 않으며
+    양보용 sleep도 필요 없다. cancel() 후에는 다음 진행률 콜백에서 AnalysisCancelled가 발생한다.
+
+    상태는 튜플 하나로 통째로 바꾸므로 (GIL 하에서 원자적) 잠금 없이 읽고 쓴다.
+    """
+
+    def __init__(self, stage: str = ''):
+        """
+        Args:
+            stage: 처음 표시할 단계 이름
+        """
+        self._state = (stage, 0, 0)
+        self._cancelled = False
+        self.started = time.perf_counter()
+
+    def callback(self, stage: str) -> Callable[[int, int], None]:
+        """
+        단계 이름을 붙여 기록하는 진행률 콜백 반환 (core 함수의 progress_callback 인자로 전달)
+
+        Args:
+            stage: 단계 이름 (예: 'Source 파싱')
+
+        Returns:
+            progress_callback(current, total) - 취소되었으면 AnalysisCancelled 발생
+        """
+        self.set_stage(stage)
+
+        def progress(current: int, total: int):
+            if self._cancelled:
+                raise AnalysisCancelled()
+            self._state = (stage, current, total)
+
+        return progress
+
+    def set_stage(self, stage: str, current: int = 0, total: int = 0):
+        """진행률 콜백이 없는 단계(인덱스 생성 등) 표시 + 취소 확인"""
+        self.check()
+        self._state = (stage, current, total)
+
+    def check(self):
+        """취소되었으면 AnalysisCancelled 발생"""
+        if self._cancelled:
+            raise AnalysisCancelled()
+
+    def cancel(self):
+        """작업 취소 요청 (UI 스레드에서 호출)"""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def elapsed(self) -> float:
+        """작업 시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self.started
+
+    def snapshot(self) -> Tuple[str, int, int]:
+        """(단계, current, total)"""
+        return self._state
+
+    def describe(self) -> str:
+        """상태 바 표시용 문자열 (예: '매칭 중... 12,000/100,000 (12%)')"""
+        stage, current, total = self._state
+        if not total:
+            return f"{stage} 중..."
+        percent = current * 100 // total
+        return f"{stage} 중... {current:,}/{total:,} ({percent}%)"
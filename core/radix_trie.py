@@ -0,0 +1,171 @@
+"""이진 radix(Patricia) 트라이 - 포함 Reference 전체 / 최장 prefix 조회"""
+from array import array
+from typing import List, Dict, Tuple
+from core.interval_index import rank_references, collapse_references
+from utils.ip_utils import range_to_cidrs
+
+
+class RadixTrie:
+    """
+    경로 압축(Patricia) 이진 트라이
+
+    노드는 배열(key, prefix 길이, 좌/우 자식)로 저장하고, Reference가 달린 노드만
+    payload에 Reference 번호를 가진다. Network/Address는 CIDR 그대로, Range는 최소
+    CIDR 블록으로 분해하여 원래 Reference 번호를 가리키게 한다.
+    조회는 루트부터 최대 32단계만 내려가므로 Reference 개수와 무관하게 O(32)이다.
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, str]]):
+        """
+        Args:
+            intervals: 출력 순서대로 정렬된 [(start_int, end_int, original), ...]
+        """
+        self.originals = [original for _, _, original in intervals]
+
+        # 노드 배열 (0번은 0.0.0.0/0 루트)
+        self.keys = array('I', [0])
+        self.prefix_lens = array('B', [0])
+        self.children = (array('i', [-1]), array('i', [-1]))
+        self.payloads = {}  # {node: [rank, ...]}
+
+        for rank, (start_int, end_int, _) in enumerate(intervals):
+            for network_int, prefix_len in range_to_cidrs(start_int, end_int):
+                self._insert(network_int, prefix_len, rank)
+
+        # 결과 문자열 캐시 {(rank, ...): 'a, b, ...'}
+        self._label_cache = {}
+
+    @classmethod
+    def from_references(cls, reference_list: List[Dict]) -> 'RadixTrie':
+        """파싱된 Reference 리스트로 트라이 생성 (중복 Reference는 합침)"""
+        return cls(collapse_references(rank_references(reference_list)))
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def _new_node(self, key: int, prefix_len: int) -> int:
+        """노드 추가 후 번호 반환"""
+        self.keys.append(key)
+        self.prefix_lens.append(prefix_len)
+        self.children[0].append(-1)
+        self.children[1].append(-1)
+        return len(self.keys) - 1
+
+    def _insert(self, network_int: int, prefix_len: int, rank: int):
+        """CIDR 블록 하나를 삽입"""
+        keys = self.keys
+        prefix_lens = self.prefix_lens
+        node = 0
+
+        while True:
+            node_len = prefix_lens[node]
+            if node_len == prefix_len:
+                self.payloads.setdefault(node, []).append(rank)
+                return
+
+            bit = (network_int >> (31 - node_len)) & 1
+            child = self.children[bit][node]
+            if child == -1:
+                leaf = self._new_node(network_int, prefix_len)
+                self.children[bit][node] = leaf
+                self.payloads[leaf] = [rank]
+                return
+
+            # 자식 노드와 공통 prefix 길이 계산
+            child_len = prefix_lens[child]
+            limit = min(child_len, prefix_len)
+            diff = keys[child] ^ network_int
+            common_len = min(32 - diff.bit_length(), limit) if diff else limit
+
+            if common_len == child_len:
+                # 자식이 삽입할 블록을 포함 → 계속 내려감
+                node = child
+                continue
+
+            # 자식 노드 앞에 분기 노드 삽입
+            mask = (0xFFFFFFFF << (32 - common_len)) & 0xFFFFFFFF
+            branch = self._new_node(network_int & mask, common_len)
+            self.children[bit][node] = branch
+            child_bit = (keys[child] >> (31 - common_len)) & 1
+            self.children[child_bit][branch] = child
+
+            if common_len == prefix_len:
+                # 삽입할 블록이 기존 자식을 포함
+                self.payloads[branch] = [rank]
+            else:
+                leaf = self._new_node(network_int, prefix_len)
+                self.children[1 - child_bit][branch] = leaf
+                self.payloads[leaf] = [rank]
+            return
+
+    def _walk(self, ip_int: int, max_len: int = 32) -> List[List[int]]:
+        """ip_int를 포함하는 (prefix 길이 max_len 이하) 노드의 payload를 짧은 prefix부터 반환"""
+        keys = self.keys
+        prefix_lens = self.prefix_lens
+        left, right = self.children
+        payloads = self.payloads
+        found = []
+
+        node = 0
+        while node != -1:
+            node_len = prefix_lens[node]
+            if node_len > max_len or (ip_int ^ keys[node]) >> (32 - node_len):
+                break
+            payload = payloads.get(node)
+            if payload is not None:
+                found.append(payload)
+            if node_len == 32:
+                break
+            node = right[node] if (ip_int >> (31 - node_len)) & 1 else left[node]
+        return found
+
+    def lookup(self, ip_int: int) -> List[int]:
+        """
+        단일 IP를 포함하는 모든 Reference 번호 반환
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            Reference 번호 리스트 (출력 순서)
+        """
+        ranks = [rank for payload in self._walk(ip_int) for rank in payload]
+        ranks.sort()
+        return ranks
+
+    def lookup_longest(self, start_int: int, end_int: int) -> List[int]:
+        """
+        구간 전체를 포함하는 가장 구체적인(최장 prefix) Reference 번호 반환
+        Range Reference는 분해된 CIDR 블록 기준으로 비교한다.
+
+        Args:
+            start_int: 시작 IP (단일 IP는 start_int == end_int)
+            end_int: 끝 IP
+
+        Returns:
+            Reference 번호 리스트 (같은 prefix의 Reference가 여럿이면 모두, 출력 순서)
+        """
+        diff = start_int ^ end_int
+        found = self._walk(start_int, 32 - diff.bit_length())
+        return sorted(found[-1]) if found else []
+
+    def _label(self, ranks: List[int]) -> str:
+        """Reference 번호 조합의 결과 문자열 (조합 단위로 캐시)"""
+        if not ranks:
+            return ''
+        key = tuple(ranks)
+        label = self._label_cache.get(key)
+        if label is None:
+            originals = self.originals
+            # 순서 유지하며 중복 제거
+            label = ', '.join(dict.fromkeys(originals[rank] for rank in key))
+            self._label_cache[key] = label
+        return label
+
+    def lookup_label(self, ip_int: int) -> str:
+        """단일 IP를 포함하는 모든 Reference 문자열 (매칭 없으면 빈 문자열)"""
+        return self._label(self.lookup(ip_int))
+
+    def lookup_longest_label(self, start_int: int, end_int: int) -> str:
+        """구간을 포함하는 최장 prefix Reference 문자열 (매칭 없으면 빈 문자열)"""
+        return self._label(self.lookup_longest(start_int, end_int))
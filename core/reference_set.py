@@ -0,0 +1,332 @@
+"""Reference 텍스트 증분 갱신 - 줄 단위 변경분만 파싱하고 인덱스에 추가/삭제 반영"""
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+from core.interval_index import IntervalIndex, iter_reference_intervals, rank_entries, order_key, ORDER_ADDRESS
+from core.parsed_list import ParsedList
+from core.parser import IPParser
+from utils.ip_utils import KIND_SINGLE, KIND_V6
+
+
+class IncrementalIndex:
+    """
+    기준 정렬 구간 인덱스(base) + 변경분 인덱스(delta) 묶음
+
+    - 삭제: base의 Reference 번호를 삭제 표시 (중복 Reference가 걸린 삭제는 재구성 필요로 처리)
+    - 추가: delta에 모아 두고 변경마다 delta 인덱스만 다시 만든다 (delta는 작음)
+    - 조회: base/delta 각각 멤버 집합 번호를 구하고 (base 집합, delta 집합) 쌍 단위로 결과 문자열을 캐시
+    - 구간 조회: base/delta 각각 겹치는 Reference를 구해 출력 순서 키로 합침
+
+    각 Reference는 출력 순서 키(order_key)를 가지며, 두 인덱스의 매칭 결과를 키 순서로 합치므로
+    전체를 다시 만든 IntervalIndex와 같은 결과 문자열이 나온다.
+    """
+
+    def __init__(self, reference_list: ParsedList):
+        """
+        Args:
+            reference_list: 기준 Reference (IPv4만, 입력 위치가 출력 순서 키의 position)
+        """
+        ranked = rank_entries(reference_list)
+        collapsed = {}  # {(start_int, end_int, original): order_key} (처음 키 유지)
+        for key, start_int, end_int, ref_original in ranked:
+            collapsed.setdefault((start_int, end_int, ref_original), key)
+
+        self.base = IntervalIndex(list(collapsed))
+        self.base_keys = list(collapsed.values())
+        self.removed = set()  # 삭제된 base Reference 번호
+
+        # 입력 항목 → base Reference 번호 (Address는 주소 기준으로 하나로 합쳐짐)
+        self._address_ranks = {}  # {addr_int: rank}
+        self._span_ranks = {}  # {(start_int, end_int, original): rank}
+        for rank, ((start_int, end_int, ref_original), key) in enumerate(collapsed.items()):
+            if key[0] == ORDER_ADDRESS:
+                self._address_ranks[start_int] = rank
+            else:
+                self._span_ranks[(start_int, end_int, ref_original)] = rank
+
+        # base Reference 번호별 입력 항목 수 (중복 항목 삭제 판단용)
+        self._counts = array('I', bytes(4 * len(self.base_keys)))
+        for start_int, end_int, kind, ref_original in iter_reference_intervals(reference_list):
+            self._counts[self._rank_of(start_int, end_int, kind, ref_original)] += 1
+
+        self.delta = None  # 추가된 Reference 인덱스
+        self.delta_keys = []  # delta Reference 번호별 출력 순서 키
+        self._added = {}  # {position: (start_int, end_int, kind, original)}
+        self._label_cache = {}  # {(base set_id, delta set_id): 결과 문자열}
+
+    def __len__(self) -> int:
+        return len(self.base_keys) - len(self.removed) + len(self._added)
+
+    @property
+    def delta_size(self) -> int:
+        """base 이후 추가/삭제된 Reference 수"""
+        return len(self.removed) + len(self._added)
+
+    def _rank_of(self, start_int: int, end_int: int, kind: int, ref_original: str) -> Optional[int]:
+        if kind == KIND_SINGLE:
+            return self._address_ranks.get(start_int)
+        return self._span_ranks.get((start_int, end_int, ref_original))
+
+    def apply(self, removed: List[Tuple[int, int, int, str, float]],
+              added: List[Tuple[int, int, int, str, float]]) -> bool:
+        """
+        변경분 반영
+
+        Args:
+            removed: 삭제된 항목 [(start_int, end_int, kind, original, position), ...]
+            added: 추가된 항목 [(start_int, end_int, kind, original, position), ...]
+
+        Returns:
+            반영 성공 여부 (False면 인덱스를 다시 만들어야 함)
+        """
+        for start_int, end_int, kind, ref_original, position in removed:
+            if position in self._added:
+                del self._added[position]
+                continue
+            rank = self._rank_of(start_int, end_int, kind, ref_original)
+            if rank is None or self._counts[rank] > 1 or rank in self.removed:
+                # 중복 항목 중 하나만 삭제되면 출력 순서/original이 바뀔 수 있음
+                return False
+            self.removed.add(rank)
+
+        added_addresses = {entry[0] for entry in self._added.values() if entry[2] == KIND_SINGLE}
+        for start_int, end_int, kind, ref_original, position in added:
+            if kind & KIND_V6:
+                return False
+            if kind == KIND_SINGLE:
+                # 같은 주소가 이미 있으면 original 선택 규칙(마지막 original) 때문에 재구성
+                rank = self._address_ranks.get(start_int)
+                if (rank is not None and rank not in self.removed) or start_int in added_addresses:
+                    return False
+                added_addresses.add(start_int)
+            self._added[position] = (start_int, end_int, kind, ref_original)
+
+        self._build_delta()
+        return True
+
+    def _build_delta(self):
+        """추가된 Reference로 delta 인덱스 재생성"""
+        ranked = sorted(
+            (order_key(start_int, end_int, kind, position), start_int, end_int, ref_original)
+            for position, (start_int, end_int, kind, ref_original) in self._added.items()
+        )
+        self.delta = IntervalIndex([item[1:] for item in ranked]) if ranked else None
+        self.delta_keys = [item[0] for item in ranked]
+        self._label_cache = {}
+
+    def lookup_label(self, ip_int: int) -> str:
+        """
+        단일 IP의 매칭 결과 문자열 반환
+
+        Args:
+            ip_int: 정수형 IP
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        base_set = self.base.lookup_set(ip_int)
+        delta_set = self.delta.lookup_set(ip_int) if self.delta is not None else 0
+        label = self._label_cache.get((base_set, delta_set))
+        if label is None:
+            label = self._label_cache[(base_set, delta_set)] = self._merge_label(base_set, delta_set)
+        return label
+
+    def overlap_label(self, start_int: int, end_int: int) -> str:
+        """
+        Network/Range 구간과 겹치는 Reference 결과 문자열 반환 (base/delta 겹침 결과를 출력 순서 키로 합침)
+
+        Args:
+            start_int, end_int: 정수 구간
+
+        Returns:
+            콤마로 구분된 매칭 Reference 문자열 (매칭 없으면 빈 문자열)
+        """
+        if self.delta is None and not self.removed:
+            return self.base.overlap_label(start_int, end_int)
+
+        base_originals = self.base.originals
+        matched = [(self.base_keys[rank], base_originals[rank])
+                   for rank in self.base.overlap(start_int, end_int) if rank not in self.removed]
+        if self.delta is not None:
+            delta_originals = self.delta.originals
+            matched.extend((self.delta_keys[rank], delta_originals[rank])
+                           for rank in self.delta.overlap(start_int, end_int))
+        matched.sort(key=lambda item: item[0])
+        # 순서 유지하며 중복 제거
+        return ', '.join(dict.fromkeys(ref_original for _, ref_original in matched))
+
+    def _merge_label(self, base_set: int, delta_set: int) -> str:
+        """base/delta 멤버 집합을 출력 순서 키로 합쳐 결과 문자열 생성"""
+        if not delta_set and not self.removed:
+            return self.base.set_label(base_set)
+
+        base_originals = self.base.originals
+        matched = [(self.base_keys[rank], base_originals[rank])
+                   for rank in self.base.set_members_of(base_set) if rank not in self.removed]
+        if delta_set:
+            delta_originals = self.delta.originals
+            matched.extend((self.delta_keys[rank], delta_originals[rank])
+                           for rank in self.delta.set_members_of(delta_set))
+        matched.sort(key=lambda item: item[0])
+        # 순서 유지하며 중복 제거
+        return ', '.join(dict.fromkeys(ref_original for _, ref_original in matched))
+
+
+class ReferenceSet:
+    """
+    Reference 텍스트와 파싱 결과/매칭 인덱스를 함께 보관하고 텍스트 변경분만 반영
+
+    새 텍스트를 이전 텍스트와 줄 단위로 비교하여(공통 앞/뒤 줄 제외) 바뀐 줄만 파싱하고,
+    ParsedList는 배열 단위로 잘라 붙이며, bisect 인덱스는 IncrementalIndex로 추가/삭제만 반영한다.
+    변경분이 쌓이면(COMPACT_EDITS번 또는 COMPACT_RATIO 이상) 다음 인덱스 요청 때 전체 재구성(압축)한다.
+    """
+
+    # 압축 기준: 변경 횟수, 기준 대비 변경 항목 비율 (최소 COMPACT_MIN_ENTRIES)
+    COMPACT_EDITS = 32
+    COMPACT_RATIO = 0.05
+    COMPACT_MIN_ENTRIES = 256
+
+    def __init__(self):
+        self.reference_list = ParsedList()
+        self._lines = []  # 마지막 텍스트의 줄
+        self._line_counts = array('I')  # 줄별 유효 항목 수
+        self._positions = []  # 항목별 출력 순서 position (압축 시 0..n-1로 초기화)
+        self._incremental = None  # bisect 엔진용 IncrementalIndex
+        self._edits = 0  # 마지막 압축 이후 변경 횟수
+        self._indexes = {}  # 그 외 엔진 인덱스 캐시 {engine: index} (변경 시 무효화)
+        self.last_update = {'added': 0, 'removed': 0, 'rebuilt': False}
+
+    def update(self, text: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> ParsedList:
+        """
+        Reference 텍스트 반영
+
+        Args:
+            text: 현재 Reference 텍스트
+            progress_callback: 전체 파싱 시 진행률 콜백 함수
+
+        Returns:
+            현재 Reference ParsedList (parse_text_compact(text)와 같음)
+        """
+        lines = text.split('\n')
+        if lines == self._lines:
+            self.last_update = {'added': 0, 'removed': 0, 'rebuilt': False}
+            return self.reference_list
+
+        prefix, old_end, new_end = self._diff_lines(self._lines, lines)
+        changed_lines = (old_end - prefix) + (new_end - prefix)
+        if not self._lines or changed_lines > max(self.COMPACT_MIN_ENTRIES, len(self._lines) * self.COMPACT_RATIO):
+            self._rebuild(lines, progress_callback)
+            return self.reference_list
+
+        start = sum(self._line_counts[:prefix])
+        stop = start + sum(self._line_counts[prefix:old_end])
+        added, added_counts = IPParser.parse_lines_compact(lines[prefix:new_end])
+        positions = self._interpolate(start, stop, len(added))
+        if positions is None:
+            # 사이값 정밀도 부족 - 전체 재구성
+            self._rebuild(lines, progress_callback)
+            return self.reference_list
+
+        removed = self.reference_list[start:stop]
+        if self._incremental is not None:
+            applied = self._incremental.apply(
+                [interval + (position,) for interval, position in
+                 zip(iter_reference_intervals(removed), self._positions[start:stop])],
+                [interval + (position,) for interval, position in
+                 zip(iter_reference_intervals(added), positions)])
+            if not applied:
+                self._incremental = None
+
+        reference_list = self.reference_list[:start]
+        reference_list.extend(added)
+        reference_list.extend(self.reference_list[stop:])
+        self.reference_list = reference_list
+        self._lines = lines
+        self._line_counts = self._line_counts[:prefix] + added_counts + self._line_counts[old_end:]
+        self._positions[start:stop] = positions
+        self._indexes = {}
+        self._edits += 1
+        self.last_update = {'added': len(added), 'removed': len(removed), 'rebuilt': False}
+        return self.reference_list
+
+    def get_index(self, engine: str):
+        """
+        현재 Reference의 매칭 인덱스 (bisect는 증분 인덱스, 그 외 엔진은 변경 시 재생성)
+
+        Args:
+            engine: Matcher.ENGINES의 엔진 이름
+
+        Returns:
+            인덱스 (Reference가 없거나 legacy 엔진이면 None)
+        """
+        from core.matcher import Matcher
+
+        if not self.reference_list or Matcher.ENGINES.get(engine) is None:
+            return None
+        if engine != 'bisect' or self.reference_list.has_ipv6():
+            if engine not in self._indexes:
+                self._indexes[engine] = Matcher.build_index(self.reference_list, engine)
+            return self._indexes[engine]
+
+        if self._needs_compaction():
+            self.compact()
+        return self._incremental
+
+    def _needs_compaction(self) -> bool:
+        incremental = self._incremental
+        if incremental is None:
+            return True
+        limit = max(self.COMPACT_MIN_ENTRIES, len(incremental.base_keys) * self.COMPACT_RATIO)
+        return self._edits >= self.COMPACT_EDITS or incremental.delta_size > limit
+
+    def compact(self):
+        """변경분을 합쳐 bisect 인덱스를 현재 Reference로 다시 생성"""
+        self._positions = list(range(len(self.reference_list)))
+        self._incremental = IncrementalIndex(self.reference_list)
+        self._edits = 0
+
+    def _rebuild(self, lines: List[str], progress_callback: Optional[Callable[[int, int], None]]):
+        """전체 파싱 (인덱스는 다음 요청 때 생성)"""
+        self.reference_list, self._line_counts = IPParser.parse_lines_compact(lines, progress_callback)
+        self._lines = lines
+        self._positions = list(range(len(self.reference_list)))
+        self._incremental = None
+        self._indexes = {}
+        self._edits = 0
+        self.last_update = {'added': len(self.reference_list), 'removed': 0, 'rebuilt': True}
+
+    def _interpolate(self, start: int, stop: int, count: int) -> Optional[List[float]]:
+        """삭제 구간 [start, stop) 자리에 들어갈 항목 count개의 position (양쪽 이웃 사이값)"""
+        positions = self._positions
+        low = positions[start - 1] if start > 0 else -1.0
+        high = positions[stop] if stop < len(positions) else low + count + 1
+        step = (high - low) / (count + 1)
+        result = [low + step * (offset + 1) for offset in range(count)]
+        if result and not (low < result[0] and result[-1] < high
+                           and all(a < b for a, b in zip(result, result[1:]))):
+            return None
+        return result
+
+    @staticmethod
+    def _diff_lines(old: List[str], new: List[str]) -> Tuple[int, int, int]:
+        """
+        공통 앞/뒤 줄을 제외한 변경 구간
+
+        Returns:
+            (prefix, old_end, new_end) - old[prefix:old_end]가 new[prefix:new_end]로 바뀜
+        """
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        return prefix, len(old) - suffix, len(new) - suffix
+
+    def stats(self) -> Dict[str, int]:
+        """현재 상태 요약 (항목 수, 압축 이후 변경 횟수/변경 항목 수)"""
+        return {
+            'references': len(self.reference_list),
+            'edits': self._edits,
+            'delta': self._incremental.delta_size if self._incremental is not None else 0,
+        }
@@ -0,0 +1,385 @@
+"""
+로컬 매칭 서비스 - Reference 인덱스를 한 번만 만들어 메모리에 두고 여러 스크립트의 조회 요청에 응답
+
+HTTP/1.1(keep-alive)을 Unix 소켓 또는 localhost TCP로 제공한다.
+    POST /match  본문: {"sources": ["10.0.0.1", ...]} (JSON) 또는 콤마/개행 구분 텍스트
+                 응답: {"results": [{"source": ..., "matched_ips": ...}, ...]} (잘못된 항목은 제외)
+                 응답에는 매칭에 쓴 Reference 인덱스 버전("version")도 포함
+    GET  /stats  요청/배치 수와 지연 시간 백분위 (ms), 메모 적중/결과 문자열 표 크기, Reference 인덱스 버전/생성 시간
+
+작은 요청은 asyncio 큐에 모았다가 하나의 ParsedList로 이어 붙여 Matcher.match 한 번으로 처리한다.
+매칭은 전용 스레드 하나에서 실행하므로 이벤트 루프는 매칭 중에도 요청을 받는다.
+Reference와 인덱스는 IndexSnapshot 하나로 묶어 두고 교체만 하므로 (core.hot_reload) 조회에 잠금이 없다.
+"""
+import asyncio
+import json
+import os
+import stat
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.hot_reload import IndexSnapshot, ReferenceReloader
+from core.match_result import MatchResult, iter_rows
+from core.matcher import Matcher
+from core.parsed_list import ParsedList
+from core.parser import IPParser
+
+
+# 한 배치로 합칠 최대 Source 수
+MAX_BATCH_SOURCES = 65536
+
+# 첫 요청 이후 다른 요청을 모으는 시간 (초)
+BATCH_WINDOW = 0.001
+
+# 지연 시간 백분위 계산에 쓰는 최근 요청 수
+LATENCY_WINDOW = 10000
+
+# 요청 본문 최대 크기 (바이트)
+MAX_BODY_BYTES = 64 << 20
+
+# TCP로 받을 수 있는 주소 (외부 노출 방지)
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+# HTTP 상태 문구
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class LatencyStats:
+    """요청 지연 시간(큐 대기 + 매칭) 백분위와 배치 통계"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        """
+        Args:
+            window: 백분위 계산에 쓰는 최근 요청 수
+        """
+        self._samples = deque(maxlen=window)
+        self.requests = 0
+        self.sources = 0
+        self.batches = 0
+
+    def record_batch(self, latencies: List[float], sources: int):
+        """배치 하나의 요청별 지연 시간(초)과 Source 수 기록"""
+        self._samples.extend(latencies)
+        self.requests += len(latencies)
+        self.sources += sources
+        self.batches += 1
+
+    def percentiles(self) -> Dict[str, float]:
+        """최근 요청 지연 시간 {'p50', 'p90', 'p99', 'max'} (ms, 기록이 없으면 0)"""
+        samples = sorted(self._samples)
+        if not samples:
+            return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+        last = len(samples) - 1
+
+        def at(percent: float) -> float:
+            return round(samples[min(last, int(round(percent / 100 * last)))] * 1000, 3)
+
+        return {'p50': at(50), 'p90': at(90), 'p99': at(99), 'max': at(100)}
+
+    def snapshot(self) -> Dict:
+        """통계 dict (/stats 응답용)"""
+        return {
+            'requests': self.requests,
+            'sources': self.sources,
+            'batches': self.batches,
+            'avg_batch_requests': round(self.requests / self.batches, 2) if self.batches else 0.0,
+            'latency_ms': self.percentiles(),
+        }
+
+
+class MatchService:
+    """
+    Reference 인덱스를 메모리에 유지하고 조회 요청을 배치로 묶어 매칭하는 서비스
+
+    lookup()은 요청을 큐에 넣고 결과를 기다린다. 배치 루프는 첫 요청 이후 batch_window 동안
+    (또는 이전 배치를 매칭하는 동안) 쌓인 요청을 MAX_BATCH_SOURCES까지 합쳐 한 번에 매칭한다.
+    Source 메모는 같은 스냅샷(Reference 버전)의 요청 간에 공유되고, 결과 문자열 표가
+    MatchMemo.MAX_LABELS를 넘으면 배치가 끝난 뒤 비운다 (스냅샷 교체 시에는 새 스냅샷의 메모로 바뀜).
+
+    현재 Reference/인덱스/메모는 snapshot 하나이고, 배치는 시작할 때 읽은 스냅샷으로 끝까지 매칭한다.
+    swap()은 속성 하나만 바꾸므로 진행 중인 배치는 이전 버전으로, 이후 배치는 새 버전으로 매칭된다.
+    """
+
+    def __init__(self, reference_list: ParsedList, engine: str = Matcher.DEFAULT_ENGINE,
+                 index=None, batch_window: float = BATCH_WINDOW, build_seconds: float = 0.0,
+                 reloader: Optional[ReferenceReloader] = None):
+        """
+        Args:
+            reference_list: 파싱된 Reference 리스트
+            engine: 매칭 엔진 이름
+            index: 미리 생성한 Reference 인덱스 (없으면 engine으로 생성)
+            batch_window: 첫 요청 이후 다른 요청을 모으는 시간 (초)
+            build_seconds: reference_list/index를 만드는 데 걸린 시간 (버전 1 보고용)
+            reloader: Reference 파일 감시 (있으면 start()에서 감시를 시작하고 변경 시 swap)
+        """
+        started = time.perf_counter()
+        if index is None and reference_list and Matcher.ENGINES.get(engine) is not None:
+            index = Matcher.build_index(reference_list, engine)
+        build_seconds += time.perf_counter() - started
+        self.snapshot = IndexSnapshot(1, reference_list, index, build_seconds)
+        self.engine = engine
+        self.reloader = reloader
+        self.batch_window = batch_window
+        self.stats = LatencyStats()
+        self._queue = None  # asyncio.Queue (이벤트 루프 안에서 start()가 생성)
+        self._batch_task = None
+        self._watch_task = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='match')
+
+    def start(self):
+        """배치 루프 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._batch_task is None:
+            self._queue = asyncio.Queue()
+            self._batch_task = asyncio.get_running_loop().create_task(self._batch_loop())
+        if self.reloader is not None and self._watch_task is None:
+            self._watch_task = asyncio.get_running_loop().create_task(self.reloader.watch(self))
+
+    async def stop(self):
+        """배치 루프/파일 감시 종료 및 매칭 스레드 정리"""
+        for task in (self._batch_task, self._watch_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._batch_task = self._watch_task = None
+        self._executor.shutdown(wait=False)
+
+    def swap(self, snapshot: IndexSnapshot):
+        """현재 Reference 스냅샷 교체 (진행 중인 배치는 이전 스냅샷으로 끝남)"""
+        self.snapshot = snapshot
+
+    async def lookup(self, sources: ParsedList) -> Tuple[MatchResult, int]:
+        """
+        Source 매칭 (다른 요청과 한 배치로 처리될 수 있음)
+
+        Args:
+            sources: 파싱된 Source
+
+        Returns:
+            (sources 순서의 매칭 결과, 매칭에 쓴 Reference 인덱스 버전)
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sources, future, time.perf_counter()))
+        return await future
+
+    async def _batch_loop(self):
+        """큐의 요청을 모아 매칭 스레드에서 한 번에 매칭하고 요청별로 결과를 나눠 전달"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            pending = [await queue.get()]
+            if self.batch_window:
+                await asyncio.sleep(self.batch_window)
+            count = len(pending[0][0])
+            while count < MAX_BATCH_SOURCES and not queue.empty():
+                item = queue.get_nowait()
+                pending.append(item)
+                count += len(item[0])
+
+            try:
+                results, version = await loop.run_in_executor(self._executor, self._match_batch,
+                                                              [sources for sources, _, _ in pending])
+            except Exception as e:
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            finished = time.perf_counter()
+            for (_, future, enqueued), result in zip(pending, results):
+                if not future.done():
+                    future.set_result((result, version))
+            self.stats.record_batch([finished - enqueued for _, _, enqueued in pending], count)
+
+    def _match_batch(self, parts: List[ParsedList]) -> Tuple[List[MatchResult], int]:
+        """
+        요청별 Source를 이어 붙여 한 번 매칭하고 요청별 결과로 나눔 (매칭 스레드에서 실행)
+
+        Returns:
+            (요청별 매칭 결과, 매칭에 쓴 스냅샷 버전)
+        """
+        snapshot = self.snapshot
+        batch = ParsedList()
+        for part in parts:
+            batch.extend(part)
+        result = Matcher.match(batch, snapshot.reference_list, engine=self.engine,
+                               index=snapshot.index, memo=snapshot.memo)
+        # 이번 결과는 이전 표를 그대로 참조하므로 매칭 직후 비워도 된다 (배치는 이 스레드에서만 실행)
+        snapshot.memo.trim_labels()
+        if not isinstance(result, MatchResult):
+            # Source/Reference가 비어 있으면 빈 리스트 (Reference가 비면 모두 매칭 없음)
+            result = (MatchResult.from_dicts(result) if result
+                      else MatchResult.from_labels(batch, [''] * len(batch)))
+
+        results = []
+        offset = 0
+        for part in parts:
+            results.append(result[offset:offset + len(part)])
+            offset += len(part)
+        return results, snapshot.version
+
+    def status(self) -> Dict:
+        """서비스 상태 (/stats 응답)"""
+        current = self.snapshot
+        snapshot = {'engine': self.engine, 'references': len(current.reference_list)}
+        snapshot.update(self.stats.snapshot())
+        snapshot['memo'] = current.memo.stats()
+        snapshot['index'] = current.info()
+        if self.reloader is not None:
+            snapshot['reload'] = self.reloader.stats()
+        return snapshot
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """HTTP/1.1 연결 하나 처리 (keep-alive로 여러 요청)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_BYTES:
+                    self._write_response(writer, 413, {'error': f'본문이 너무 큽니다 (최대 {MAX_BODY_BYTES:,}바이트)'},
+                                         keep_alive=False)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._dispatch(method, path.split('?', 1)[0], headers, body)
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' or (version != 'HTTP/1.0' and connection != 'close')
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # 잘못된 요청 줄/헤더 또는 클라이언트가 연결을 끊음
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, headers: Dict[str, str],
+                        body: bytes) -> Tuple[int, Dict]:
+        """요청 경로별 처리 (상태 코드, 응답 JSON)"""
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': 'GET만 지원합니다'}
+            return 200, self.status()
+        if path != '/match':
+            return 404, {'error': f'알 수 없는 경로: {path}'}
+        if method != 'POST':
+            return 405, {'error': 'POST만 지원합니다'}
+
+        try:
+            sources = parse_request_body(body, headers.get('content-type', ''))
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            return 400, {'error': f'요청 본문 오류: {e}'}
+        if not self.snapshot.reference_list and not sources.all_single():
+            return 400, {'error': 'Network/Range 또는 IPv6 Source는 Reference 파일로 시작한 서비스에서만 매칭할 수 있습니다'}
+        try:
+            result, version = await self.lookup(sources)
+        except Exception as e:
+            return 500, {'error': str(e)}
+        return 200, {'version': version, 'results': [{'source': source, 'matched_ips': matched_ips}
+                                 for source, matched_ips in iter_rows(result)]}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool):
+        """JSON 응답 기록"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+
+
+def parse_request_body(body: bytes, content_type: str = '') -> ParsedList:
+    """
+    /match 요청 본문을 ParsedList로 파싱 (잘못된 항목은 제외)
+
+    Args:
+        body: 요청 본문
+        content_type: Content-Type 헤더 (application/json이면 {"sources": [...]} 또는 [...])
+
+    Returns:
+        파싱된 Source
+    """
+    text = body.decode('utf-8')
+    if 'json' not in content_type.lower():
+        return IPParser.parse_text_compact(text)
+    data = json.loads(text)
+    items = data.get('sources') if isinstance(data, dict) else data
+    if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+        raise ValueError('"sources"는 문자열 배열이어야 합니다')
+    return ParsedList.from_items(item.strip() for item in items)
+
+
+def parse_address(address: str) -> Tuple[str, object]:
+    """
+    서비스 주소 해석
+
+    Args:
+        address: 포트('8787'), 'host:port'(로컬 주소만) 또는 Unix 소켓 경로
+
+    Returns:
+        ('tcp', (host, port)) 또는 ('unix', path)
+    """
+    if address.isdigit():
+        return 'tcp', ('127.0.0.1', int(address))
+    host, separator, port = address.rpartition(':')
+    if separator and port.isdigit() and '/' not in address:
+        host = host.strip('[]')
+        if host not in LOCAL_HOSTS:
+            raise ValueError(f"로컬 주소만 사용할 수 있습니다: {host}")
+        return 'tcp', (host, int(port))
+    return 'unix', address
+
+
+async def serve(service: MatchService, address: str,
+                ready_callback: Optional[Callable[[str], None]] = None):
+    """
+    서비스 실행 (취소될 때까지)
+
+    Args:
+        service: 매칭 서비스
+        address: parse_address 참고
+        ready_callback: 요청을 받을 준비가 되면 실제 주소 문자열로 호출
+    """
+    kind, target = parse_address(address)
+    if kind == 'unix':
+        # 이전 실행이 남긴 소켓 파일만 제거 (일반 파일은 건드리지 않음)
+        if os.path.exists(target) and stat.S_ISSOCK(os.stat(target).st_mode):
+            os.unlink(target)
+        server = await asyncio.start_unix_server(service.handle_connection, path=target)
+        description = f"unix:{target}"
+    else:
+        server = await asyncio.start_server(service.handle_connection, host=target[0], port=target[1])
+        host, port = server.sockets[0].getsockname()[:2]
+        description = f"http://{host}:{port}"
+
+    service.start()
+    if ready_callback:
+        ready_callback(description)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+        if kind == 'unix' and os.path.exists(target):
+            os.unlink(target)
@@ -0,0 +1,105 @@
+"""스트리밍 파일 매칭 - 읽기(청크) → 파싱 → 매칭 → 결과 쓰기를 제한된 메모리로 처리"""
+from typing import List, Dict, Optional, Callable
+import csv
+import os
+import time
+from core.parser import IPParser
+from core.exporter import text_encoding
+from core.match_result import iter_rows
+from core.matcher import Matcher
+from core.memo import MatchMemo
+
+
+class ThroughputCounter:
+    """처리량 카운터 (초당 처리 Source 항목 수)
+
+    한 줄에 콤마로 여러 항목이 있거나 잘못된 줄이 있으면 줄 수와 다르므로 파싱된 항목 수로 센다.
+    """
+
+    def __init__(self):
+        self.items = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def add(self, count: int):
+        """처리한 Source 항목 수 누적"""
+        self.items += count
+
+    def finish(self):
+        """측정 종료"""
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """경과 시간 (초)"""
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        """초당 처리 Source 항목 수"""
+        elapsed = self.elapsed
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.items:,}개 / {self.elapsed:.1f}초 ({self.items_per_second:,.0f}개/초)"
+
+
+def stream_match(source_path: str, output_path: str, reference_list: List[Dict],
+                 index=None, engine: str = Matcher.DEFAULT_ENGINE,
+                 delimiter: str = '\t', batch_size: int = 10000,
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 counter: Optional[ThroughputCounter] = None,
+                 memo: Optional[MatchMemo] = None) -> ThroughputCounter:
+    """
+    Source 파일을 청크 단위로 읽어 매칭하고 결과를 바로 파일에 기록
+    메모리에는 배치 하나(batch_size개)의 Source와 결과만 유지한다.
+
+    Args:
+        source_path: Source IP 파일 경로 (콤마/개행 구분)
+        output_path: 결과 파일 경로 (헤더 + '대상 IP<구분자>매칭된 IP' 행)
+        reference_list: 파싱된 Reference 리스트
+        index: 미리 생성한 Reference 인덱스 (없으면 engine으로 한 번 생성)
+        engine: 매칭 엔진 이름
+        delimiter: 결과 파일 구분자 ('\\t': TSV, ',': CSV)
+        batch_size: 한 번에 매칭할 Source 개수
+        progress_callback: 진행률 콜백 함수 (읽은 바이트, 전체 바이트)
+        counter: 처리량 카운터 (없으면 새로 생성)
+        memo: 배치 간에 공유할 매칭 메모 (없으면 한 번 생성, 커버리지 비트맵도 한 번만 생성,
+              결과 문자열 표가 MatchMemo.MAX_LABELS를 넘으면 배치 후 비움)
+
+    Returns:
+        처리량 카운터
+
+    Raises:
+        ValueError: Reference와 인덱스가 모두 없는 경우
+    """
+    if not reference_list and index is None:
+        raise ValueError("Reference가 비어 있습니다.")
+
+    counter = counter or ThroughputCounter()
+    if index is None and Matcher.ENGINES.get(engine) is not None:
+        index = Matcher.build_index(reference_list, engine)
+
+    # 배치 간에도 같은 Source는 한 번만 매칭 (Reference가 같으므로 메모 공유)
+    memo = memo if memo is not None else MatchMemo()
+    total_bytes = os.path.getsize(source_path)
+
+    with open(source_path, 'r', encoding='utf-8') as source_file, \
+            open(output_path, 'w', encoding=text_encoding(output_path), newline='') as output_file:
+        writer = csv.writer(output_file, delimiter=delimiter)
+        writer.writerow(['대상 IP', '매칭된 IP'])
+
+        for batch in IPParser.iter_compact_batches(source_file, batch_size):
+            results = Matcher.match(batch, reference_list, engine=engine, index=index, memo=memo)
+            writer.writerows(iter_rows(results))
+            counter.add(len(batch))
+            # 결과 문자열은 이미 기록했으므로 표가 커지면 메모와 함께 비움 (입력 크기와 무관한 메모리)
+            memo.trim_labels()
+
+            if progress_callback:
+                # 텍스트 모드 tell()은 느리므로 바이트 위치는 내부 버퍼 기준으로 추정
+                progress_callback(min(source_file.buffer.tell(), total_bytes), total_bytes)
+
+    counter.finish()
+    return counter
@@ -0,0 +1,192 @@
+"""NumPy 벡터화 배치 매칭 엔진 (NumPy가 없으면 사용 불가, Matcher가 순수 Python 엔진으로 대체)"""
+from array import array
+from typing import List, Dict, Optional, Callable, Union
+import importlib.util
+import ipaddress
+from core.interval_index import IntervalIndex
+from core.match_result import LabelTable
+from core.memo import MatchMemo
+from core.parsed_list import ParsedList
+from utils.ip_utils import KIND_SINGLE
+
+# NumPy는 import 비용이 커서(~80ms) 실제로 인덱스를 만들 때 불러온다 (CLI 시작 시간 단축)
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+np = None
+
+
+def _import_numpy():
+    """NumPy 지연 import"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+class VectorizedIndex:
+    """
+    정렬 구간 인덱스를 NumPy 배열로 옮겨 Source를 배치 단위로 매칭하는 인덱스
+
+    - Single IP: uint32 배열에 대해 searchsorted 한 번으로 기본 구간 번호를 구하고,
+      멤버 집합 번호를 그대로 결과 번호로 쓴다 (결과 문자열은 표시할 때 집합마다 한 번만 생성).
+    - Network/Range: 정렬 구간 인덱스의 구간 겹침 조회 (Reference 전체를 비교하지 않음)
+    """
+
+    # 한 번에 처리할 Source 개수 (진행률 콜백 단위)
+    BATCH_SIZE = 65536
+
+    def __init__(self, reference_list: Union[List[Dict], ParsedList]):
+        """
+        Args:
+            reference_list: 파싱된 Reference 리스트 (dict 리스트 또는 ParsedList)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy가 설치되어 있지 않습니다.")
+        _import_numpy()
+
+        self.interval = IntervalIndex.from_references(reference_list)
+        self.bounds = np.frombuffer(self.interval.bounds, dtype=np.uint32)
+        self.segment_sets = np.frombuffer(self.interval.segment_sets, dtype=np.uint32)
+
+    @classmethod
+    def from_references(cls, reference_list: Union[List[Dict], ParsedList]) -> 'VectorizedIndex':
+        """파싱된 Reference 리스트로 인덱스 생성"""
+        return cls(reference_list)
+
+    def __len__(self) -> int:
+        return len(self.interval)
+
+    def lookup_label(self, ip_int: int) -> str:
+        """단일 IP의 매칭 결과 문자열 (스칼라 조회, 정렬 구간 인덱스 사용)"""
+        return self.interval.lookup_label(ip_int)
+
+    def match_labels(self, parsed_list: List,
+                     progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Optional[str]]:
+        """
+        파싱된 Source 값 리스트의 매칭 결과 문자열을 배치로 계산
+
+        Args:
+            parsed_list: Source의 'parsed' 값 리스트
+            progress_callback: 진행률 콜백 함수 (배치마다 호출)
+
+        Returns:
+            Source별 매칭 문자열 리스트 (지원하지 않는 타입은 None)
+        """
+        total = len(parsed_list)
+        labels = []
+
+        for batch_start in range(0, total, self.BATCH_SIZE):
+            batch = parsed_list[batch_start:batch_start + self.BATCH_SIZE]
+            labels.extend(self._match_batch(batch))
+            if progress_callback:
+                progress_callback(batch_start + len(batch), total)
+
+        return labels
+
+    def match_column_ids(self, parsed_list: ParsedList, table: LabelTable,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         memo: Optional[MatchMemo] = None) -> array:
+        """
+        ParsedList의 정수 컬럼을 복사 없이 NumPy 배열로 보고 배치 매칭하여 행별 결과 번호 반환
+        Single IP는 기본 구간의 멤버 집합 번호를 그대로 결과 번호로 쓰므로 결과 문자열을 만들지 않는다.
+
+        Args:
+            parsed_list: 컬럼형 Source 리스트
+            table: 결과 번호 표 (table.index가 이 인덱스의 정렬 구간 인덱스일 때 멤버 집합 번호 사용)
+            progress_callback: 진행률 콜백 함수 (배치마다 호출)
+            memo: Network/Range Source 결과 메모 (같은 구간은 한 번만 조회)
+
+        Returns:
+            Source별 결과 번호 array('I')
+        """
+        label_ids = array('I')
+        total = len(parsed_list)
+        if not total:
+            return label_ids
+
+        starts = np.frombuffer(parsed_list.starts, dtype=np.uint32)
+        ends = np.frombuffer(parsed_list.ends, dtype=np.uint32)
+        kinds = np.frombuffer(parsed_list.kinds, dtype=np.uint8)
+        intern = table.intern
+        use_sets = table.index is self.interval
+
+        def interval_id(source_start: int, source_end: int) -> int:
+            return intern(self._match_interval(source_start, source_end))
+
+        match_interval_id = (memo or MatchMemo()).cached('interval', interval_id)
+
+        for batch_start in range(0, total, self.BATCH_SIZE):
+            batch_end = min(batch_start + self.BATCH_SIZE, total)
+            batch_kinds = kinds[batch_start:batch_end]
+            is_single = batch_kinds == KIND_SINGLE
+            if use_sets:
+                batch_ids = self._single_set_ids(starts[batch_start:batch_end], is_single)
+            else:
+                batch_labels = self._label_singles(starts[batch_start:batch_end], is_single).tolist()
+                batch_ids = np.fromiter(map(intern, batch_labels), dtype=np.uint32, count=len(batch_labels))
+            for position in np.flatnonzero(~is_single).tolist():
+                idx = batch_start + position
+                batch_ids[position] = match_interval_id(int(starts[idx]), int(ends[idx]))
+            label_ids.frombytes(batch_ids.tobytes())
+            if progress_callback:
+                progress_callback(batch_end, total)
+
+        return label_ids
+
+    def _match_batch(self, batch: List) -> List[Optional[str]]:
+        """배치 하나를 매칭"""
+        count = len(batch)
+        is_single = np.fromiter(
+            (isinstance(parsed, ipaddress.IPv4Address) for parsed in batch), dtype=bool, count=count)
+        ips = np.fromiter(
+            (int(parsed) if single else 0 for parsed, single in zip(batch, is_single.tolist())),
+            dtype=np.uint32, count=count)
+
+        labels = self._label_singles(ips, is_single)
+
+        # Network/Range: Source마다 정렬 구간 인덱스의 구간 조회(overlap_label, O(log R + k))로 매칭
+        for position in np.flatnonzero(~is_single).tolist():
+            labels[position] = self._match_span(batch[position])
+
+        return labels.tolist()
+
+    def _single_set_ids(self, ips, is_single):
+        """Single IP 위치의 멤버 집합 번호 배열 (uint32, 그 외 위치와 매칭 없음은 0)"""
+        set_ids = np.zeros(len(ips), dtype=np.uint32)
+        segments = np.searchsorted(self.bounds, ips, side='right').astype(np.int64) - 1
+        hit = is_single & (segments >= 0)
+        set_ids[hit] = self.segment_sets[segments[hit]]
+        return set_ids
+
+    def _label_singles(self, ips, is_single):
+        """
+        Single IP 위치의 결과 문자열 배열 생성 (그 외 위치는 빈 문자열)
+        기본 구간 번호를 구한 뒤 고유 멤버 집합별로 한 번만 결과 문자열을 만든다.
+        """
+        labels = np.full(len(ips), '', dtype=object)
+
+        segments = np.searchsorted(self.bounds, ips, side='right').astype(np.int64) - 1
+        hit = is_single & (segments >= 0)
+        if hit.any():
+            set_ids = self.segment_sets[segments[hit]]
+            unique_sets, inverse = np.unique(set_ids, return_inverse=True)
+            set_label = self.interval.set_label
+            unique_labels = np.array([set_label(set_id) for set_id in unique_sets.tolist()],
+                                     dtype=object)
+            labels[hit] = unique_labels[inverse]
+
+        return labels
+
+    def _match_span(self, source_parsed) -> Optional[str]:
+        """Network/Range Source 하나를 매칭 (Set 등 하위 호환 타입은 None)"""
+        if isinstance(source_parsed, ipaddress.IPv4Network):
+            return self._match_interval(int(source_parsed.network_address),
+                                        int(source_parsed.broadcast_address))
+        if isinstance(source_parsed, tuple):
+            return self._match_interval(source_parsed[0], source_parsed[1])
+        # Set 등 하위 호환 타입은 Matcher가 처리
+        return None
+
+    def _match_interval(self, source_start: int, source_end: int) -> str:
+        """Network/Range 구간 하나를 정렬 구간 인덱스의 구간 조회로 매칭 (O(log R + k))"""
+        return self.interval.overlap_label(source_start, source_end)
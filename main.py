@@ -1,13 +1,19 @@
 """
 IP Network Matcher & Diff Tool
 메인 애플리케이션 진입점
+
+인자 없이 실행하면 GUI, 인자가 있으면 명령줄 모드(cli.py)로 실행
 """
-import customtkinter as ctk
-from ui.main_window import MainWindow
+import multiprocessing
+import sys
 
 
 def main():
     """애플리케이션 메인 함수"""
+    # GUI 모듈은 GUI 실행 시에만 import (명령줄 모드 시작 시간 단축)
+    import customtkinter as ctk
+    from ui.main_window import MainWindow
+    
     # 라이트 테마 설정 (모던한 느낌)
     ctk.set_appearance_mode("light")
     # 기본 테마 사용
@@ -22,5 +28,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 병렬 매칭 워커 프로세스 지원
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        import cli
+        sys.exit(cli.main())
     main()
 
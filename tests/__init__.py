@@ -0,0 +1 @@
+"""매칭 결과 검증 테스트 (python -m unittest discover tests 또는 pytest)"""
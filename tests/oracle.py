@@ -0,0 +1,122 @@
+"""
+테스트용 기준 구현 (core 모듈을 쓰지 않고 ipaddress로 전체 비교)
+
+인덱스 엔진/저장 파일/증분 갱신 결과를 같은 입력에 대한 이 결과와 비교한다.
+"""
+import ipaddress
+import random
+from typing import List, Optional, Tuple
+
+# 출력 순서 카테고리 (Address → Network → Range)
+_ADDRESS, _NETWORK, _RANGE = 0, 1, 2
+
+
+def _parse(item: str) -> Tuple[int, int, int, int]:
+    """항목 하나를 (family, start_int, end_int, 카테고리)로 변환"""
+    if '-' in item:
+        start, end = (ipaddress.ip_address(part.strip()) for part in item.split('-', 1))
+        return start.version, int(start), int(end), _RANGE
+    if '/' in item:
+        network = ipaddress.ip_network(item, strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address), _NETWORK
+    address = ipaddress.ip_address(item)
+    return address.version, int(address), int(address), _ADDRESS
+
+
+def split_items(text: str) -> List[str]:
+    """콤마/개행으로 나눈 빈 값이 아닌 항목"""
+    return [item.strip() for item in text.replace(',', '\n').splitlines() if item.strip()]
+
+
+def rank(reference_text: str) -> List[Tuple[int, int, int, str]]:
+    """
+    Reference를 출력 순서로 정렬
+
+    - Address: 같은 주소는 처음 위치에 하나만 (마지막 original)
+    - Network: prefix 길이가 긴 순서, 같은 길이는 입력 순서
+    - Range: 입력 순서
+
+    Returns:
+        [(family, start_int, end_int, original), ...]
+    """
+    addresses = {}
+    ranked = []
+    for position, item in enumerate(split_items(reference_text)):
+        family, start, end, category = _parse(item)
+        if category == _ADDRESS:
+            key = addresses[(family, start)][0] if (family, start) in addresses else (category, 0, position)
+            addresses[(family, start)] = (key, item)
+        else:
+            size = end - start if category == _NETWORK else 0
+            ranked.append(((category, size, position), family, start, end, item))
+    for (family, start), (key, item) in addresses.items():
+        ranked.append((key, family, start, start, item))
+    ranked.sort(key=lambda entry: entry[0])
+    return [entry[1:] for entry in ranked]
+
+
+def naive_match(source_text: str, reference_text: str) -> List[Tuple[str, str]]:
+    """
+    Source마다 구간이 겹치는 모든 Reference를 출력 순서로 나열
+
+    Returns:
+        [(source, matched_ips), ...] (matched_ips는 ', '로 연결, 같은 original은 한 번)
+    """
+    ranked = rank(reference_text)
+    rows = []
+    for item in split_items(source_text):
+        family, start, end, _ = _parse(item)
+        labels = dict.fromkeys(original for ref_family, ref_start, ref_end, original in ranked
+                               if ref_family == family and ref_start <= end and start <= ref_end)
+        rows.append((item, ', '.join(labels)))
+    return rows
+
+
+def rows(results) -> List[Tuple[str, str]]:
+    """매칭 결과(MatchResult 또는 dict 리스트)를 (source, matched_ips) 리스트로 변환"""
+    return [(row['source'], row['matched_ips']) for row in results]
+
+
+def first_mismatch(results, expected: List[Tuple[str, str]]) -> Optional[Tuple[int, Tuple, Tuple]]:
+    """
+    매칭 결과와 기대값의 첫 번째 다른 행 (수천 행 리스트 전체 diff 대신 실패 메시지로 사용)
+
+    Returns:
+        (행 번호, 결과 행, 기대 행) 또는 None (같으면)
+    """
+    actual = rows(results)
+    for position, (got, want) in enumerate(zip(actual, expected)):
+        if got != want:
+            return position, got, want
+    if len(actual) != len(expected):
+        position = min(len(actual), len(expected))
+        return (position, actual[position] if position < len(actual) else None,
+                expected[position] if position < len(expected) else None)
+    return None
+
+
+def random_items(rng: random.Random, count: int, ipv6: bool = False) -> List[str]:
+    """
+    좁은 주소 공간(10.0.0.0/12)에 몰린 Address/Network/Range 항목 생성 (겹침과 중복이 많음)
+    ipv6이면 2001:db8::/32 항목도 일부 섞는다.
+    """
+    def address() -> int:
+        return int(ipaddress.IPv4Address('10.0.0.0')) + rng.randrange(1 << 20)
+
+    items = []
+    for _ in range(count):
+        if ipv6 and rng.random() < 0.05:
+            base = int(ipaddress.IPv6Address('2001:db8::')) + rng.randrange(1 << 40)
+            items.append(str(ipaddress.IPv6Network((base, rng.choice([48, 64, 96, 128])), strict=False)))
+            continue
+        roll = rng.random()
+        if roll < 0.4:
+            prefix = rng.choice([16, 18, 20, 22, 24, 26, 28, 30, 32])
+            items.append(str(ipaddress.IPv4Network((address(), prefix), strict=False)))
+        elif roll < 0.7:
+            start = address()
+            end = start + rng.randrange(1 << rng.choice([4, 8, 12, 16]))
+            items.append(f"{ipaddress.IPv4Address(start)}-{ipaddress.IPv4Address(end)}")
+        else:
+            items.append(str(ipaddress.IPv4Address(address())))
+    return items
@@ -0,0 +1,77 @@
+"""모든 매칭 엔진을 기준 구현(전체 비교)과 비교"""
+import random
+import unittest
+from unittest import mock
+
+import core.interval_index as interval_index
+from core.matcher import Matcher
+from core.memo import MatchMemo
+from core.parser import IPParser
+from tests.oracle import first_mismatch, naive_match, random_items
+
+
+class EngineOracleTest(unittest.TestCase):
+    """엔진별 매칭 결과가 naive_match와 같은지 확인"""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(7)
+        cls.reference_text = '\n'.join(random_items(rng, 300, ipv6=True))
+        cls.source_text = '\n'.join(random_items(rng, 2000, ipv6=True))
+        cls.expected = naive_match(cls.source_text, cls.reference_text)
+
+    def assert_engines_match(self, source_text, reference_text, expected):
+        # dict 리스트(기존 파서)와 ParsedList(컬럼형 파서) 입력 모두 확인
+        inputs = {
+            'dict': (IPParser.parse_text_input(source_text), IPParser.parse_text_input(reference_text)),
+            'compact': (IPParser.parse_text_compact(source_text), IPParser.parse_text_compact(reference_text)),
+        }
+        for engine in Matcher.ENGINES:
+            for form, (sources, references) in inputs.items():
+                with self.subTest(engine=engine, form=form):
+                    result = Matcher.match(sources, references, engine=engine, memo=MatchMemo())
+                    self.assertIsNone(first_mismatch(result, expected))
+
+    def test_all_engines(self):
+        self.assert_engines_match(self.source_text, self.reference_text, self.expected)
+
+    def test_lazy_member_sets(self):
+        # 멤버 슬롯 상한을 0으로 낮춰 큰 집합의 멤버를 조회 시 계산하는 경로 확인
+        with mock.patch.object(interval_index, 'INLINE_SET_SIZE', 1), \
+                mock.patch.object(interval_index, 'MAX_SLOTS_PER_REFERENCE', 0):
+            self.assert_engines_match(self.source_text, self.reference_text, self.expected)
+
+    def test_nested_ranges(self):
+        # 깊게 중첩된 Range - 기본 구간마다 큰 멤버 집합
+        references = [f"10.0.{i}.0-10.0.{255 - i}.255" for i in range(100)]
+        reference_text = '\n'.join(references)
+        source_text = '\n'.join([f"10.0.{i}.1" for i in range(0, 256, 3)] + ['10.0.50.0/24', '10.0.0.0/16'])
+        self.assert_engines_match(source_text, reference_text, naive_match(source_text, reference_text))
+
+    def test_prebuilt_index(self):
+        sources = IPParser.parse_text_compact(self.source_text)
+        references = IPParser.parse_text_compact(self.reference_text)
+        for engine in Matcher.ENGINES:
+            if Matcher.ENGINES[engine] is None:
+                continue
+            with self.subTest(engine=engine):
+                index = Matcher.build_index(references, engine)
+                result = Matcher.match(sources, references, engine=engine, index=index)
+                self.assertIsNone(first_mismatch(result, self.expected))
+
+    def test_parallel(self):
+        ipv4 = '\n'.join(item for item in self.source_text.split('\n') if ':' not in item)
+        sources = IPParser.parse_text_compact(ipv4)
+        references = IPParser.parse_text_compact(self.reference_text)
+        result = Matcher.match(sources, references, workers=2)
+        self.assertIsNone(first_mismatch(result, naive_match(ipv4, self.reference_text)))
+
+    def test_no_references(self):
+        sources = IPParser.parse_text_compact(self.source_text)
+        for engine in Matcher.ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(list(Matcher.match(sources, IPParser.parse_text_compact(''), engine=engine)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
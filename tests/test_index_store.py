@@ -0,0 +1,83 @@
+"""컴파일된 Reference 인덱스 저장/불러오기"""
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import core.interval_index as interval_index
+from core.index_store import content_hash, load_index, save_index
+from core.interval_index import IntervalIndex
+from core.matcher import Matcher
+from core.parser import IPParser
+from tests.oracle import first_mismatch, naive_match, random_items
+
+
+class IndexStoreTest(unittest.TestCase):
+    """save_index → load_index 결과가 원래 인덱스/기준 구현과 같은지 확인"""
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.reference_text = '\n'.join(random_items(rng, 400))
+        self.source_text = '\n'.join(random_items(rng, 1500))
+        self.references = IPParser.parse_text_compact(self.reference_text)
+        self.sources = IPParser.parse_text_compact(self.source_text)
+        self.expected = naive_match(self.source_text, self.reference_text)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, 'reference_index.bin')
+
+    def roundtrip(self):
+        save_index(self.path, IntervalIndex.from_references(self.references), self.reference_text)
+        compiled = load_index(self.path)
+        self.addCleanup(compiled.close)
+        return compiled
+
+    def match(self, index, engine='bisect'):
+        return Matcher.match(self.sources, self.references, engine=engine, index=index)
+
+    def test_roundtrip(self):
+        compiled = self.roundtrip()
+        self.assertEqual(compiled.content_hash, content_hash(self.reference_text))
+        self.assertIsNone(first_mismatch(self.match(compiled.index), self.expected))
+        self.assertIsNone(first_mismatch(self.match(compiled.build_prefix_index(), 'hash'), self.expected))
+
+    def test_roundtrip_lazy_sets(self):
+        with mock.patch.object(interval_index, 'INLINE_SET_SIZE', 1), \
+                mock.patch.object(interval_index, 'MAX_SLOTS_PER_REFERENCE', 0):
+            compiled = self.roundtrip()
+            self.assertIsNone(first_mismatch(self.match(compiled.index), self.expected))
+
+    def test_close_keeps_index_usable(self):
+        compiled = self.roundtrip()
+        prefix_index = compiled.build_prefix_index()
+        compiled.close()
+        compiled.close()
+        self.assertIsNone(first_mismatch(self.match(compiled.index), self.expected))
+        self.assertIsNone(first_mismatch(self.match(prefix_index, 'hash'), self.expected))
+        # 해제 후에는 같은 경로에 다시 저장할 수 있어야 함
+        save_index(self.path, compiled.index, self.reference_text)
+        reloaded = load_index(self.path)
+        self.addCleanup(reloaded.close)
+        self.assertIsNone(first_mismatch(self.match(reloaded.index), self.expected))
+
+    def test_close_retry_after_export(self):
+        compiled = self.roundtrip()
+        view = memoryview(compiled._mapped)
+        with self.assertRaises(BufferError):
+            compiled.close()
+        view.release()
+        compiled.close()
+        self.assertIsNone(first_mismatch(self.match(compiled.index), self.expected))
+
+    def test_rejects_invalid_file(self):
+        for content in (b'', b'not an index', b'\0' * 4096):
+            with self.subTest(content=content[:16]):
+                with open(self.path, 'wb') as f:
+                    f.write(content)
+                with self.assertRaises(ValueError):
+                    load_index(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
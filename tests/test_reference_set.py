@@ -0,0 +1,90 @@
+"""ReferenceSet 증분 갱신을 전체 재구성과 비교"""
+import random
+import unittest
+
+from core.matcher import Matcher
+from core.parser import IPParser
+from core.reference_set import ReferenceSet
+from tests.oracle import first_mismatch, naive_match, random_items
+
+
+def parsed_rows(parsed):
+    return list(zip(parsed.originals(), parsed.intervals()))
+
+
+class ReferenceSetTest(unittest.TestCase):
+    """줄 수정/추가/삭제 후 파싱 결과와 매칭 결과가 텍스트를 처음부터 처리한 것과 같은지 확인"""
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.lines = random_items(self.rng, 500)
+        self.source_text = '\n'.join(random_items(self.rng, 1000))
+        self.sources = IPParser.parse_text_compact(self.source_text)
+
+    def edit(self):
+        """무작위 위치의 줄 몇 개를 바꾸거나 추가/삭제"""
+        lines = self.lines
+        start = self.rng.randrange(len(lines))
+        stop = min(len(lines), start + self.rng.randrange(4))
+        lines[start:stop] = random_items(self.rng, self.rng.randrange(4))
+
+    def assert_consistent(self, reference_set, engines=('bisect',)):
+        text = '\n'.join(self.lines)
+        self.assertEqual(parsed_rows(reference_set.reference_list), parsed_rows(IPParser.parse_text_compact(text)))
+        expected = naive_match(self.source_text, text)
+        for engine in engines:
+            with self.subTest(engine=engine):
+                index = reference_set.get_index(engine)
+                result = Matcher.match(self.sources, reference_set.reference_list, engine=engine, index=index)
+                self.assertIsNone(first_mismatch(result, expected))
+
+    def test_incremental_edits(self):
+        reference_set = ReferenceSet()
+        reference_set.update('\n'.join(self.lines))
+        reference_set.get_index('bisect')
+        for _ in range(20):
+            self.edit()
+            reference_set.update('\n'.join(self.lines))
+            self.assertFalse(reference_set.last_update['rebuilt'])
+            self.assert_consistent(reference_set)
+        self.assertGreater(reference_set.get_index('bisect').delta_size, 0)
+
+    def test_compaction(self):
+        reference_set = ReferenceSet()
+        reference_set.update('\n'.join(self.lines))
+        reference_set.get_index('bisect')
+        for _ in range(ReferenceSet.COMPACT_EDITS + 1):
+            self.edit()
+            reference_set.update('\n'.join(self.lines))
+        self.assert_consistent(reference_set)
+        self.assertEqual(reference_set.get_index('bisect').delta_size, 0)
+
+    def test_other_engines_rebuilt(self):
+        reference_set = ReferenceSet()
+        reference_set.update('\n'.join(self.lines))
+        engines = [engine for engine in Matcher.ENGINES if Matcher.ENGINES[engine] is not None]
+        self.assert_consistent(reference_set, engines)
+        for _ in range(3):
+            self.edit()
+            reference_set.update('\n'.join(self.lines))
+            self.assert_consistent(reference_set, engines)
+
+    def test_full_replace(self):
+        reference_set = ReferenceSet()
+        reference_set.update('\n'.join(self.lines))
+        reference_set.get_index('bisect')
+        self.lines = random_items(self.rng, 500)
+        reference_set.update('\n'.join(self.lines))
+        self.assertTrue(reference_set.last_update['rebuilt'])
+        self.assert_consistent(reference_set)
+
+    def test_unchanged_text(self):
+        reference_set = ReferenceSet()
+        text = '\n'.join(self.lines)
+        first = reference_set.update(text)
+        self.assertIs(reference_set.update(text), first)
+        self.assertEqual(reference_set.last_update, {'added': 0, 'removed': 0, 'rebuilt': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
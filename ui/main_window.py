@@ -4,12 +4,21 @@ from tkinter import filedialog
 from tkinter import PhotoImage
 from tkinter import messagebox
 from tkinter import Menu
+from tkinter import BooleanVar
 import threading
 import os
 import sys
 import json
+from typing import Optional
 from core.parser import IPParser
 from core.matcher import Matcher
+from core.parallel import PARALLEL_MIN_SOURCES
+from core.index_store import save_index, load_index, content_hash
+from core.stream import stream_match, ThroughputCounter
+from core.exporter import export_results
+from core.reference_set import ReferenceSet, IncrementalIndex
+from core.memo import MatchMemo
+from core.progress import ProgressState, AnalysisCancelled
 from ui.input_panel import InputPanel
 from ui.result_grid import ResultGrid
 
@@ -17,6 +26,9 @@ from ui.result_grid import ResultGrid
 class MainWindow:
     """메인 윈도우 클래스"""
     
+    # 작업 진행 상태 표시 주기 (ms)
+    PROGRESS_POLL_MS = 100
+    
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("IP Network Matcher")
@@ -27,8 +39,13 @@ class MainWindow:
         # 데이터 저장
         self.source_data = []
         self.reference_data = []
-        self.reference_cache = None  # Reference 파싱 캐시
+        self.reference_set = ReferenceSet()  # Reference 파싱/인덱스 (텍스트 변경분만 반영)
+        self.reference_index = None  # Reference 매칭 인덱스 캐시
+        self.reference_index_engine = None  # 캐시된 인덱스의 매칭 엔진
+        self.reference_index_key = None  # 캐시된 인덱스를 만든 Reference 텍스트 (strip, 재사용 시 비교)
+        self.reference_compiled = None  # 불러온 컴파일된 인덱스 (같은 파일에 다시 저장하기 전에 mmap 해제)
         self._last_reference_text = ''  # 마지막 Reference 텍스트 (캐시 무효화용)
+        self._job = None  # 실행 중인 작업 {'progress': ProgressState, 'outcome': ...}
         
         # 실행 경로 설정 (JSON 저장 위치)
         self._setup_app_path()
@@ -114,6 +131,8 @@ class MainWindow:
         
         # JSON 파일 경로
         self.reference_json_path = os.path.join(self.app_path, 'reference_data.json')
+        # 컴파일된 Reference 인덱스 경로 (불러오기 시 파싱/인덱스 생성 생략)
+        self.reference_index_path = os.path.join(self.app_path, 'reference_index.bin')
     
     def setup_menu(self):
         """메뉴바 설정"""
@@ -125,13 +144,21 @@ class MainWindow:
         file_menu.add_command(label="Reference 저장", command=self.save_reference)
         file_menu.add_command(label="Reference 불러오기", command=self.load_reference)
         file_menu.add_separator()
+        file_menu.add_command(label="대용량 파일 매칭...", command=self.start_stream_match)
+        file_menu.add_separator()
         file_menu.add_command(label="종료", command=self.root.quit)
         
+        # 옵션 메뉴
+        option_menu = Menu(menubar, tearoff=0)
+        self.longest_prefix_var = BooleanVar(value=False)
+        option_menu.add_checkbutton(label="최장 prefix만 표시", variable=self.longest_prefix_var)
+        
         # Info 메뉴
         info_menu = Menu(menubar, tearoff=0)
         info_menu.add_command(label="정보", command=self.show_info)
         
         menubar.add_cascade(label="파일", menu=file_menu)
+        menubar.add_cascade(label="옵션", menu=option_menu)
         menubar.add_cascade(label="정보", menu=info_menu)
         
         # 메뉴바 설정
@@ -190,6 +217,21 @@ class MainWindow:
         self._loading_active = False
         self.analyze_btn.pack(side="left", padx=(0, 4))
         
+        self.cancel_btn = ctk.CTkButton(
+            button_group,
+            text="취소",
+            command=self.cancel_job,
+            font=self.default_font,
+            height=28,
+            width=60,
+            corner_radius=6,
+            state="disabled",
+            fg_color=("#e5e7eb", "#e5e7eb"),
+            hover_color=("#d1d5db", "#d1d5db"),
+            text_color=("#374151", "#374151")
+        )
+        self.cancel_btn.pack(side="left", padx=(0, 4))
+        
         self.export_btn = ctk.CTkButton(
             button_group,
             text="저장",
@@ -278,12 +320,14 @@ class MainWindow:
         source_text = self.source_panel.get_text_content().strip()
         reference_text = self.reference_panel.get_text_content().strip()
         
-        # Reference 데이터가 변경되면 캐시 무효화
+        # Reference 데이터가 변경되면 현재 인덱스만 무효화
+        # (파싱 결과/인덱스는 분석 시 reference_set이 변경된 줄만 반영)
         if reference_text != getattr(self, '_last_reference_text', ''):
-            self.reference_cache = None
+            self.reference_index = None
             self._last_reference_text = reference_text
         
-        if source_text and reference_text:
+        # 작업 실행 중에는 분석 버튼을 다시 켜지 않음
+        if source_text and reference_text and self._job is None:
             self.analyze_btn.configure(state="normal")
         else:
             self.analyze_btn.configure(state="disabled")
@@ -301,98 +345,85 @@ class MainWindow:
             self.loading_label.configure(text_color=(new_color, new_color))
             self.root.after(500, self._animate_loading)
     
-    def perform_analysis(self):
-        """실제 분석 수행 (완전히 별도 스레드에서 실행, UI와 완전 분리)"""
-        try:
-            # Source 파싱 진행률 콜백 (스레드 안전)
-            def source_progress(current, total):
-                percent = (current * 100) // total if total > 0 else 0
-                # after를 사용하여 메인 스레드에서만 UI 업데이트 (최적화: 10% 단위로만 업데이트)
-                if current % max(1, total // 10) == 0 or current == total:
-                    self.root.after(0, lambda: self.progress_label.configure(
-                        text=f"Source 파싱 중... {current}/{total} ({percent}%)",
-                        text_color=("#6b7280", "#6b7280")
-                    ))
-            
-            # Source 데이터 파싱 (배치 처리)
-            source_text = self.source_panel.get_text_content()
-            self.source_data = IPParser.parse_text_input(source_text, source_progress)
-            
-            # Reference 파싱 진행률 콜백 (스레드 안전)
-            def ref_progress(current, total):
-                percent = (current * 100) // total if total > 0 else 0
-                # after를 사용하여 메인 스레드에서만 UI 업데이트 (최적화: 10% 단위로만 업데이트)
-                if current % max(1, total // 10) == 0 or current == total:
-                    self.root.after(0, lambda: self.progress_label.configure(
-                        text=f"Reference 파싱 중... {current}/{total} ({percent}%)",
-                        text_color=("#6b7280", "#6b7280")
-                    ))
-            
-            # Reference 데이터 파싱 (캐시 사용, 배치 처리)
-            reference_text = self.reference_panel.get_text_content()
-            
-            if self.reference_cache is None:
-                # 캐시가 없으면 파싱 (배치 처리)
-                parsed_refs = IPParser.parse_text_input(reference_text, ref_progress)
-                self.reference_data = []
-                # Reference 변환 (빠르게 일괄 처리)
-                for ref in parsed_refs:
-                    self.reference_data.append({
-                        'original': ref['original'],
-                        'parsed': ref['parsed'],
-                        'type': ref['type']
-                    })
-                # 캐시 저장
-                self.reference_cache = self.reference_data.copy()
-            else:
-                # 캐시 사용
-                self.reference_data = self.reference_cache
-            
-            # 진행 상황 업데이트
-            self.root.after(0, lambda: self.progress_label.configure(
-                text=f"매칭 중... (Source: {len(self.source_data)}, Reference: {len(self.reference_data)})",
-                text_color=("#6b7280", "#6b7280")
-            ))
-            
-            # 진행률 콜백 함수 정의 (스레드 안전, 최적화)
-            _last_update = [0]  # 클로저를 위한 리스트
-            def progress_callback(current, total):
-                """매칭 진행률 업데이트 (메인 스레드에서만 실행, 최적화)"""
-                # 10% 단위로만 업데이트하여 성능 향상
-                percent = (current * 100) // total if total > 0 else 0
-                if current % max(1, total // 10) == 0 or current == total or current - _last_update[0] >= max(1, total // 20):
-                    _last_update[0] = current
-                    self.root.after(0, lambda: self.progress_label.configure(
-                        text=f"매칭 중... {current}/{total} ({percent}%)",
-                        text_color=("#6b7280", "#6b7280")
-                    ))
-            
-            # 매칭 수행 (초고성능 최적화 버전)
-            results = Matcher.match(self.source_data, self.reference_data, progress_callback)
-            
-            # UI 업데이트 (메인 스레드에서 실행)
-            self.root.after(0, self.update_results, results)
-            
-        except Exception as e:
-            error_msg = f"분석 오류: {str(e)}"
-            print(error_msg)
-            self.root.after(0, self.show_error, error_msg)
+    def perform_analysis(self, source_text: str, reference_text: str, progress: ProgressState):
+        """
+        실제 분석 수행 (별도 스레드에서 실행, UI와 완전 분리)
+        
+        진행 상황은 progress에만 기록하고 (UI는 타이머로 읽음), 취소되면 진행률 콜백에서
+        AnalysisCancelled가 발생하여 중단된다.
+        
+        Returns:
+            매칭 결과 리스트
+        """
+        # Source 데이터 파싱 (컬럼형, 큰 입력은 구분자 경계에서 나눠 여러 코어에서 파싱)
+        self.source_data = IPParser.parse_text_compact(source_text, progress.callback("Source 파싱"),
+                                                       workers=os.cpu_count() or 1)
+        
+        # 최장 prefix 모드는 트라이 사용
+        engine = 'trie' if self._longest_prefix_only else Matcher.DEFAULT_ENGINE
+        
+        # 이 Reference 텍스트로 만든 인덱스(불러온 컴파일 인덱스 포함)가 있고 Source가 모두 Single IP면
+        # Reference 파싱 생략
+        index = self._cached_reference_index(reference_text, engine)
+        needs_reference_list = index is None or not self.source_data.all_single()
+        
+        if not needs_reference_list:
+            self.reference_data = []
+        else:
+            # 이전 텍스트와 줄 단위로 비교하여 바뀐 줄만 파싱 (처음이거나 변경이 크면 전체 파싱)
+            self.reference_data = self.reference_set.update(reference_text, progress.callback("Reference 파싱"))
+        
+        # Reference 인덱스 (bisect는 추가/삭제분만 반영한 증분 인덱스, 변경이 쌓이면 재구성)
+        if self.reference_data and index is None:
+            progress.set_stage("인덱스 생성")
+            index = self.reference_set.get_index(engine)
+            self._store_reference_index(index, engine, reference_text)
+        
+        # 대용량 Source는 여러 코어로 분할 매칭 (인덱스는 한 번만 생성하여 공유)
+        workers = 1
+        if len(self.source_data) >= PARALLEL_MIN_SOURCES and not self._longest_prefix_only:
+            workers = os.cpu_count() or 1
+        
+        # 매칭 수행 (인덱스 기반, 같은 Source는 메모로 한 번만 조회)
+        self._match_memo = MatchMemo()
+        return Matcher.match(self.source_data, self.reference_data, progress.callback("매칭"),
+                             engine=engine, index=index,
+                             longest_prefix_only=self._longest_prefix_only,
+                             workers=workers, memo=self._match_memo)
+    
+    def _cached_reference_index(self, reference_text: str, engine: str):
+        """
+        reference_text로 만든 engine 인덱스 캐시 (없거나 다른 텍스트/엔진으로 만들었으면 None)
+        
+        작업 중에 Reference가 바뀌어도 캐시를 만든 텍스트와 비교하므로 이전 인덱스를 재사용하지 않는다.
+        """
+        if (self.reference_index is not None and self.reference_index_engine == engine
+                and self.reference_index_key == reference_text.strip()):
+            return self.reference_index
+        return None
+    
+    def _store_reference_index(self, index, engine: str, reference_text: str):
+        """작업 스레드에서 만든 인덱스를 캐시 (작업 중 Reference가 바뀌어 무효화되었으면 저장하지 않음)"""
+        key = reference_text.strip()
+        if key != self._last_reference_text:
+            return
+        self.reference_index_key = key
+        self.reference_index_engine = engine
+        self.reference_index = index
     
     def update_results(self, results):
         """결과 업데이트"""
-        # 로딩 인디케이터 숨김
-        self._loading_active = False
-        self.loading_label.pack_forget()
-        
         self.result_grid.display_results(results)
-        matched_count = sum(1 for r in results if r.get('matched_ips', '').strip())
+        matched_count = self.result_grid.matched_count
         total_count = len(results)
+        summary = f"완료: {matched_count}/{total_count}"
+        memo = getattr(self, '_match_memo', None)
+        if memo is not None and memo.hits:
+            summary += f" · {memo.summary()}"
         self.progress_label.configure(
-            text=f"완료: {matched_count}/{total_count}",
+            text=summary,
             text_color=("#059669", "#059669")
         )
-        self.analyze_btn.configure(state="normal", text="분석")
-        self.export_btn.configure(state="normal")
     
     def show_error(self, error_msg):
         """오류 메시지 표시"""
@@ -407,93 +438,132 @@ class MainWindow:
         self.analyze_btn.configure(state="normal", text="분석")
     
     def export_to_excel(self):
-        """엑셀로 내보내기 (깔끔한 서식)"""
+        """엑셀(또는 CSV/TSV)로 내보내기 - 별도 스레드에서 스트리밍 기록"""
         
         results = self.result_grid.get_results_data()
-        if not results:
+        if not results or self._job is not None:
             return
         
         file_path = filedialog.asksaveasfilename(
             title="엑셀 파일로 저장",
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("TSV files", "*.tsv"),
+                       ("All files", "*.*")]
         )
         
         if file_path:
+            progress = ProgressState("저장")
+            self._start_job(
+                progress,
+                lambda: export_results(results, file_path, progress.callback("저장")),
+                lambda _: self.finish_export(file_path),
+                "저장 오류",
+                on_cancel=lambda: self._remove_partial_file(file_path)
+            )
+    
+    def finish_export(self, file_path: str):
+        """결과 파일 저장 완료 표시"""
+        file_name = os.path.basename(file_path)
+        self.progress_label.configure(
+            text=f"저장됨: {file_name}",
+            text_color=("#059669", "#059669")
+        )
+    
+    def _remove_partial_file(self, file_path: str):
+        """취소된 저장/파일 매칭의 불완전한 결과 파일 삭제"""
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+    
+    def _start_job(self, progress: ProgressState, work, on_done, error_prefix: str, on_cancel=None, describe=None):
+        """
+        작업 스레드 실행 + 진행 상태 폴링
+        
+        작업 스레드는 progress에만 기록하고 UI를 건드리지 않는다. 메인 스레드가 PROGRESS_POLL_MS마다
+        상태를 읽어 상태 바에 표시하고, 작업이 끝나면 결과에 따라 on_done/on_cancel/오류 표시를 호출한다.
+        
+        Args:
+            progress: 작업 진행 상태 (취소 버튼이 cancel() 호출)
+            work: 작업 스레드에서 실행할 함수 (반환값이 on_done 인자)
+            on_done: 완료 시 메인 스레드에서 호출 (결과)
+            error_prefix: 오류 메시지 앞에 붙일 문구
+            on_cancel: 취소 시 메인 스레드에서 호출 (정리 작업)
+            describe: 진행 상태 문자열 함수 (없으면 progress.describe)
+        """
+        job = {'progress': progress, 'outcome': None}
+        
+        def run():
             try:
-                from openpyxl import Workbook
-                from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-                
-                # 워크북 생성
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "매칭 결과"
-                
-                # 헤더 설정
-                headers = ['대상 IP', '매칭된 IP']
-                ws.append(headers)
-                
-                # 헤더 스타일 설정
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF", size=11)
-                header_alignment = Alignment(horizontal="center", vertical="center")
-                border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for col_num, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_num)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = header_alignment
-                    cell.border = border
-                
-                # 데이터 입력
-                for result in results:
-                    source = result.get('source', '')
-                    matched_ips = result.get('matched_ips', '')
-                    ws.append([source, matched_ips])
-                
-                # 데이터 셀 스타일 설정
-                data_font = Font(size=10)
-                data_alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-                
-                for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=2):
-                    for cell in row:
-                        cell.font = data_font
-                        cell.alignment = data_alignment
-                        cell.border = border
-                
-                # 컬럼 너비 자동 조정
-                ws.column_dimensions['A'].width = 25
-                ws.column_dimensions['B'].width = 50
-                
-                # 행 높이 설정
-                ws.row_dimensions[1].height = 25  # 헤더 높이
-                for row_num in range(2, ws.max_row + 1):
-                    ws.row_dimensions[row_num].height = 20
-                
-                # 저장
-                wb.save(file_path)
-                
-                file_name = file_path.split('/')[-1]
-                self.progress_label.configure(
-                    text=f"저장됨: {file_name}",
-                    text_color=("#059669", "#059669")
-                )
+                job['outcome'] = ('done', work())
+            except AnalysisCancelled:
+                job['outcome'] = ('cancelled', None)
             except Exception as e:
-                error_msg = f"저장 오류: {str(e)}"
-                print(error_msg)
-                self.progress_label.configure(
-                    text=f"오류: {error_msg[:50]}",
-                    text_color=("#dc2626", "#dc2626")
-                )
+                job['outcome'] = ('error', e)
+        
+        self._job = job
+        self.analyze_btn.configure(state="disabled")
+        self.export_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.progress_label.configure(text=progress.describe(), text_color=("#6b7280", "#6b7280"))
+        
+        # 로딩 인디케이터 표시
+        self._loading_active = True
+        self.loading_label.pack(side="left", padx=(0, 6))
+        self._animate_loading()
+        
+        # 별도 스레드에서 실행 (UI 멈춤 방지)
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        self.root.after(self.PROGRESS_POLL_MS, self._poll_job, job, on_done, error_prefix, on_cancel,
+                        describe or progress.describe)
+    
+    def _poll_job(self, job, on_done, error_prefix: str, on_cancel, describe):
+        """작업 진행 상태 표시 (메인 스레드 타이머) 및 완료 처리"""
+        outcome = job['outcome']
+        if outcome is None:
+            if not job['progress'].cancelled:
+                self.progress_label.configure(text=describe(), text_color=("#6b7280", "#6b7280"))
+            self.root.after(self.PROGRESS_POLL_MS, self._poll_job, job, on_done, error_prefix, on_cancel, describe)
+            return
+        
+        self._job = None
+        status, value = outcome
+        if status == 'done' and job['progress'].cancelled:
+            # 마지막 진행률 기록 뒤에 취소됨 - 결과를 버림
+            status = 'cancelled'
+        if status == 'done':
+            on_done(value)
+        elif status == 'cancelled':
+            if on_cancel:
+                on_cancel()
+            self.progress_label.configure(text="취소됨", text_color=("#6b7280", "#6b7280"))
+        else:
+            error_msg = f"{error_prefix}: {str(value)}"
+            print(error_msg)
+            self.show_error(error_msg)
+        
+        # 로딩 인디케이터 숨김 및 버튼 복원
+        self._loading_active = False
+        self.loading_label.pack_forget()
+        self.cancel_btn.configure(state="disabled")
+        self.analyze_btn.configure(text="분석")
+        self.on_data_change()
+        self.export_btn.configure(state="normal" if self.result_grid.get_results_data() else "disabled")
+    
+    def cancel_job(self):
+        """실행 중인 작업 취소 (다음 진행률 기록 시점에 중단)"""
+        if self._job is None:
+            return
+        self._job['progress'].cancel()
+        self.cancel_btn.configure(state="disabled")
+        self.progress_label.configure(text="취소 중...", text_color=("#6b7280", "#6b7280"))
     
     def reset_all(self):
         """전체 초기화"""
+        # 실행 중인 작업은 취소 (결과가 초기화된 화면에 표시되지 않도록)
+        self.cancel_job()
         
         self.source_panel.clear_data()
         self.reference_panel.clear_data()
@@ -502,23 +572,100 @@ class MainWindow:
         self.export_btn.configure(state="disabled")
         self.source_data = []
         self.reference_data = []
-        self.reference_cache = None
+        self.reference_set = ReferenceSet()
+        self.reference_index = None
+        self.reference_index_key = None
         self._last_reference_text = ''
     
     def start_analysis(self):
         """분석 시작"""
-        self.analyze_btn.configure(state="disabled", text="분석 중...")
-        self.progress_label.configure(text="분석 중...", text_color=("#6b7280", "#6b7280"))
+        if self._job is not None:
+            return
         
-        # 로딩 인디케이터 표시
-        self._loading_active = True
-        self.loading_label.pack(side="left", padx=(0, 6))
-        self._animate_loading()
+        # 옵션과 입력은 메인 스레드에서 읽어 둠 (Tk 위젯/변수는 작업 스레드에서 접근하지 않음)
+        self._longest_prefix_only = self.longest_prefix_var.get()
+        source_text = self.source_panel.get_text_content()
+        reference_text = self.reference_panel.get_text_content()
+        
+        progress = ProgressState("분석")
+        self.analyze_btn.configure(text="분석 중...")
+        self._start_job(
+            progress,
+            lambda: self.perform_analysis(source_text, reference_text, progress),
+            self.update_results,
+            "분석 오류"
+        )
+    
+    def start_stream_match(self):
+        """대용량 Source 파일을 입력창에 올리지 않고 스트리밍으로 매칭하여 결과 파일로 저장"""
+        if self._job is not None:
+            return
         
-        # 별도 스레드에서 실행 (UI 멈춤 방지)
-        thread = threading.Thread(target=self.perform_analysis)
-        thread.daemon = True
-        thread.start()
+        reference_text = self.reference_panel.get_text_content()
+        if not reference_text.strip() and self.reference_index is None:
+            messagebox.showwarning("경고", "Reference 데이터가 없습니다.")
+            return
+        
+        source_path = filedialog.askopenfilename(
+            title="Source 파일 선택",
+            filetypes=[("Text files", "*.txt *.log *.csv"), ("All files", "*.*")]
+        )
+        if not source_path:
+            return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="결과 파일로 저장",
+            defaultextension=".tsv",
+            filetypes=[("TSV files", "*.tsv"), ("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        delimiter = ',' if output_path.lower().endswith('.csv') else '\t'
+        
+        progress = ProgressState("파일 매칭")
+        counter = ThroughputCounter()
+        
+        def describe():
+            _, current, total = progress.snapshot()
+            percent = (current * 100) // total if total > 0 else 0
+            return f"파일 매칭 중... {percent}% ({counter.items_per_second:,.0f}개/초)"
+        
+        self.analyze_btn.configure(text="분석 중...")
+        self._start_job(
+            progress,
+            lambda: self.perform_stream_match(source_path, output_path, delimiter, reference_text,
+                                              progress, counter),
+            lambda _: self.finish_stream_match(output_path, counter),
+            "파일 매칭 오류",
+            on_cancel=lambda: self._remove_partial_file(output_path),
+            describe=describe
+        )
+    
+    def perform_stream_match(self, source_path: str, output_path: str, delimiter: str, reference_text: str,
+                             progress: ProgressState, counter: ThroughputCounter):
+        """스트리밍 파일 매칭 수행 (별도 스레드, 진행 상황은 progress/counter에만 기록)"""
+        # Reference 파싱 및 인덱스 생성 (캐시 사용)
+        engine = Matcher.DEFAULT_ENGINE
+        index = self._cached_reference_index(reference_text, engine)
+        if index is None:
+            self.reference_set.update(reference_text, progress.callback("Reference 파싱"))
+            progress.set_stage("인덱스 생성")
+            index = self.reference_set.get_index(engine)
+            self._store_reference_index(index, engine, reference_text)
+        self.reference_data = self.reference_set.reference_list
+        
+        stream_match(source_path, output_path, self.reference_data, index=index,
+                     engine=engine, delimiter=delimiter,
+                     progress_callback=progress.callback("파일 매칭"), counter=counter)
+    
+    def finish_stream_match(self, output_path: str, counter: ThroughputCounter):
+        """스트리밍 파일 매칭 완료 표시"""
+        file_name = os.path.basename(output_path)
+        self.progress_label.configure(
+            text=f"저장됨: {file_name} - {counter}",
+            text_color=("#059669", "#059669")
+        )
     
     def on_close(self):
         """윈도우 닫기"""
@@ -544,7 +691,16 @@ class MainWindow:
             with open(self.reference_json_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             
-            messagebox.showinfo("저장 완료", f"Reference 데이터가 저장되었습니다.\n경로: {self.reference_json_path}")
+            # 컴파일된 인덱스 저장 (실패해도 JSON 저장은 유지)
+            index_error = self._save_reference_index(reference_text)
+            
+            if index_error:
+                messagebox.showwarning(
+                    "인덱스 저장 실패",
+                    f"Reference 데이터는 저장되었지만 인덱스 파일을 저장하지 못했습니다.\n"
+                    f"다음 불러오기 때 Reference를 다시 파싱합니다.\n\n{index_error}")
+            else:
+                messagebox.showinfo("저장 완료", f"Reference 데이터가 저장되었습니다.\n경로: {self.reference_json_path}")
             self.progress_label.configure(
                 text=f"Reference 저장됨",
                 text_color=("#059669", "#059669")
@@ -577,13 +733,18 @@ class MainWindow:
             self.reference_panel.textbox.insert("1.0", reference_text)
             self.reference_panel.update_count()
             
-            # 캐시 무효화
-            self.reference_cache = None
+            # 캐시 무효화 (텍스트 전체가 바뀌므로 증분 상태도 새로 시작)
+            self.reference_set = ReferenceSet()
+            self.reference_index = None
+            self.reference_index_key = None
             self._last_reference_text = ''
             
             # 데이터 변경 이벤트 호출
             self.on_data_change()
             
+            # 내용이 같은 컴파일된 인덱스가 있으면 파싱/인덱스 생성 없이 사용
+            self._load_reference_index(reference_text)
+            
             messagebox.showinfo("불러오기 완료", "Reference 데이터를 불러왔습니다.")
             self.progress_label.configure(
                 text=f"Reference 불러옴",
@@ -599,6 +760,48 @@ class MainWindow:
             messagebox.showerror("오류", error_msg)
             print(error_msg)
     
+    def _save_reference_index(self, reference_text: str) -> Optional[str]:
+        """
+        Reference 인덱스를 바이너리 파일로 저장
+        
+        Returns:
+            실패 시 오류 메시지 (성공하면 None)
+        """
+        try:
+            # 같은 파일을 mmap으로 불러온 인덱스가 있으면 메모리로 옮기고 해제 (Windows는 매핑된 파일을 교체할 수 없음)
+            self._release_reference_compiled()
+            index = self._cached_reference_index(reference_text, 'bisect')
+            # 증분 인덱스는 변경분이 합쳐진 새 인덱스로 저장
+            if index is None or isinstance(index, IncrementalIndex):
+                index = Matcher.build_index(IPParser.parse_text_compact(reference_text), 'bisect')
+            save_index(self.reference_index_path, index, reference_text)
+        except Exception as e:
+            print(f"인덱스 저장 실패: {e}")
+            return str(e)
+        return None
+    
+    def _release_reference_compiled(self):
+        """불러온 컴파일된 인덱스의 mmap 해제 (인덱스는 메모리 복사본으로 계속 사용)"""
+        if self.reference_compiled is not None:
+            compiled, self.reference_compiled = self.reference_compiled, None
+            compiled.close()
+    
+    def _load_reference_index(self, reference_text: str):
+        """Reference 텍스트와 내용 해시가 같은 컴파일된 인덱스 불러오기 (mmap)"""
+        if not os.path.exists(self.reference_index_path):
+            return
+        try:
+            self._release_reference_compiled()
+            compiled = load_index(self.reference_index_path)
+        except (OSError, ValueError, BufferError) as e:
+            print(f"인덱스 불러오기 실패: {e}")
+            return
+        if compiled.content_hash == content_hash(reference_text):
+            self.reference_index_key = reference_text.strip()
+            self.reference_index_engine = 'bisect'
+            self.reference_index = compiled.index
+            self.reference_compiled = compiled
+    
     def show_info(self):
         """정보 다이얼로그 표시"""
         info_text = """IP Network Matcher
@@ -1,16 +1,34 @@
-"""결과 그리드 모듈 - 텍스트 출력 방식"""
+"""결과 그리드 모듈 - 보이는 행만 그리는 가상 스크롤 방식"""
 import customtkinter as ctk
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from core.match_result import iter_rows, count_matched
+
+
+def format_row(row: Tuple[str, str]) -> str:
+    """결과 한 행 (source, matched_ips)을 표시 문자열로 변환"""
+    source, matched_ips = row
+    return f"{source}\t→\t{matched_ips or '(매칭 없음)'}"
 
 
 class ResultGrid(ctk.CTkFrame):
-    """결과 표시 - 텍스트 출력 방식"""
+    """
+    결과 표시 - 가상 스크롤 방식
+    
+    결과 전체를 하나의 문자열로 만들지 않고, 현재 위치(top_row)부터 화면에 보이는 행 수만큼만
+    포맷하여 텍스트 박스에 그린다. 결과가 수십만 행이어도 스크롤/행 이동 비용은 화면 크기에만 비례한다.
+    """
+    
+    # 화면 높이를 알기 전 기본 표시 행 수
+    DEFAULT_VISIBLE_ROWS = 40
+    
+    # 마우스 휠 한 칸당 이동 행 수
+    WHEEL_ROWS = 3
     
     def __init__(self, parent):
         super().__init__(
-            parent, 
-            corner_radius=8, 
-            border_width=1, 
+            parent,
+            corner_radius=8,
+            border_width=1,
             border_color=("#e5e7eb", "#e5e7eb"),
             fg_color=("#ffffff", "#ffffff")
         )
@@ -49,80 +67,178 @@ class ResultGrid(ctk.CTkFrame):
         )
         self.stats_label.pack(side="right")
         
+        # 행 이동 (행 번호 입력 후 Enter 또는 이동 버튼)
+        self.jump_btn = ctk.CTkButton(
+            header_frame,
+            text="이동",
+            width=44,
+            height=24,
+            font=default_font,
+            command=self._on_jump
+        )
+        self.jump_btn.pack(side="right", padx=(4, 8))
+        
+        self.jump_entry = ctk.CTkEntry(
+            header_frame,
+            placeholder_text="행 번호",
+            width=80,
+            height=24,
+            font=default_font
+        )
+        self.jump_entry.pack(side="right")
+        self.jump_entry.bind("<Return>", lambda event: self._on_jump())
+        
         # 텍스트 출력 영역 (모던 다크)
         try:
             # 코드 폰트는 Consolas 유지하되 Pretendard와 함께 사용
             code_font = ctk.CTkFont(family="Consolas", size=12)
         except:
             code_font = text_font
+        self._line_height = max(1, code_font.metrics("linespace"))
         
-        try:
-            self.textbox = ctk.CTkTextbox(
-                self,
-                font=code_font,
-                fg_color=("#ffffff", "#ffffff"),
-                text_color=("#111827", "#111827"),
-                border_color=("#e5e7eb", "#e5e7eb"),
-                border_width=1,
-                corner_radius=6,
-                wrap="none"
-            )
-        except:
-            self.textbox = ctk.CTkTextbox(
-                self,
-                font=text_font,
-                fg_color=("#ffffff", "#ffffff"),
-                text_color=("#111827", "#111827"),
-                border_color=("#e5e7eb", "#e5e7eb"),
-                border_width=1,
-                corner_radius=6,
-                wrap="none"
-            )
-        self.textbox.pack(fill="both", expand=True, padx=6, pady=(0, 6))
+        body_frame = ctk.CTkFrame(self, fg_color="transparent")
+        body_frame.pack(fill="both", expand=True, padx=6, pady=(0, 6))
+        body_frame.grid_rowconfigure(0, weight=1)
+        body_frame.grid_columnconfigure(0, weight=1)
+        
+        # 텍스트 박스 자체 스크롤은 끄고, 세로 스크롤바는 전체 결과 기준 위치를 표시
+        self.textbox = ctk.CTkTextbox(
+            body_frame,
+            font=code_font,
+            fg_color=("#ffffff", "#ffffff"),
+            text_color=("#111827", "#111827"),
+            border_color=("#e5e7eb", "#e5e7eb"),
+            border_width=1,
+            corner_radius=6,
+            wrap="none",
+            activate_scrollbars=False
+        )
+        self.textbox.grid(row=0, column=0, sticky="nsew")
+        self.textbox.tag_config("jump", background="#dbeafe")
+        
+        self.v_scrollbar = ctk.CTkScrollbar(body_frame, orientation="vertical", command=self._on_scrollbar)
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.h_scrollbar = ctk.CTkScrollbar(body_frame, orientation="horizontal", command=self.textbox.xview)
+        self.h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.textbox.configure(xscrollcommand=self.h_scrollbar.set)
+        
+        # 마우스 휠/키 스크롤은 가상 위치를 움직임 (텍스트 박스 기본 스크롤 대신)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.textbox.bind(sequence, self._on_mouse_wheel)
+        self.textbox.bind("<Prior>", lambda event: self._scroll_pages(-1))
+        self.textbox.bind("<Next>", lambda event: self._scroll_pages(1))
+        self.textbox.bind("<Configure>", self._on_resize)
         
         # 데이터 저장용
         self.results_data = []
+        self.matched_count = 0
+        self.top_row = 0
+        self.visible_rows = self.DEFAULT_VISIBLE_ROWS
     
     def display_results(self, results: List[Dict]):
         """
-        결과를 텍스트로 표시 (애니메이션 효과)
+        결과 표시 (보이는 행만 포맷)
         
         Args:
-            results: 매칭 결과 리스트 [{'source': str, 'matched_ips': str}, ...]
+            results: 매칭 결과 (MatchResult 또는 [{'source': str, 'matched_ips': str}, ...])
         """
         self.results_data = results
+        self.top_row = 0
         
-        # 통계 계산
+        # 통계 계산 (행 포맷 없이 매칭 여부만 확인, MatchResult는 결과 번호로 계산)
         total = len(results)
-        matched = sum(1 for r in results if r.get('matched_ips', '').strip())
+        self.matched_count = count_matched(results)
         
         # 통계 업데이트 (미니멀) - 파란색 포인트
         if total > 0:
-            new_text = f"{matched}/{total}"
+            new_text = f"{self.matched_count}/{total}"
             self.stats_label.configure(text=new_text, text_color=("#3b82f6", "#3b82f6"))
             self.after(200, lambda: self.stats_label.configure(text_color=("#6b7280", "#6b7280")))
         else:
             self.stats_label.configure(text="0개")
         
-        # 텍스트 출력 (최적화: 한 번에 삽입)
+        self._render()
+    
+    def scroll_to(self, row: int):
+        """
+        row번째 결과(0부터)가 맨 위에 오도록 이동
+        
+        Args:
+            row: 맨 위에 표시할 결과 위치 (범위를 벗어나면 맞춤)
+        """
+        max_top = max(0, len(self.results_data) - self.visible_rows)
+        row = min(max(0, row), max_top)
+        if row != self.top_row:
+            self.top_row = row
+            self._render()
+    
+    def jump_to_row(self, row_number: int):
+        """
+        행 번호(1부터)로 이동하여 해당 행을 강조 표시
+        
+        Args:
+            row_number: 이동할 행 번호
+        """
+        total = len(self.results_data)
+        if not total:
+            return
+        row = min(max(1, row_number), total) - 1
+        self.scroll_to(row)
+        line = row - self.top_row + 1
+        self.textbox.tag_add("jump", f"{line}.0", f"{line}.end")
+    
+    def _render(self):
+        """현재 위치부터 보이는 행만 텍스트 박스에 그림"""
         self.textbox.delete("1.0", "end")
         
-        if not results:
+        total = len(self.results_data)
+        if not total:
             self.textbox.insert("1.0", "결과가 없습니다.")
+            self.v_scrollbar.set(0.0, 1.0)
             return
         
-        # 결과를 텍스트로 포맷팅 (최적화: 리스트 컴프리헨션 사용)
-        lines = [
-            f"{result.get('source', '')}\t→\t{result.get('matched_ips', '') or '(매칭 없음)'}"
-            for result in results
-        ]
-        
-        # 텍스트 삽입 (최적화: 한 번에 삽입)
-        text_content = '\n'.join(lines)
-        self.textbox.insert("1.0", text_content)
-        
-        # 스크롤을 맨 위로
-        self.textbox.see("1.0")
+        rows = list(iter_rows(self.results_data, self.top_row, self.top_row + self.visible_rows))
+        self.textbox.insert("1.0", '\n'.join(map(format_row, rows)))
+        self.v_scrollbar.set(self.top_row / total, min(1.0, (self.top_row + len(rows)) / total))
+    
+    def _on_scrollbar(self, action, value, unit=None):
+        """세로 스크롤바 이동 ('moveto' 비율 또는 'scroll' 단위/페이지)"""
+        if action == "moveto":
+            self.scroll_to(int(float(value) * len(self.results_data)))
+        elif action == "scroll":
+            step = int(value) * (self.visible_rows if unit == "pages" else 1)
+            self.scroll_to(self.top_row + step)
+    
+    def _on_mouse_wheel(self, event):
+        """마우스 휠 (Windows/macOS: delta, Linux: Button-4/5)"""
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.top_row + direction * self.WHEEL_ROWS)
+        return "break"
+    
+    def _scroll_pages(self, pages: int):
+        """Page Up/Down"""
+        self.scroll_to(self.top_row + pages * self.visible_rows)
+        return "break"
+    
+    def _on_resize(self, event):
+        """텍스트 박스 높이에 맞춰 표시 행 수 갱신"""
+        rows = max(1, event.height // self._line_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            # 끝부분에서 창이 커지면 빈 줄 대신 앞 행을 더 보여줌
+            self.top_row = min(self.top_row, max(0, len(self.results_data) - rows))
+            self._render()
+    
+    def _on_jump(self):
+        """행 번호 입력값으로 이동"""
+        text = self.jump_entry.get().strip().replace(',', '')
+        if text.isdigit():
+            self.jump_to_row(int(text))
     
     def get_results_data(self) -> List[Dict]:
         """결과 데이터 반환"""
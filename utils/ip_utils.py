@@ -1,6 +1,24 @@
 """IP 관련 유틸리티 함수 - 최적화 버전"""
 import ipaddress
-from typing import Union, Set, Optional, Tuple
+from typing import Union, Set, Optional, Tuple, List
+
+
+# 정수 파싱 결과 종류 (parse_ip_int)
+KIND_SINGLE = 0
+KIND_CIDR = 1
+KIND_RANGE = 2
+KIND_NAMES = ('Single', 'CIDR', 'Range')
+
+# IPv6 플래그 (KIND_SINGLE/KIND_CIDR/KIND_RANGE와 OR, 정수는 128비트)
+KIND_V6 = 4
+KIND_MASK = 3
+
+# 주소 체계별 비트 수
+IPV4_BITS = 32
+IPV6_BITS = 128
+
+# 유효한 옥텟 문자열 → 값 (앞자리 0, 범위 초과, 비 ASCII 숫자는 ipaddress와 동일하게 거부)
+_OCTETS = {str(value): value for value in range(256)}
 
 
 def parse_ip_range(ip_range: str) -> Optional[Tuple[int, int]]:
@@ -37,31 +55,52 @@ def parse_ip_input(ip_str: str) -> Optional[Union[ipaddress.IPv4Address, ipaddre
     Single IP, CIDR, Range를 자동 감지
     
     Args:
-        ip_str: IP 문자열 (Single/CIDR/Range)
+        ip_str: IP 문자열 (Single/CIDR/Range, IPv4/IPv6)
         
     Returns:
         IPv4Address, IPv4Network, 또는 (start_int, end_int) 튜플
+        IPv6는 IPv6Address, IPv6Network, 또는 (IPv6Address, IPv6Address) 튜플
     """
-    ip_str = ip_str.strip()
-    if not ip_str:
+    # 문자열 검증은 정수 파서로 하고 객체는 정수에서 생성 (문자열 재파싱 없음)
+    interval = parse_ip_int(ip_str)
+    if interval is None:
         return None
+    return interval_to_parsed(*interval)
+
+
+def interval_to_parsed(start_int: int, end_int: int, kind: int) -> Union[ipaddress.IPv4Address, ipaddress.IPv4Network, Tuple[int, int]]:
+    """
+    parse_ip_int 결과를 기존 파싱 타입으로 변환
     
-    # CIDR 포맷 확인
-    if '/' in ip_str:
-        try:
-            return ipaddress.IPv4Network(ip_str, strict=False)
-        except ValueError:
-            return None
-    
-    # Range 포맷 확인
-    if '-' in ip_str and ip_str.count('-') == 1:
-        return parse_ip_range(ip_str)
-    
-    # Single IP
-    try:
-        return ipaddress.IPv4Address(ip_str)
-    except ValueError:
-        return None
+    Args:
+        start_int: 시작 IP (정수)
+        end_int: 끝 IP (정수)
+        kind: KIND_SINGLE/KIND_CIDR/KIND_RANGE
+        
+    Returns:
+        IPv4Address, IPv4Network, 또는 (start_int, end_int) 튜플
+        IPv6는 IPv6Address, IPv6Network, 또는 (IPv6Address, IPv6Address) 튜플
+    """
+    if kind & KIND_V6:
+        kind &= KIND_MASK
+        if kind == KIND_SINGLE:
+            return ipaddress.IPv6Address(start_int)
+        if kind == KIND_CIDR:
+            return ipaddress.IPv6Network((start_int, IPV6_BITS - (end_int - start_int).bit_length()))
+        # IPv4 Range(정수 튜플)와 구분되도록 주소 객체 튜플로 표현
+        return (ipaddress.IPv6Address(start_int), ipaddress.IPv6Address(end_int))
+    if kind == KIND_SINGLE:
+        return ipaddress.IPv4Address(start_int)
+    if kind == KIND_CIDR:
+        return ipaddress.IPv4Network((start_int, 32 - (end_int - start_int).bit_length()))
+    return (start_int, end_int)
+
+
+def is_ipv6_parsed(parsed) -> bool:
+    """파싱된 값이 IPv6인지 여부 (IPv6Address, IPv6Network, IPv6 Range 튜플)"""
+    if isinstance(parsed, tuple):
+        return isinstance(parsed[0], ipaddress.IPv6Address)
+    return isinstance(parsed, (ipaddress.IPv6Address, ipaddress.IPv6Network))
 
 
 def ip_in_network(ip: Union[ipaddress.IPv4Address, ipaddress.IPv4Network, Tuple[int, int], Set], 
@@ -124,3 +163,142 @@ def ip_in_network(ip: Union[ipaddress.IPv4Address, ipaddress.IPv4Network, Tuple[
         return any(addr in ip for addr in network)
     
     return False
+
+
+def range_to_cidrs(start_int: int, end_int: int, max_bits: int = 32) -> List[Tuple[int, int]]:
+    """
+    정수 IP 범위를 최소 개수의 CIDR 블록으로 분해
+    예: (10.0.0.1, 10.0.0.6) -> [10.0.0.1/32, 10.0.0.2/31, 10.0.0.4/31, 10.0.0.6/32]
+    
+    Args:
+        start_int: 시작 IP (정수)
+        end_int: 끝 IP (정수, 포함)
+        max_bits: 주소 비트 수 (IPv4: 32)
+        
+    Returns:
+        [(network_int, prefix_len), ...] (주소 순서)
+    """
+    cidrs = []
+    while start_int <= end_int:
+        # 시작 주소의 정렬 상태로 가능한 가장 큰 블록
+        host_bits = (start_int & -start_int).bit_length() - 1 if start_int else max_bits
+        # 남은 범위를 넘지 않도록 블록 축소
+        remaining_bits = (end_int - start_int + 1).bit_length() - 1
+        host_bits = min(host_bits, remaining_bits)
+        cidrs.append((start_int, max_bits - host_bits))
+        start_int += 1 << host_bits
+    return cidrs
+
+
+def parse_ipv4_int(ip_str: str) -> Optional[int]:
+    """
+    점 표기 IPv4 문자열을 정수로 변환 (ipaddress.IPv4Address와 같은 검증 규칙, 객체 생성 없음)
+    
+    Args:
+        ip_str: '192.168.1.1' 형식 문자열 (앞뒤 공백 불가)
+        
+    Returns:
+        정수형 IP 또는 None (형식 오류)
+    """
+    parts = ip_str.split('.')
+    if len(parts) != 4:
+        return None
+    octets = _OCTETS
+    a = octets.get(parts[0])
+    b = octets.get(parts[1])
+    c = octets.get(parts[2])
+    d = octets.get(parts[3])
+    if a is None or b is None or c is None or d is None:
+        return None
+    return (a << 24) | (b << 16) | (c << 8) | d
+
+
+def parse_ipv6_int(ip_str: str) -> Optional[Tuple[int, int, int]]:
+    """
+    IPv6 입력 문자열을 128비트 정수 구간으로 변환 (Single/CIDR/Range)
+    
+    Args:
+        ip_str: 공백이 제거된 IPv6 문자열 (예: '2001:db8::1', '2001:db8::/32', '2001:db8::1-2001:db8::ff')
+        
+    Returns:
+        (start_int, end_int, kind) 튜플 (kind에 KIND_V6 포함) 또는 None
+    """
+    try:
+        # CIDR 포맷 (strict=False와 동일하게 호스트 비트는 무시)
+        if '/' in ip_str:
+            network = ipaddress.IPv6Network(ip_str, strict=False)
+            return (int(network.network_address), int(network.broadcast_address), KIND_CIDR | KIND_V6)
+        
+        # Range 포맷
+        if '-' in ip_str:
+            parts = ip_str.split('-')
+            if len(parts) != 2:
+                return None
+            start_int = int(ipaddress.IPv6Address(parts[0].strip()))
+            end_int = int(ipaddress.IPv6Address(parts[1].strip()))
+            if start_int > end_int:
+                return None
+            return (start_int, end_int, KIND_RANGE | KIND_V6)
+        
+        # Single IP
+        ip_int = int(ipaddress.IPv6Address(ip_str))
+        return (ip_int, ip_int, KIND_SINGLE | KIND_V6)
+    except ValueError:
+        return None
+
+
+def parse_ip_int(ip_str: str) -> Optional[Tuple[int, int, int]]:
+    """
+    IP 입력 문자열을 ipaddress 객체 없이 정수 구간으로 변환
+    Single IP, CIDR, Range를 자동 감지하며 검증 규칙은 parse_ip_input과 같다.
+    
+    Args:
+        ip_str: IP 문자열 (Single/CIDR/Range, IPv4/IPv6)
+        
+    Returns:
+        (start_int, end_int, kind) 튜플 (kind: KIND_SINGLE/KIND_CIDR/KIND_RANGE, IPv6는 KIND_V6 포함) 또는 None
+    """
+    ip_str = ip_str.strip()
+    if not ip_str:
+        return None
+    
+    # IPv6 (':'가 있을 때만 확인하므로 IPv4 경로에는 영향 없음)
+    if ':' in ip_str:
+        return parse_ipv6_int(ip_str)
+    
+    # CIDR 포맷 (strict=False와 동일하게 호스트 비트는 무시)
+    if '/' in ip_str:
+        address, _, prefix = ip_str.partition('/')
+        network_int = parse_ipv4_int(address)
+        if network_int is None or '/' in prefix:
+            return None
+        if prefix.isascii() and prefix.isdigit():
+            prefix_len = int(prefix)
+            if prefix_len > 32:
+                return None
+        else:
+            # 넷마스크/호스트마스크 표기 (드묾)는 ipaddress로 처리
+            try:
+                prefix_len = ipaddress.IPv4Network(ip_str, strict=False).prefixlen
+            except ValueError:
+                return None
+        host_mask = (1 << (32 - prefix_len)) - 1
+        network_int &= ~host_mask & 0xFFFFFFFF
+        return (network_int, network_int | host_mask, KIND_CIDR)
+    
+    # Range 포맷
+    if '-' in ip_str:
+        parts = ip_str.split('-')
+        if len(parts) != 2:
+            return None
+        start_int = parse_ipv4_int(parts[0].strip())
+        end_int = parse_ipv4_int(parts[1].strip())
+        if start_int is None or end_int is None or start_int > end_int:
+            return None
+        return (start_int, end_int, KIND_RANGE)
+    
+    # Single IP
+    ip_int = parse_ipv4_int(ip_str)
+    if ip_int is None:
+        return None
+    return (ip_int, ip_int, KIND_SINGLE)